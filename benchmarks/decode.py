@@ -0,0 +1,137 @@
+"""
+Objects per second, which are created from a page of a list response, with
+dacite, with the generated decoders of pyblisher and as lazy objects, of
+which only the id or key is read, and the peak memory of a page of decoded and of
+lazy objects.
+
+    PYTHONPATH=src python benchmarks/decode.py --items 1000 --rounds 20
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+
+
+def task(i: int) -> dict:
+    return {
+        '_id': f'{i:024x}',
+        'name': f'task {i}',
+        'createdAt': '2024-05-01T10:00:00.000Z',
+        'updatedAt': '2024-05-02T10:00:00.000Z',
+        'createdBy': 'user',
+        'updatedBy': 'user',
+        'labels': ['benchmark'],
+        'properties': {},
+        'tags': {'run': i},
+        'debugLevel': 0,
+        'jobType': 'pointcloud',
+        'jobVersion': '1.0',
+        'projectId': 'project',
+        'priority': 0,
+        'parameters': {'dataset': f'dataset {i}'},
+        'schedule': {'type': 'cron', 'cron': '0 3 * * *'},
+        'lastJobId': None,
+    }
+
+
+def source(i: int) -> dict:
+    return {
+        '_id': f'{i:024x}',
+        'name': f'source {i}',
+        'properties': {},
+        'typeProperties': {},
+        'sourceProperties': {
+            'type': 'internal',
+            'dataBucketId': 'bucket',
+            'dataBucketKey': f'/tiles/{i}/',
+        },
+        'type': 'tileset',
+        'dataUpdatedAt': '2024-05-01T10:00:00.000Z',
+        'dataUpdatedBy': None,
+        'projectId': 'project',
+        'uri': f'https://example.com/tiles/{i}/tileset.json',
+        'jobIds': [],
+        'publishTaskIds': [],
+        'bbox': [12.0, 54.0, 12.2, 54.2],
+    }
+
+
+def bucket_object(i: int) -> dict:
+    return {'key': f'/tiles/{i}.b3dm', 'type': 'file'}
+
+
+def measure(parse, content: bytes, rounds: int) -> float:
+    start = time.perf_counter()
+    count = 0
+    for _ in range(rounds):
+        count += len(parse(content))
+    return count / (time.perf_counter() - start)
+
+
+def peak(parse, content: bytes) -> float:
+    tracemalloc.start()
+    objects = parse(content)
+    size = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del objects
+    return size / 1024 / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--items', type=int, default=1000, help='items per page')
+    parser.add_argument('--rounds', type=int, default=20)
+    args = parser.parse_args()
+
+    from dacite import from_dict
+
+    from pyblisher import Source, Task, settings
+    from pyblisher.decode import ORJSON, decode, decode_lazy, loads
+    from pyblisher.types import BucketObject
+
+    print(f'orjson: {"yes" if ORJSON else "no"}')
+    print(
+        f'{"resource":>14} {"dacite/s":>10} {"decoder/s":>10} {"lazy/s":>10} '
+        f'{"decoder MB":>11} {"lazy MB":>8}'
+    )
+    for data_class, item, field in (
+        (Task, task, '_id'),
+        (Source, source, '_id'),
+        (BucketObject, bucket_object, 'key'),
+    ):
+        content = json.dumps(
+            {'items': [item(i) for i in range(args.items)]}
+        ).encode()
+
+        def dacite(content: bytes, data_class: type = data_class) -> list:
+            return [
+                from_dict(data_class, data, config=settings.dacite_config)
+                for data in json.loads(content)['items']
+            ]
+
+        def decoder(content: bytes, data_class: type = data_class) -> list:
+            return [decode(data_class, data) for data in loads(content)['items']]
+
+        def lazy(
+            content: bytes, data_class: type = data_class, field: str = field
+        ) -> list:
+            objects = [
+                decode_lazy(data_class, data) for data in loads(content)['items']
+            ]
+            for instance in objects:
+                getattr(instance, field)
+            return objects
+
+        assert dacite(content) == decoder(content)
+        print(
+            f'{data_class.__name__:>14} '
+            f'{measure(dacite, content, args.rounds):>10.0f} '
+            f'{measure(decoder, content, args.rounds):>10.0f} '
+            f'{measure(lazy, content, args.rounds):>10.0f} '
+            f'{peak(decoder, content):>11.1f} {peak(lazy, content):>8.1f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
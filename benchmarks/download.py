@@ -0,0 +1,44 @@
+"""
+Download throughput of Bucket.download_file with one stream and with
+concurrent byte ranges. The stand-in server limits the bandwidth of each
+connection, like a remote server does.
+
+    PYTHONPATH=src python benchmarks/download.py --size 256 --bandwidth 50
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from server import serve
+from upload import MB, bucket
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=128, help='file size in MB')
+    parser.add_argument(
+        '--bandwidth', type=int, default=50,
+        help='bandwidth per connection in MB/s, 0 for no limit',
+    )
+    parser.add_argument(
+        '--workers', type=int, nargs='+', default=[1, 2, 4, 8],
+        help='numbers of concurrent range requests',
+    )
+    args = parser.parse_args()
+    blob = os.urandom(args.size * MB)
+    with tempfile.TemporaryDirectory() as directory:
+        target = os.path.join(directory, 'download')
+        with serve(blob=blob, bandwidth=args.bandwidth * MB):
+            source = bucket()
+            print(f'{"workers":>10} {"MB/s":>10}')
+            for workers in args.workers:
+                start = time.perf_counter()
+                source.download_file('key', target, resume=False, workers=workers)
+                rate = args.size / (time.perf_counter() - start)
+                print(f'{workers:>10} {rate:>10.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""
+Throughput of concurrent requests at different connection pool sizes.
+
+    PYTHONPATH=src python benchmarks/pool_size.py --requests 2000 --latency 0.01
+"""
+
+import argparse
+import asyncio
+import time
+
+from server import serve
+
+
+async def run(host: str, size: int, requests: int, concurrency: int) -> float:
+    from httpx import AsyncClient
+
+    from pyblisher.connection import ConnectionSettings
+
+    connection = ConnectionSettings(
+        max_connections=size, max_keepalive_connections=size
+    )
+    semaphore = asyncio.Semaphore(concurrency)
+    async with AsyncClient(
+        base_url=f'{host}/api/v1/', **connection.client_kwargs()
+    ) as client:
+
+        async def get(i: int):
+            async with semaphore:
+                response = await client.get(f'project/project/task/{i}/')
+                response.raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(get(i) for i in range(requests)))
+        return requests / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=1000)
+    parser.add_argument('--concurrency', type=int, default=100)
+    parser.add_argument('--latency', type=float, default=0.01)
+    parser.add_argument(
+        '--sizes', type=int, nargs='+', default=[1, 5, 10, 20, 50, 100]
+    )
+    args = parser.parse_args()
+    with serve(latency=args.latency) as host:
+        print(f'{"pool size":>10} {"requests/s":>12}')
+        for size in args.sizes:
+            rate = asyncio.run(run(host, size, args.requests, args.concurrency))
+            print(f'{size:>10} {rate:>12.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,151 @@
+"""
+Local stand-in for the VC Publisher API, used by the benchmarks.
+
+It answers the login, a few JSON endpoints with a configurable latency,
+consumes uploads and serves file downloads with byte ranges. It is not a
+complete mock of the API.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+NOW = '2024-01-01T00:00:00Z'
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    latency: float = 0.0
+    # content of downloaded files
+    blob: bytes = b''
+    # bytes per second sent over one connection, 0 for no limit
+    bandwidth: int = 0
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, status: int, content: dict | None = None):
+        body = json.dumps(content).encode() if content is not None else b''
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def read_body(self) -> int:
+        """
+        Consume the request body and return its size.
+        """
+        size = 0
+        if self.headers.get('Transfer-Encoding') == 'chunked':
+            while True:
+                length = int(self.rfile.readline().strip(), 16)
+                size += length
+                self.rfile.read(length + 2)
+                if length == 0:
+                    return size
+        remaining = int(self.headers.get('Content-Length') or 0)
+        while remaining:
+            chunk = self.rfile.read(min(remaining, 1024 * 1024))
+            remaining -= len(chunk)
+            size += len(chunk)
+        return size
+
+    def send_blob(self):
+        """
+        Send the blob or the requested byte range, limited to the bandwidth.
+        """
+        start, end = 0, len(self.blob) - 1
+        status = 200
+        requested = self.headers.get('Range', '')
+        if requested.startswith('bytes='):
+            first, _, last = requested[6:].partition('-')
+            start, end = int(first), min(int(last or end), end)
+            status = 206
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/octet-stream')
+        self.send_header('Content-Length', str(end - start + 1))
+        if status == 206:
+            self.send_header('Content-Range', f'bytes {start}-{end}/{len(self.blob)}')
+        self.end_headers()
+        view = memoryview(self.blob)[start : end + 1]
+        block = 256 * 1024
+        for offset in range(0, len(view), block):
+            sent = time.perf_counter()
+            self.wfile.write(view[offset : offset + block])
+            if self.bandwidth:
+                time.sleep(max(0.0, block / self.bandwidth - time.perf_counter() + sent))
+
+    def handle_request(self):
+        url = urlparse(self.path)
+        path = url.path.rstrip('/')
+        self.query = parse_qs(url.query)
+        self.read_body()
+        if path.endswith('/login'):
+            return self.send_json(
+                200, {'_id': 'user', 'token': 'token', 'tokenExpires': None}
+            )
+        if self.latency:
+            time.sleep(self.latency)
+        if path.endswith('/upload'):
+            return self.send_json(204)
+        if path.endswith('/download-file'):
+            return self.send_blob()
+        parts = path.split('/')
+        return self.send_json(
+            200,
+            {
+                '_id': parts[-1],
+                'name': 'benchmark',
+                'createdAt': NOW,
+                'updatedAt': NOW,
+                'createdBy': 'user',
+                'updatedBy': 'user',
+                'projectId': 'project',
+            },
+        )
+
+    do_GET = do_POST = do_PUT = do_DELETE = handle_request
+
+
+@contextmanager
+def serve(handler: type[Handler] = Handler, latency: float = 0.0, **attributes):
+    """
+    Run the stand-in server in a background thread and prepare a
+    pyblisher.json for it in a temporary working directory. Further keyword
+    arguments set attributes of the handler, e.g. `blob`.
+
+    :return: host url of the server
+    """
+    handler = type(
+        'BenchmarkHandler', (handler,), {'latency': latency, **attributes}
+    )
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    server.daemon_threads = True
+    server.request_queue_size = 1024
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host = f'http://127.0.0.1:{server.server_port}'
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        with open(os.path.join(directory, 'pyblisher.json'), 'w') as file:
+            json.dump(
+                {
+                    'host': host,
+                    'api_version': 'v1',
+                    'user': 'user',
+                    'password': 'password',
+                },
+                file,
+            )
+        os.chdir(directory)
+        try:
+            yield host
+        finally:
+            os.chdir(cwd)
+            server.shutdown()
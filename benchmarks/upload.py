@@ -0,0 +1,64 @@
+"""
+Upload throughput of Bucket.upload at different block sizes, compared with
+the multipart encoding of httpx (`files=`), which reads 64 KiB blocks.
+
+    PYTHONPATH=src python benchmarks/upload.py --size 512
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from server import serve
+
+MB = 1024 * 1024
+
+
+def bucket():
+    from pyblisher import Bucket
+
+    return Bucket(
+        _id='bucket',
+        createdAt=None,
+        updatedAt=None,
+        createdBy='user',
+        updatedBy='user',
+        name='benchmark',
+        projectId='project',
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=256, help='file size in MB')
+    parser.add_argument(
+        '--chunks', type=int, nargs='+', default=[64, 1024, 4096, 16384],
+        help='block sizes in KB',
+    )
+    args = parser.parse_args()
+    with tempfile.NamedTemporaryFile() as file:
+        for _ in range(args.size):
+            file.write(os.urandom(MB))
+        file.flush()
+        with serve():
+            target = bucket()
+            print(f'{"method":>20} {"MB/s":>10}')
+
+            start = time.perf_counter()
+            with open(file.name, 'rb') as data:
+                target._api.post(
+                    endpoint=target._endpoint + 'upload/', files={'key': data}
+                )
+            rate = args.size / (time.perf_counter() - start)
+            print(f'{"httpx files=":>20} {rate:>10.1f}')
+
+            for chunk in args.chunks:
+                start = time.perf_counter()
+                target.upload('key', file.name, chunk_size=chunk * 1024)
+                rate = args.size / (time.perf_counter() - start)
+                print(f'{f"upload {chunk} KB":>20} {rate:>10.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,11 +1,52 @@
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import AsyncIterator, BinaryIO, Iterable, Iterator, Literal, Optional
 
-from .client import client
-from .types import ApiClientProtocol
+from httpx import RemoteProtocolError, Response, TransportError
 
-from httpx import Response
+from .client import aclient, client
+from .decode import decode
+from .download import (
+    DOWNLOAD_CHUNK_SIZE,
+    SEGMENT_SIZE,
+    DownloadReport,
+    SegmentedTarget,
+    astream_to_target,
+    content_range,
+    plan_segments,
+    response_validator,
+    stream_to_target,
+)
+from .helpers import validate_response
+from .pagination import PAGE_SIZE, AsyncPaginator, Paginator
+from .retry import RetryPolicy
+from .tracing import annotate, propagated, traced
+from .sync import (
+    DELETE_WORKERS,
+    DeleteReport,
+    Manifest,
+    SyncReport,
+    default_manifest,
+    plan_uploads,
+)
+from .types import ApiClientProtocol, AsyncApiClientProtocol, BucketObject
+from .upload import (
+    BATCH_BYTES,
+    BATCH_FILES,
+    UPLOAD_CHUNK_SIZE,
+    UPLOAD_WORKERS,
+    AsyncMultipartBody,
+    Progress,
+    SyncMultipartBody,
+    UploadReport,
+    batch_size,
+    plan_batches,
+    walk_tree,
+)
 
 
 @dataclass
@@ -27,6 +68,9 @@ class Bucket:
 
     # Internal attributes
     _api: ApiClientProtocol = field(default=client, init=False, repr=False)
+    _aapi: AsyncApiClientProtocol = field(
+        default=aclient, init=False, repr=False
+    )
     _endpoint: str = field(init=False, repr=False)
 
     # Required attributes
@@ -42,79 +86,1030 @@ class Bucket:
     description: Optional[str] = None
     properties: Optional[dict] = None
 
-    def upload(self, key: str, path: str) -> Response:
+    @traced('Bucket.upload', {'pyblisher.object.key': 'key'})
+    def upload(
+        self,
+        key: str,
+        path: str,
+        overwrite: Optional[bool] = None,
+        chunk_size: int = UPLOAD_CHUNK_SIZE,
+        progress: Optional[Progress] = None,
+    ) -> Response:
         """
         Upload a file to this bucket.
 
+        The file is streamed in blocks of `chunk_size`, so it is never loaded
+        into memory as a whole. Failed transfers are repeated from the start
+        according to the retry policy of the client, because the API can not
+        continue partial uploads.
+
+        Example:
+            ```
+            with tqdm(unit='B', unit_scale=True, total=size) as bar:
+                bucket.upload(key='tiles.tar.gz', path=path, progress=bar.update)
+            ```
+
         :param key: key of the file
         :type key: str
         :param path: path of the file
         :type path: str
+        :param overwrite: overwrite an existing object
+        :type overwrite: Optional[bool]
+        :param chunk_size: size of the blocks read from the file
+        :type chunk_size: int
+        :param progress: function, which receives the number of sent bytes
+        :type progress: Optional[Progress]
+        :return: Response
+        :rtype: Response
+        """
+        annotate({'pyblisher.upload.size': os.path.getsize(path)})
+        return self._upload([(key, path)], overwrite, chunk_size, progress)
+
+    @traced('Bucket.aupload', {'pyblisher.object.key': 'key'})
+    async def aupload(
+        self,
+        key: str,
+        path: str,
+        overwrite: Optional[bool] = None,
+        chunk_size: int = UPLOAD_CHUNK_SIZE,
+        progress: Optional[Progress] = None,
+    ) -> Response:
+        """
+        Upload a file to this bucket asynchronously. The file is read in a
+        worker thread. See `upload` for the parameters.
+
         :return: Response
         :rtype: Response
         """
-        with open(path, 'rb') as file:
-            response = self._api.post(
-                endpoint=self._endpoint + 'upload/',
-                files={key: file},
+        annotate({'pyblisher.upload.size': os.path.getsize(path)})
+        return await self._aupload(
+            [(key, path)], overwrite, chunk_size, progress
+        )
+
+    @traced('Bucket.upload_tree', {'pyblisher.prefix': 'prefix'})
+    def upload_tree(
+        self,
+        directory: str,
+        prefix: str = '',
+        overwrite: Optional[bool] = None,
+        workers: int = UPLOAD_WORKERS,
+        batch_files: int = BATCH_FILES,
+        batch_bytes: int = BATCH_BYTES,
+        progress: Optional[Progress] = None,
+    ) -> UploadReport:
+        """
+        Upload all files of a local directory tree to this bucket.
+
+        The key of a file is its path relative to `directory` below
+        `prefix`. Small files are bundled into one request, large files are
+        sent alone, and up to `workers` requests run at the same time. A
+        failed request does not stop the upload, its files are listed in the
+        returned report.
+
+        Example:
+            ```
+            report = bucket.upload_tree('tileset/', prefix='city/tileset')
+            if not report.ok:
+                print(report.failed)
+            ```
+
+        :param directory: local directory
+        :type directory: str
+        :param prefix: key of the target folder in the bucket
+        :type prefix: str
+        :param overwrite: overwrite existing objects. Only then, failed
+            requests are repeated according to the retry policy of the client.
+        :type overwrite: Optional[bool]
+        :param workers: number of concurrent upload requests
+        :type workers: int
+        :param batch_files: maximum number of files per request
+        :type batch_files: int
+        :param batch_bytes: maximum size of the small files per request
+        :type batch_bytes: int
+        :param progress: function, which receives the number of sent bytes.
+            It is called from the worker threads.
+        :type progress: Optional[Progress]
+        :return: uploaded and failed keys
+        :rtype: UploadReport
+        """
+        return self.upload_files(
+            walk_tree(directory, prefix),
+            overwrite=overwrite,
+            workers=workers,
+            batch_files=batch_files,
+            batch_bytes=batch_bytes,
+            progress=progress,
+        )
+
+    @traced('Bucket.aupload_tree', {'pyblisher.prefix': 'prefix'})
+    async def aupload_tree(
+        self,
+        directory: str,
+        prefix: str = '',
+        overwrite: Optional[bool] = None,
+        workers: int = UPLOAD_WORKERS,
+        batch_files: int = BATCH_FILES,
+        batch_bytes: int = BATCH_BYTES,
+        progress: Optional[Progress] = None,
+    ) -> UploadReport:
+        """
+        Upload all files of a local directory tree to this bucket
+        asynchronously. See `upload_tree` for the parameters.
+
+        :return: uploaded and failed keys
+        :rtype: UploadReport
+        """
+        files = await asyncio.to_thread(walk_tree, directory, prefix)
+        return await self.aupload_files(
+            files,
+            overwrite=overwrite,
+            workers=workers,
+            batch_files=batch_files,
+            batch_bytes=batch_bytes,
+            progress=progress,
+        )
+
+    @traced('Bucket.upload_files')
+    def upload_files(
+        self,
+        files: list[tuple[str, str]],
+        overwrite: Optional[bool] = None,
+        workers: int = UPLOAD_WORKERS,
+        batch_files: int = BATCH_FILES,
+        batch_bytes: int = BATCH_BYTES,
+        progress: Optional[Progress] = None,
+    ) -> UploadReport:
+        """
+        Upload many files to this bucket. See `upload_tree` for the
+        parameters.
+
+        :param files: pairs of object key and local file path
+        :type files: list[tuple[str, str]]
+        :return: uploaded and failed keys
+        :rtype: UploadReport
+        """
+        report = UploadReport()
+
+        def send(batch: list[tuple[str, str]]) -> None:
+            try:
+                size = batch_size(batch)
+                response = self._upload(
+                    batch, overwrite, UPLOAD_CHUNK_SIZE, progress
+                )
+                validate_response(response, (200, 201, 204), 'upload files')
+            except Exception as error:
+                report.add(batch, str(error))
+            else:
+                report.add(batch, None, size)
+
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            list(
+                executor.map(
+                    propagated(send), plan_batches(files, batch_files, batch_bytes)
+                )
             )
-        return response
+        annotate({'pyblisher.upload.files': len(files), 'pyblisher.upload.size': report.size})
+        return report
+
+    @traced('Bucket.aupload_files')
+    async def aupload_files(
+        self,
+        files: list[tuple[str, str]],
+        overwrite: Optional[bool] = None,
+        workers: int = UPLOAD_WORKERS,
+        batch_files: int = BATCH_FILES,
+        batch_bytes: int = BATCH_BYTES,
+        progress: Optional[Progress] = None,
+    ) -> UploadReport:
+        """
+        Upload many files to this bucket asynchronously. See `upload_tree`
+        for the parameters.
+
+        :param files: pairs of object key and local file path
+        :type files: list[tuple[str, str]]
+        :return: uploaded and failed keys
+        :rtype: UploadReport
+        """
+        report = UploadReport()
+        semaphore = asyncio.Semaphore(max(1, workers))
+
+        async def send(batch: list[tuple[str, str]]) -> None:
+            async with semaphore:
+                try:
+                    size = await asyncio.to_thread(batch_size, batch)
+                    response = await self._aupload(
+                        batch, overwrite, UPLOAD_CHUNK_SIZE, progress
+                    )
+                    validate_response(
+                        response, (200, 201, 204), 'upload files'
+                    )
+                except Exception as error:
+                    report.add(batch, str(error))
+                else:
+                    report.add(batch, None, size)
+
+        batches = await asyncio.to_thread(
+            plan_batches, files, batch_files, batch_bytes
+        )
+        await asyncio.gather(*(send(batch) for batch in batches))
+        annotate({'pyblisher.upload.files': len(files), 'pyblisher.upload.size': report.size})
+        return report
+
+    def _upload(
+        self,
+        files: list[tuple[str, str]],
+        overwrite: Optional[bool],
+        chunk_size: int,
+        progress: Optional[Progress],
+    ) -> Response:
+        """
+        Upload files with a single request.
+        """
+        body = SyncMultipartBody(files, chunk_size, progress)
+        return self._api.request(
+            'POST',
+            self._endpoint + 'upload/',
+            retry=self._upload_retry(self._api.retry, overwrite),
+            content=body,
+            headers=body.headers,
+            params=self._upload_params(overwrite),
+        )
+
+    async def _aupload(
+        self,
+        files: list[tuple[str, str]],
+        overwrite: Optional[bool],
+        chunk_size: int,
+        progress: Optional[Progress],
+    ) -> Response:
+        """
+        Upload files with a single request asynchronously.
+        """
+        body = AsyncMultipartBody(files, chunk_size, progress)
+        return await self._aapi.request(
+            'POST',
+            self._endpoint + 'upload/',
+            retry=self._upload_retry(self._aapi.retry, overwrite),
+            content=body,
+            headers=body.headers,
+            params=self._upload_params(overwrite),
+        )
 
-    def download(self, key: str):
+    @staticmethod
+    def _upload_retry(retry: RetryPolicy, overwrite: Optional[bool]) -> RetryPolicy:
         """
-        Downloads a bucket object or folder as `.tar.gz`.
+        Retry policy of upload requests. An upload is only repeated, if it
+        overwrites the objects, because a repeated upload without overwrite
+        fails for the objects, which the first attempt stored.
+        """
+        return retry.including('POST') if overwrite else retry
+
+    @staticmethod
+    def _upload_params(overwrite: Optional[bool]) -> Optional[dict]:
+        """
+        Query parameters of upload requests.
+        """
+        if overwrite is None:
+            return None
+        return {'overwrite': str(overwrite).lower()}
+
+    @traced('Bucket.sync_tree', {'pyblisher.prefix': 'prefix'})
+    def sync_tree(
+        self,
+        directory: str,
+        prefix: str = '',
+        manifest: Optional[str] = None,
+        delete: bool = False,
+        check_remote: bool = True,
+        workers: int = UPLOAD_WORKERS,
+        progress: Optional[Progress] = None,
+    ) -> SyncReport:
+        """
+        Synchronise a local directory tree with a folder of this bucket, like
+        rsync: only new and changed files are uploaded.
+
+        Changes are detected with a manifest file, which records size,
+        modification time and content hash of every uploaded file. Files,
+        which are missing in the bucket, are uploaded as well, and with
+        `delete` objects without a local file are removed from the bucket.
 
-        This method does not return the file content directly. Instead, it
-        returns a generator, which yields the response content in chunks. You
-        can iterate over the generator like over httpx streamed responses.
         Example:
             ```
-            response = bucket.download()
-            with open('download.tar.gz', 'wb') as file:
-                for chunk in response.iter_bytes():
-                    file.write(chunk)
+            report = bucket.sync_tree('tileset/', prefix='city/tileset')
+            print(len(report.uploaded), report.unchanged)
             ```
-        :return:
+
+        :param directory: local directory
+        :type directory: str
+        :param prefix: key of the target folder in the bucket
+        :type prefix: str
+        :param manifest: path of the manifest file, by default next to the
+            directory as `<directory>.<hash>.pyblisher-manifest.json`, where
+            the hash depends on the bucket and the prefix
+        :type manifest: Optional[str]
+        :param delete: delete objects in the bucket, which have no local file
+        :type delete: bool
+        :param check_remote: list the bucket to find missing objects. Without
+            it, the bucket is assumed to match the manifest.
+        :type check_remote: bool
+        :param workers: number of concurrent upload requests
+        :type workers: int
+        :param progress: function, which receives the number of sent bytes
+        :type progress: Optional[Progress]
+        :return: uploaded, deleted and failed keys
+        :rtype: SyncReport
         """
-        return self._api.stream(
-            endpoint=self._endpoint + 'download/',
-            params={'key': f'/{key}'},
+        records = Manifest(
+            manifest or default_manifest(directory, self._endpoint, prefix)
+        )
+        files = walk_tree(directory, prefix)
+        remote = None
+        if check_remote or delete:
+            remote = {item.path for item in self.walk(prefix)}
+        changed = plan_uploads(files, records, remote)
+
+        report = SyncReport(unchanged=len(files) - len(changed))
+        uploads = self.upload_files(
+            changed, overwrite=True, workers=workers, progress=progress
+        )
+        paths = dict(changed)
+        for key in uploads.uploaded:
+            records.record(key, paths[key])
+        report.uploaded = uploads.uploaded
+        report.failed.update(uploads.failed)
+
+        if delete and remote is not None:
+            local = {key for key, _ in files}
+            deletes = self.delete_objects(sorted(remote - local), workers=workers)
+            for key in deletes.deleted:
+                records.forget(key)
+            report.deleted = deletes.deleted
+            report.failed.update(deletes.failed)
+        records.save()
+        return report
+
+    ############## Objects ##############
+    def iter_objects(
+        self,
+        prefix: str = '',
+        ending: Optional[str] = None,
+        orderBy: Optional[Literal['alpha', 'type']] = None,
+        sort: Optional[Literal['asc', 'desc']] = None,
+        limit: int = PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> Paginator[BucketObject]:
+        """
+        Iterate lazily over the files and folders directly inside a folder of
+        this bucket. The list is requested page by page, while iterating.
+
+        Example:
+            ```
+            for item in bucket.iter_objects('city/tileset', ending='.json'):
+                print(item.path)
+            ```
+
+        :param prefix: key of the folder, default is the root
+        :type prefix: str
+        :param ending: only files with this extension, e.g. `.json` (case
+            insensitive)
+        :type ending: Optional[str]
+        :param orderBy: order by name (`alpha`) or folders first (`type`)
+        :type orderBy: Optional[Literal['alpha', 'type']]
+        :param sort: sort direction
+        :type sort: Optional[Literal['asc', 'desc']]
+        :param limit: page size (1 - 1000)
+        :type limit: int
+        :param prefetch: request the following page in the background
+        :type prefetch: bool
+        :return: iterator over objects
+        :rtype: Paginator[BucketObject]
+        """
+        return Paginator(
+            api=self._api,
+            endpoint=self._endpoint + 'objects/',
+            parse=self._object,
+            params=self._object_params(prefix, ending, orderBy, sort),
+            limit=limit,
+            prefetch=prefetch,
+            action='get objects',
+        )
+
+    def aiter_objects(
+        self,
+        prefix: str = '',
+        ending: Optional[str] = None,
+        orderBy: Optional[Literal['alpha', 'type']] = None,
+        sort: Optional[Literal['asc', 'desc']] = None,
+        limit: int = PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> AsyncPaginator[BucketObject]:
+        """
+        Iterate lazily and asynchronously over the files and folders directly
+        inside a folder of this bucket. See `iter_objects` for the
+        parameters.
+        """
+        return AsyncPaginator(
+            api=self._aapi,
+            endpoint=self._endpoint + 'objects/',
+            parse=self._object,
+            params=self._object_params(prefix, ending, orderBy, sort),
+            limit=limit,
+            prefetch=prefetch,
+            action='get objects',
+        )
+
+    def walk(
+        self,
+        prefix: str = '',
+        ending: Optional[str] = None,
+        dirs: bool = False,
+        limit: int = PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> Iterator[BucketObject]:
+        """
+        Iterate lazily over all files below a folder of this bucket,
+        descending into sub folders. Only the pages of the folders on the
+        current path are held in memory, so buckets with millions of keys
+        can be walked.
+
+        Example:
+            ```
+            size = sum(1 for _ in bucket.walk('city', ending='.b3dm'))
+            ```
+
+        :param prefix: key of the folder, default is the root
+        :type prefix: str
+        :param ending: only files with this extension, e.g. `.b3dm` (case
+            insensitive)
+        :type ending: Optional[str]
+        :param dirs: yield the sub folders as well
+        :type dirs: bool
+        :param limit: page size (1 - 1000)
+        :type limit: int
+        :param prefetch: request the following page in the background
+        :type prefetch: bool
+        :return: iterator over files
+        :rtype: Iterator[BucketObject]
+        """
+        folders = [prefix]
+        while folders:
+            for item in self.iter_objects(
+                folders.pop(), limit=limit, prefetch=prefetch
+            ):
+                if item.is_dir:
+                    folders.append(item.key)
+                if self._walk_match(item, ending, dirs):
+                    yield item
+
+    async def awalk(
+        self,
+        prefix: str = '',
+        ending: Optional[str] = None,
+        dirs: bool = False,
+        limit: int = PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> AsyncIterator[BucketObject]:
+        """
+        Iterate lazily and asynchronously over all files below a folder of
+        this bucket. See `walk` for the parameters.
+        """
+        folders = [prefix]
+        while folders:
+            async for item in self.aiter_objects(
+                folders.pop(), limit=limit, prefetch=prefetch
+            ):
+                if item.is_dir:
+                    folders.append(item.key)
+                if self._walk_match(item, ending, dirs):
+                    yield item
+
+    @staticmethod
+    def _object_params(
+        prefix: str,
+        ending: Optional[str],
+        orderBy: Optional[str],
+        sort: Optional[str],
+    ) -> dict:
+        """
+        Prepare the query parameters of the object list.
+        """
+        params = {
+            'prefix': Bucket._folder(prefix),
+            'ending': ending,
+            'orderBy': orderBy,
+            'sort': sort,
+        }
+        return {key: value for key, value in params.items() if value}
+
+    @staticmethod
+    def _walk_match(item: BucketObject, ending: Optional[str], dirs: bool) -> bool:
+        """
+        Check if an object is yielded by a walk. The ending is checked
+        locally, because the server would not list the sub folders.
+        """
+        if item.is_dir:
+            return dirs
+        return ending is None or item.path.lower().endswith(ending.lower())
+
+    @staticmethod
+    def _folder(prefix: str) -> str:
+        """
+        Format the key of a folder for the object list.
+        """
+        prefix = prefix.strip('/')
+        return f'/{prefix}/' if prefix else '/'
+
+    @staticmethod
+    def _object(data: dict) -> BucketObject:
+        """
+        Create a BucketObject from a list item.
+        """
+        return decode(BucketObject, data)
+
+    ############## Downloads ##############
+    @traced('Bucket.download', {'pyblisher.object.key': 'key'})
+    def download(
+        self,
+        key: str,
+        target: str | os.PathLike | BinaryIO,
+        resume: bool = True,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        progress: Optional[Progress] = None,
+    ) -> DownloadReport:
+        """
+        Download a bucket object or folder as `.tar.gz`.
+
+        The response is streamed to the target in large blocks, so the
+        archive is never held in memory. If the connection breaks, the
+        download continues where it stopped, and an interrupted download to a
+        path is continued by the next call.
+
+        Example:
+            ```
+            report = bucket.download('city/tileset', 'tileset.tar.gz')
+            print(f'{report.throughput / 1024 ** 2:.1f} MiB/s')
+            ```
+
+        :param key: key of the object or folder
+        :type key: str
+        :param target: local path or writable binary file object
+        :type target: str | os.PathLike | BinaryIO
+        :param resume: continue an interrupted download to the same path
+        :type resume: bool
+        :param chunk_size: size of the blocks written to the target
+        :type chunk_size: int
+        :param progress: function, which receives the number of written bytes
+        :type progress: Optional[Progress]
+        :return: size and throughput of the download
+        :rtype: DownloadReport
+        """
+        return self._download('download/', key, target, resume, chunk_size, progress)
+
+    @traced('Bucket.adownload', {'pyblisher.object.key': 'key'})
+    async def adownload(
+        self,
+        key: str,
+        target: str | os.PathLike | BinaryIO,
+        resume: bool = True,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        progress: Optional[Progress] = None,
+    ) -> DownloadReport:
+        """
+        Download a bucket object or folder as `.tar.gz` asynchronously. The
+        blocks are written in a worker thread, so the event loop is not
+        blocked by disk access. See `download`.
+
+        :return: size and throughput of the download
+        :rtype: DownloadReport
+        """
+        return await self._adownload(
+            'download/', key, target, resume, chunk_size, progress
         )
 
-    def download_file(self, key: str):
+    @traced('Bucket.download_file', {'pyblisher.object.key': 'key'})
+    def download_file(
+        self,
+        key: str,
+        target: str | os.PathLike | BinaryIO,
+        resume: bool = True,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        progress: Optional[Progress] = None,
+        workers: int = 1,
+        segment_size: int = SEGMENT_SIZE,
+    ) -> DownloadReport:
         """
-        Download a bucket object.
+        Download a bucket object. See `download` for the first parameters.
+
+        With more than one worker, a large object is downloaded to a path in
+        byte ranges over several connections at the same time, which are
+        written to their position in the file. If the server does not honor
+        range requests, a single stream is used.
 
-        This method does not return the file content directly. Instead, it
-        returns a generator, which yields the response content in chunks. You
-        can iterate over the generator like over httpx streamed responses.
         Example:
             ```
-            response = bucket.download_file()
-            with open('download', 'wb') as file:
-                for chunk in response.iter_bytes():
-                    file.write(chunk)
+            with open('model.glb', 'wb') as file:
+                bucket.download_file('city/model.glb', file)
+            bucket.download_file('city/tileset.zip', 'tileset.zip', workers=8)
             ```
+
+        :param workers: number of concurrent range requests
+        :type workers: int
+        :param segment_size: maximum size of a byte range
+        :type segment_size: int
+        :return: size and throughput of the download
+        :rtype: DownloadReport
+        """
+        if workers > 1 and isinstance(target, (str, os.PathLike)):
+            report = self._download_segments(
+                key, target, chunk_size, progress, workers, segment_size
+            )
+            if report is not None:
+                return report
+        return self._download(
+            'download-file/', key, target, resume, chunk_size, progress
+        )
+
+    @traced('Bucket.adownload_file', {'pyblisher.object.key': 'key'})
+    async def adownload_file(
+        self,
+        key: str,
+        target: str | os.PathLike | BinaryIO,
+        resume: bool = True,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        progress: Optional[Progress] = None,
+        workers: int = 1,
+        segment_size: int = SEGMENT_SIZE,
+    ) -> DownloadReport:
+        """
+        Download a bucket object asynchronously. See `download_file` and
+        `adownload`.
+
+        :return: size and throughput of the download
+        :rtype: DownloadReport
         """
-        return self._api.stream(
-            endpoint=self._endpoint + 'download-file/',
+        if workers > 1 and isinstance(target, (str, os.PathLike)):
+            report = await self._adownload_segments(
+                key, target, chunk_size, progress, workers, segment_size
+            )
+            if report is not None:
+                return report
+        return await self._adownload(
+            'download-file/', key, target, resume, chunk_size, progress
+        )
+
+    def _download(
+        self,
+        path: str,
+        key: str,
+        target: str | os.PathLike | BinaryIO,
+        resume: bool,
+        chunk_size: int,
+        progress: Optional[Progress],
+    ) -> DownloadReport:
+        """
+        Stream a download endpoint of the bucket to the target.
+        """
+        return stream_to_target(
+            self._api,
+            self._endpoint + path,
+            target,
+            resume,
+            chunk_size,
+            progress,
+            params={'key': f'/{key}'},
+        )
+
+    async def _adownload(
+        self,
+        path: str,
+        key: str,
+        target: str | os.PathLike | BinaryIO,
+        resume: bool,
+        chunk_size: int,
+        progress: Optional[Progress],
+    ) -> DownloadReport:
+        """
+        Stream a download endpoint of the bucket to the target
+        asynchronously.
+        """
+        return await astream_to_target(
+            self._aapi,
+            self._endpoint + path,
+            target,
+            resume,
+            chunk_size,
+            progress,
             params={'key': f'/{key}'},
         )
 
-    def delete_object(self, key: str):
+    def _download_segments(
+        self,
+        key: str,
+        path: str | os.PathLike,
+        chunk_size: int,
+        progress: Optional[Progress],
+        workers: int,
+        segment_size: int,
+    ) -> Optional[DownloadReport]:
+        """
+        Download an object in byte ranges with a pool of threads.
+
+        :return: report or None, if the server does not honor ranges
+        :rtype: Optional[DownloadReport]
+        """
+        started = time.perf_counter()
+        probe = self._probe(key)
+        if probe is None:
+            return None
+        size, validator = probe
+        output = SegmentedTarget(path, size, progress, validator)
+
+        def fetch(segment: tuple[int, int]) -> None:
+            start, end = segment
+            attempt = 1
+            while start <= end:
+                try:
+                    with self._api.stream(
+                        'GET',
+                        self._endpoint + 'download-file/',
+                        params={'key': f'/{key}'},
+                        headers=output.headers(start, end),
+                    ) as response:
+                        output.check(response, start)
+                        for chunk in response.iter_bytes(chunk_size):
+                            output.write(start, chunk)
+                            start += len(chunk)
+                        if start <= end:
+                            raise RemoteProtocolError(
+                                f'Incomplete range from {start} to {end}'
+                            )
+                except TransportError as error:
+                    if not self._api.retry.should_retry('GET', attempt, error=error):
+                        raise
+                    time.sleep(self._api.retry.delay(attempt))
+                    attempt += 1
+
+        complete = False
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(
+                    executor.map(
+                        propagated(fetch), plan_segments(size, workers, segment_size)
+                    )
+                )
+            complete = True
+        finally:
+            output.close(complete)
+        annotate({'pyblisher.download.size': output.received})
+        return output.report(time.perf_counter() - started)
+
+    async def _adownload_segments(
+        self,
+        key: str,
+        path: str | os.PathLike,
+        chunk_size: int,
+        progress: Optional[Progress],
+        workers: int,
+        segment_size: int,
+    ) -> Optional[DownloadReport]:
+        """
+        Download an object in byte ranges with concurrent tasks. The blocks
+        are written in worker threads. See `_download_segments`.
+
+        :return: report or None, if the server does not honor ranges
+        :rtype: Optional[DownloadReport]
+        """
+        started = time.perf_counter()
+        probe = await self._aprobe(key)
+        if probe is None:
+            return None
+        size, validator = probe
+        output = await asyncio.to_thread(
+            SegmentedTarget, path, size, progress, validator
+        )
+        semaphore = asyncio.Semaphore(workers)
+
+        async def fetch(segment: tuple[int, int]) -> None:
+            start, end = segment
+            attempt = 1
+            async with semaphore:
+                while start <= end:
+                    try:
+                        async with self._aapi.stream(
+                            'GET',
+                            self._endpoint + 'download-file/',
+                            params={'key': f'/{key}'},
+                            headers=output.headers(start, end),
+                        ) as response:
+                            output.check(response, start)
+                            async for chunk in response.aiter_bytes(chunk_size):
+                                await asyncio.to_thread(output.write, start, chunk)
+                                start += len(chunk)
+                            if start <= end:
+                                raise RemoteProtocolError(
+                                    f'Incomplete range from {start} to {end}'
+                                )
+                    except TransportError as error:
+                        if not self._aapi.retry.should_retry('GET', attempt, error=error):
+                            raise
+                        await asyncio.sleep(self._aapi.retry.delay(attempt))
+                        attempt += 1
+
+        complete = False
+        try:
+            await asyncio.gather(
+                *(fetch(segment) for segment in plan_segments(size, workers, segment_size))
+            )
+            complete = True
+        finally:
+            await asyncio.to_thread(output.close, complete)
+        annotate({'pyblisher.download.size': output.received})
+        return output.report(time.perf_counter() - started)
+
+    def _probe(self, key: str) -> Optional[tuple[int, Optional[str]]]:
+        """
+        Request the first byte of an object to learn its size and validator,
+        and whether the server honors range requests.
+
+        :return: size and validator of the object or None, if ranges are not
+            supported
+        :rtype: Optional[tuple[int, Optional[str]]]
+        """
+        with self._api.stream(
+            'GET',
+            self._endpoint + 'download-file/',
+            params={'key': f'/{key}'},
+            headers={'Range': 'bytes=0-0'},
+        ) as response:
+            if response.status_code not in (200, 206, 416):
+                response.read()
+                validate_response(response, (200, 206), 'download')
+            return self._probe_result(response)
+
+    async def _aprobe(self, key: str) -> Optional[tuple[int, Optional[str]]]:
+        """
+        Request the first byte of an object asynchronously. See `_probe`.
+        """
+        async with self._aapi.stream(
+            'GET',
+            self._endpoint + 'download-file/',
+            params={'key': f'/{key}'},
+            headers={'Range': 'bytes=0-0'},
+        ) as response:
+            if response.status_code not in (200, 206, 416):
+                await response.aread()
+                validate_response(response, (200, 206), 'download')
+            return self._probe_result(response)
+
+    @staticmethod
+    def _probe_result(response: Response) -> Optional[tuple[int, Optional[str]]]:
+        """
+        Get the object size and validator of the response to a probe, if the
+        server honored the range.
+        """
+        served = content_range(response)
+        if response.status_code != 206 or served is None or served[1] is None:
+            return None
+        return served[1], response_validator(response)
+
+    @traced('Bucket.delete_object', {'pyblisher.object.key': 'key'})
+    def delete_object(self, key: str, force: Optional[bool] = None) -> Response:
         """
         Delete a bucket object.
 
         :param key: key of the object
         :type key: str
+        :param force: delete the object, even if it is in use
+        :type force: Optional[bool]
         :return: Response
         :rtype: Response
         """
         return self._api.delete(
             endpoint=self._endpoint + 'object/',
-            params={'key': f'/{key}'},
+            params=self._object_key(key, force),
+        )
+
+    @traced('Bucket.adelete_object', {'pyblisher.object.key': 'key'})
+    async def adelete_object(self, key: str, force: Optional[bool] = None) -> Response:
+        """
+        Delete a bucket object asynchronously.
+
+        :param key: key of the object
+        :type key: str
+        :param force: delete the object, even if it is in use
+        :type force: Optional[bool]
+        :return: Response
+        :rtype: Response
+        """
+        return await self._aapi.delete(
+            endpoint=self._endpoint + 'object/',
+            params=self._object_key(key, force),
         )
 
+    @traced('Bucket.delete_objects', {'pyblisher.prefix': 'prefix'})
+    def delete_objects(
+        self,
+        keys: Optional[Iterable[str]] = None,
+        prefix: Optional[str] = None,
+        dry_run: bool = False,
+        force: Optional[bool] = None,
+        workers: int = DELETE_WORKERS,
+    ) -> DeleteReport:
+        """
+        Delete many bucket objects, given by their keys or by the folder
+        they are in, with concurrent requests. Failed deletions are collected
+        in the report instead of stopping the others.
+
+        Example:
+            ```
+            plan = bucket.delete_objects(prefix='city/2023', dry_run=True)
+            print(plan.planned)
+            report = bucket.delete_objects(plan.planned)
+            ```
+
+        :param keys: keys of the objects
+        :type keys: Optional[Iterable[str]]
+        :param prefix: key of a folder, all files below it are deleted
+        :type prefix: Optional[str]
+        :param dry_run: only list the objects, which would be deleted
+        :type dry_run: bool
+        :param force: delete objects, even if they are in use
+        :type force: Optional[bool]
+        :param workers: number of concurrent delete requests
+        :type workers: int
+        :return: planned, deleted and failed keys
+        :rtype: DeleteReport
+        """
+        planned = [key.strip('/') for key in keys or ()]
+        if prefix is not None:
+            planned += [item.path for item in self.walk(prefix)]
+        report = DeleteReport(planned=planned)
+        if dry_run:
+            return report
+
+        def send(key: str) -> None:
+            try:
+                response = self.delete_object(key, force)
+                validate_response(response, (200, 204), 'delete object')
+            except Exception as error:
+                report.failed[key] = str(error)
+            else:
+                report.deleted.append(key)
+
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            list(executor.map(propagated(send), planned))
+        annotate({'pyblisher.delete.objects': len(report.deleted)})
+        return report
+
+    @traced('Bucket.adelete_objects', {'pyblisher.prefix': 'prefix'})
+    async def adelete_objects(
+        self,
+        keys: Optional[Iterable[str]] = None,
+        prefix: Optional[str] = None,
+        dry_run: bool = False,
+        force: Optional[bool] = None,
+        workers: int = DELETE_WORKERS,
+    ) -> DeleteReport:
+        """
+        Delete many bucket objects asynchronously. See `delete_objects` for
+        the parameters.
+
+        :return: planned, deleted and failed keys
+        :rtype: DeleteReport
+        """
+        planned = [key.strip('/') for key in keys or ()]
+        if prefix is not None:
+            planned += [item.path async for item in self.awalk(prefix)]
+        report = DeleteReport(planned=planned)
+        if dry_run:
+            return report
+        semaphore = asyncio.Semaphore(max(1, workers))
+
+        async def send(key: str) -> None:
+            async with semaphore:
+                try:
+                    response = await self.adelete_object(key, force)
+                    validate_response(response, (200, 204), 'delete object')
+                except Exception as error:
+                    report.failed[key] = str(error)
+                else:
+                    report.deleted.append(key)
+
+        await asyncio.gather(*(send(key) for key in planned))
+        annotate({'pyblisher.delete.objects': len(report.deleted)})
+        return report
+
+    @staticmethod
+    def _object_key(key: str, force: Optional[bool] = None) -> dict:
+        """
+        Prepare the query parameters, which address a single object.
+        """
+        params: dict = {'key': f'/{key.lstrip("/")}'}
+        if force is not None:
+            params['force'] = str(force).lower()
+        return params
+
+    @traced('Bucket.delete')
     def delete(self):
         """
         Delete the bucket.
@@ -124,6 +1119,16 @@ class Bucket:
         """
         return self._api.delete(endpoint=self._endpoint)
 
+    @traced('Bucket.adelete')
+    async def adelete(self) -> Response:
+        """
+        Delete the bucket asynchronously.
+
+        :return: Response
+        :rtype: Response
+        """
+        return await self._aapi.delete(endpoint=self._endpoint)
+
     def reference(self, dataBucketKey: str = '/'):
         """
         Returns the Bucket as Reference Object for Datasource Creation or for Task-Dataset-Parameters.
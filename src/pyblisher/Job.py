@@ -0,0 +1,899 @@
+import asyncio
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, fields
+from datetime import datetime
+from typing import AsyncIterator, BinaryIO, Iterable, Iterator, Optional
+
+from httpx import Response
+
+from .client import aclient, client
+from .decode import decode, response_json
+from .download import (
+    DOWNLOAD_CHUNK_SIZE,
+    DownloadReport,
+    astream_to_target,
+    stream_to_target,
+)
+from .helpers import validate_response
+from .Operation import LOG_WORKERS, LogReport, Operation, OperationSet
+from .pagination import PAGE_SIZE, AsyncPaginator, Paginator
+from .polling import (
+    FINAL_STATUSES,
+    MAX_POLL_INTERVAL,
+    POLL_INTERVAL,
+    Backoff,
+    JobStatus,
+)
+from .tracing import annotate, propagated, traced
+from .types import ApiClientProtocol, AsyncApiClientProtocol
+from .upload import Progress
+
+
+@dataclass
+class Job:
+    """
+    This class implements the structure of Jobs of the VC Publisher API. A
+    job is one run of a task.
+
+    :attribute _id: job id
+    :atype _id: str
+    :attribute jobType: job type like `pointcloud`
+    :atype jobType: str
+    :attribute jobStages: stages of the job
+    :atype jobStages: list[str]
+    :attribute taskId: id of the task, which started the job
+    :atype taskId: str
+    :attribute projectId: project id
+    :atype projectId: str
+    :attribute status: job status, see `JobStatus`
+    :atype status: int
+    :attribute currentJobStage: stage, which is running
+    :atype currentJobStage: str
+    :attribute outputs: outputs of a finished job
+    :atype outputs: dict
+    :attribute errorMessage: error of a failed job
+    :atype errorMessage: str
+    :attribute startTime: start of the job
+    :atype startTime: datetime
+    :attribute endTime: end of the job
+    :atype endTime: datetime
+    """
+
+    # Internal attributes
+    _api: ApiClientProtocol = field(default=client, init=False, repr=False)
+    _aapi: AsyncApiClientProtocol = field(
+        default=aclient, init=False, repr=False
+    )
+    _endpoint: str = field(init=False, repr=False)
+
+    # Required attributes
+    _id: str
+    createdAt: datetime
+    updatedAt: datetime
+    createdBy: str
+    updatedBy: str
+    jobType: str
+    jobVersion: str
+    jobStages: list[str]
+    taskId: str
+    projectId: str
+    priority: int
+    parameters: dict
+
+    # Optional attributes
+    status: Optional[int] = None
+    labels: Optional[list[str]] = None
+    tags: Optional[dict] = None
+    debugLevel: Optional[int] = None
+    currentJobStage: Optional[str] = None
+    outputs: Optional[dict] = None
+    errorMessage: Optional[str] = None
+    startTime: Optional[datetime] = None
+    endTime: Optional[datetime] = None
+
+    @property
+    def done(self) -> bool:
+        """
+        True, if the job finished, failed, was cancelled or timed out.
+        """
+        return self.status in FINAL_STATUSES
+
+    @property
+    def succeeded(self) -> bool:
+        """
+        True, if the job finished successfully.
+        """
+        return self.status == JobStatus.FINISHED
+
+    ############## Status ##############
+    @traced('Job.refresh')
+    def refresh(self) -> 'Job':
+        """
+        Request the current state of the job and update the attributes. The
+        response cache of the client is not used.
+
+        :return: the job itself
+        :rtype: Job
+        """
+        response = self._api.request('GET', self._endpoint, cache=False)
+        return self._update(validate_response(response, 200, 'get job'))
+
+    @traced('Job.arefresh')
+    async def arefresh(self) -> 'Job':
+        """
+        Request the current state of the job asynchronously and update the
+        attributes.
+
+        :return: the job itself
+        :rtype: Job
+        """
+        response = await self._aapi.request('GET', self._endpoint, cache=False)
+        return self._update(validate_response(response, 200, 'get job'))
+
+    @traced('Job.wait')
+    def wait(
+        self,
+        timeout: Optional[float] = None,
+        abort: bool = False,
+        interval: float = POLL_INTERVAL,
+        max_interval: float = MAX_POLL_INTERVAL,
+    ) -> 'Job':
+        """
+        Wait until the job is done. The status is requested with growing
+        intervals, which start again at `interval`, when the status or the
+        stage of the job changes.
+
+        Example:
+            ```
+            job = project.get_job(id=<job id>).wait(timeout=600)
+            if not job.succeeded:
+                print(job.errorMessage)
+            ```
+
+        :param timeout: seconds until a `TimeoutError` is raised, None to
+            wait without limit
+        :type timeout: Optional[float]
+        :param abort: abort the job, if the timeout expires or the waiting
+            is interrupted
+        :type abort: bool
+        :param interval: first interval between status requests in seconds
+        :type interval: float
+        :param max_interval: longest interval between status requests
+        :type max_interval: float
+        :return: the job itself, in its final state
+        :rtype: Job
+        """
+        return wait_jobs([self], timeout, abort, interval, max_interval)[0]
+
+    @traced('Job.await_')
+    async def await_(
+        self,
+        timeout: Optional[float] = None,
+        abort: bool = False,
+        interval: float = POLL_INTERVAL,
+        max_interval: float = MAX_POLL_INTERVAL,
+    ) -> 'Job':
+        """
+        Wait asynchronously until the job is done. If `abort` is True, the
+        job is also aborted, when the waiting task is cancelled.
+        See `wait` for the parameters.
+        """
+        jobs = await await_jobs([self], timeout, abort, interval, max_interval)
+        return jobs[0]
+
+    ############## Actions ##############
+    @traced('Job.abort')
+    def abort(self) -> None:
+        """
+        Abort the job.
+        """
+        response = self._api.put(endpoint=self._endpoint + 'abort')
+        validate_response(response, 201, 'abort job')
+
+    @traced('Job.aabort')
+    async def aabort(self) -> None:
+        """
+        Abort the job asynchronously.
+        """
+        response = await self._aapi.put(endpoint=self._endpoint + 'abort')
+        validate_response(response, 201, 'abort job')
+
+    @traced('Job.delete')
+    def delete(self) -> Response:
+        """
+        Delete the job. Requires admin permissions.
+
+        :return: Response
+        :rtype: Response
+        """
+        return self._api.delete(endpoint=self._endpoint)
+
+    @traced('Job.adelete')
+    async def adelete(self) -> Response:
+        """
+        Delete the job asynchronously. Requires admin permissions.
+
+        :return: Response
+        :rtype: Response
+        """
+        return await self._aapi.delete(endpoint=self._endpoint)
+
+    ############## Operations ##############
+    @traced('Job.get_operations')
+    def get_operations(
+        self,
+        status: Optional[Iterable[int]] = None,
+        operationType: Optional[Iterable[str]] = None,
+        operationSetId: Optional[str] = None,
+        operationSetStage: Optional[str] = None,
+    ) -> list[Operation]:
+        """
+        Request the operations of the job. The response cache of the client
+        is not used.
+
+        Example:
+            ```
+            failed = job.get_operations(status=[JobStatus.FAILED])
+            ```
+
+        :param status: only operations with one of these states
+        :type status: Optional[Iterable[int]]
+        :param operationType: only operations of these types
+        :type operationType: Optional[Iterable[str]]
+        :param operationSetId: only operations of this operation set
+        :type operationSetId: Optional[str]
+        :param operationSetStage: only operations of this stage
+        :type operationSetStage: Optional[str]
+        :return: operations
+        :rtype: list[Operation]
+        """
+        response = self._api.request(
+            'GET',
+            self._endpoint + 'operations',
+            params=self._operation_params(
+                status, operationType, operationSetId, operationSetStage
+            ),
+            cache=False,
+        )
+        validate_response(response, 200, 'get operations')
+        return [self._operation(data) for data in response_json(response)]
+
+    @traced('Job.aget_operations')
+    async def aget_operations(
+        self,
+        status: Optional[Iterable[int]] = None,
+        operationType: Optional[Iterable[str]] = None,
+        operationSetId: Optional[str] = None,
+        operationSetStage: Optional[str] = None,
+    ) -> list[Operation]:
+        """
+        Request the operations of the job asynchronously. See
+        `get_operations` for the parameters.
+
+        :return: operations
+        :rtype: list[Operation]
+        """
+        response = await self._aapi.request(
+            'GET',
+            self._endpoint + 'operations',
+            params=self._operation_params(
+                status, operationType, operationSetId, operationSetStage
+            ),
+            cache=False,
+        )
+        validate_response(response, 200, 'get operations')
+        return [self._operation(data) for data in response_json(response)]
+
+    @traced('Job.get_operation', {'pyblisher.operation.id': 'id'})
+    def get_operation(self, id: str) -> Operation:
+        """
+        Request an operation of the job.
+
+        :param id: operation id
+        :type id: str
+        :return: operation
+        :rtype: Operation
+        """
+        response = self._api.request(
+            'GET', self._endpoint + f'operation/{id}', cache=False
+        )
+        validate_response(response, 200, 'get operation')
+        return self._operation(response_json(response))
+
+    @traced('Job.aget_operation', {'pyblisher.operation.id': 'id'})
+    async def aget_operation(self, id: str) -> Operation:
+        """
+        Request an operation of the job asynchronously.
+
+        :param id: operation id
+        :type id: str
+        :return: operation
+        :rtype: Operation
+        """
+        response = await self._aapi.request(
+            'GET', self._endpoint + f'operation/{id}', cache=False
+        )
+        validate_response(response, 200, 'get operation')
+        return self._operation(response_json(response))
+
+    @traced('Job.get_operation_sets')
+    def get_operation_sets(
+        self,
+        status: Optional[Iterable[int]] = None,
+        jobStage: Optional[str] = None,
+    ) -> list[OperationSet]:
+        """
+        Request the operation sets of the job.
+
+        :param status: only operation sets with one of these states
+        :type status: Optional[Iterable[int]]
+        :param jobStage: only operation sets of this job stage
+        :type jobStage: Optional[str]
+        :return: operation sets
+        :rtype: list[OperationSet]
+        """
+        response = self._api.request(
+            'GET',
+            self._endpoint + 'operation-sets',
+            params=self._operation_set_params(status, jobStage),
+            cache=False,
+        )
+        validate_response(response, 200, 'get operation sets')
+        return [decode(OperationSet, data) for data in response_json(response)]
+
+    @traced('Job.aget_operation_sets')
+    async def aget_operation_sets(
+        self,
+        status: Optional[Iterable[int]] = None,
+        jobStage: Optional[str] = None,
+    ) -> list[OperationSet]:
+        """
+        Request the operation sets of the job asynchronously. See
+        `get_operation_sets` for the parameters.
+
+        :return: operation sets
+        :rtype: list[OperationSet]
+        """
+        response = await self._aapi.request(
+            'GET',
+            self._endpoint + 'operation-sets',
+            params=self._operation_set_params(status, jobStage),
+            cache=False,
+        )
+        validate_response(response, 200, 'get operation sets')
+        return [decode(OperationSet, data) for data in response_json(response)]
+
+    ############## Logs ##############
+    @traced('Job.download_logs')
+    def download_logs(
+        self,
+        directory: str | os.PathLike,
+        operations: Optional[Iterable[Operation]] = None,
+        status: Optional[Iterable[int]] = None,
+        workers: int = LOG_WORKERS,
+    ) -> LogReport:
+        """
+        Download the logs of many operations into a directory as
+        `<operation id>.log`. Up to `workers` logs are streamed to their
+        files at the same time, and failed downloads are collected in the
+        report instead of stopping the others.
+
+        Example:
+            ```
+            report = job.download_logs('logs', status=[JobStatus.FAILED])
+            ```
+
+        :param directory: local directory, which is created if necessary
+        :type directory: str | os.PathLike
+        :param operations: operations, default are all operations of the job
+            with one of the states `status`
+        :type operations: Optional[Iterable[Operation]]
+        :param status: states of the operations, if they are not given
+        :type status: Optional[Iterable[int]]
+        :param workers: number of concurrent downloads
+        :type workers: int
+        :return: files and failed operations
+        :rtype: LogReport
+        """
+        if operations is None:
+            operations = self.get_operations(status=status)
+        os.makedirs(directory, exist_ok=True)
+        report = LogReport()
+
+        def download(operation: Operation) -> None:
+            path = os.path.join(directory, f'{operation._id}.log')
+            try:
+                operation.download_log(path)
+            except Exception as error:
+                report.failed[operation._id] = str(error)
+            else:
+                report.paths[operation._id] = path
+
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            list(executor.map(propagated(download), operations))
+        annotate({'pyblisher.logs': len(report.paths)})
+        return report
+
+    @traced('Job.adownload_logs')
+    async def adownload_logs(
+        self,
+        directory: str | os.PathLike,
+        operations: Optional[Iterable[Operation]] = None,
+        status: Optional[Iterable[int]] = None,
+        workers: int = LOG_WORKERS,
+    ) -> LogReport:
+        """
+        Download the logs of many operations into a directory
+        asynchronously. See `download_logs` for the parameters.
+
+        :return: files and failed operations
+        :rtype: LogReport
+        """
+        if operations is None:
+            operations = await self.aget_operations(status=status)
+        await asyncio.to_thread(os.makedirs, directory, exist_ok=True)
+        report = LogReport()
+        semaphore = asyncio.Semaphore(max(1, workers))
+
+        async def download(operation: Operation) -> None:
+            path = os.path.join(directory, f'{operation._id}.log')
+            async with semaphore:
+                try:
+                    await operation.adownload_log(path)
+                except Exception as error:
+                    report.failed[operation._id] = str(error)
+                else:
+                    report.paths[operation._id] = path
+
+        await asyncio.gather(*(download(operation) for operation in operations))
+        annotate({'pyblisher.logs': len(report.paths)})
+        return report
+
+    def search_logs(
+        self,
+        pattern: str | re.Pattern,
+        operations: Optional[Iterable[Operation]] = None,
+        status: Optional[Iterable[int]] = None,
+        workers: int = LOG_WORKERS,
+    ) -> Iterator[tuple[Operation, str]]:
+        """
+        Search the logs of many operations for lines, which match a regular
+        expression. Up to `workers` logs are streamed at the same time, and
+        only the matching lines are kept. The lines of an operation are
+        yielded together, as soon as its log is read.
+
+        Example:
+            ```
+            for operation, line in job.search_logs(
+                'Error|Traceback', status=[JobStatus.FAILED]
+            ):
+                print(operation._id, line)
+            ```
+
+        :param pattern: regular expression
+        :type pattern: str | re.Pattern
+        :param operations: operations, default are all operations of the job
+            with one of the states `status`
+        :type operations: Optional[Iterable[Operation]]
+        :param status: states of the operations, if they are not given
+        :type status: Optional[Iterable[int]]
+        :param workers: number of concurrent requests
+        :type workers: int
+        :return: operations and their matching lines
+        :rtype: Iterator[tuple[Operation, str]]
+        """
+        search = re.compile(pattern).search
+        if operations is None:
+            operations = self.get_operations(status=status)
+
+        def matches(operation: Operation) -> list[str]:
+            return [line for line in operation.iter_log() if search(line)]
+
+        executor = ThreadPoolExecutor(max_workers=max(1, workers))
+        try:
+            futures = {
+                executor.submit(propagated(matches), operation): operation
+                for operation in operations
+            }
+            for future in as_completed(futures):
+                for line in future.result():
+                    yield futures[future], line
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    async def asearch_logs(
+        self,
+        pattern: str | re.Pattern,
+        operations: Optional[Iterable[Operation]] = None,
+        status: Optional[Iterable[int]] = None,
+        workers: int = LOG_WORKERS,
+    ) -> AsyncIterator[tuple[Operation, str]]:
+        """
+        Search the logs of many operations asynchronously. See `search_logs`.
+
+        :return: operations and their matching lines
+        :rtype: AsyncIterator[tuple[Operation, str]]
+        """
+        search = re.compile(pattern).search
+        if operations is None:
+            operations = await self.aget_operations(status=status)
+        semaphore = asyncio.Semaphore(max(1, workers))
+
+        async def matches(operation: Operation) -> tuple[Operation, list[str]]:
+            async with semaphore:
+                lines = [line async for line in operation.aiter_log() if search(line)]
+            return operation, lines
+
+        tasks = [asyncio.ensure_future(matches(operation)) for operation in operations]
+        try:
+            for task in asyncio.as_completed(tasks):
+                operation, lines = await task
+                for line in lines:
+                    yield operation, line
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    @traced('Job.download_debug_package')
+    def download_debug_package(
+        self,
+        target: str | os.PathLike | BinaryIO,
+        resume: bool = True,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        progress: Optional[Progress] = None,
+    ) -> DownloadReport:
+        """
+        Download the debug package of the job, a `.tar.gz` archive with the
+        parameters of the job and the parameters and logs of its operations.
+        The archive is streamed to the target like `Bucket.download`.
+
+        :param target: local path or writable binary file object
+        :type target: str | os.PathLike | BinaryIO
+        :param resume: continue an interrupted download to the same path
+        :type resume: bool
+        :param chunk_size: size of the blocks written to the target
+        :type chunk_size: int
+        :param progress: function, which receives the number of written bytes
+        :type progress: Optional[Progress]
+        :return: size and throughput of the download
+        :rtype: DownloadReport
+        """
+        return stream_to_target(
+            self._api,
+            self._endpoint + 'debug-package',
+            target,
+            resume,
+            chunk_size,
+            progress,
+        )
+
+    @traced('Job.adownload_debug_package')
+    async def adownload_debug_package(
+        self,
+        target: str | os.PathLike | BinaryIO,
+        resume: bool = True,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        progress: Optional[Progress] = None,
+    ) -> DownloadReport:
+        """
+        Download the debug package of the job asynchronously. See
+        `download_debug_package`.
+
+        :return: size and throughput of the download
+        :rtype: DownloadReport
+        """
+        return await astream_to_target(
+            self._aapi,
+            self._endpoint + 'debug-package',
+            target,
+            resume,
+            chunk_size,
+            progress,
+        )
+
+    ############## Response Data ##############
+    def _update(self, data: Response | dict) -> 'Job':
+        """
+        Take the attributes of a response or a list item.
+        """
+        job = decode(Job, response_json(data) if isinstance(data, Response) else data)
+        for attribute in fields(Job):
+            if attribute.init:
+                setattr(self, attribute.name, getattr(job, attribute.name))
+        return self
+
+    def _operation(self, data: dict) -> Operation:
+        """
+        Create an Operation, which uses the API clients of the job.
+        """
+        operation = decode(Operation, data)
+        operation._api = self._api
+        operation._aapi = self._aapi
+        operation.projectId = self.projectId
+        operation._endpoint = self._endpoint + f'operation/{operation._id}/'
+        return operation
+
+    @staticmethod
+    def _operation_params(
+        status: Optional[Iterable[int]],
+        operationType: Optional[Iterable[str]],
+        operationSetId: Optional[str],
+        operationSetStage: Optional[str],
+    ) -> dict:
+        """
+        Prepare the query parameters of the operation list.
+        """
+        params: dict = {}
+        if status is not None:
+            params['status'] = [int(value) for value in status]
+        if operationType is not None:
+            params['operationType'] = list(operationType)
+        if operationSetId is not None:
+            params['operationSetId'] = operationSetId
+        if operationSetStage is not None:
+            params['operationSetStage'] = operationSetStage
+        return params
+
+    @staticmethod
+    def _operation_set_params(
+        status: Optional[Iterable[int]], jobStage: Optional[str]
+    ) -> dict:
+        """
+        Prepare the query parameters of the operation set list.
+        """
+        params: dict = {}
+        if status is not None:
+            params['status'] = [int(value) for value in status]
+        if jobStage is not None:
+            params['jobStage'] = jobStage
+        return params
+
+    def _state(self) -> tuple:
+        """
+        Values, whose change resets the polling interval.
+        """
+        return self.status, self.currentJobStage
+
+    ############## Dunder Methods ##############
+    def __post_init__(self):
+        """
+        Initialize the API endpoint, after the object is created.
+        """
+        self._endpoint = job_endpoint(self.projectId, self._id)
+
+    def __str__(self) -> str:
+        return self._id
+
+
+############## Waiting for many jobs ##############
+def job_groups(jobs: Iterable[Job]) -> dict[tuple, dict[str, Job]]:
+    """
+    Group jobs by their API clients, project and task, so each group is
+    refreshed with one list request.
+    """
+    groups: dict[tuple, dict[str, Job]] = {}
+    for job in jobs:
+        key = (job._api, job._aapi, job.projectId, job.taskId)
+        groups.setdefault(key, {})[job._id] = job
+    return groups
+
+
+def job_endpoint(projectId: str, id: str) -> str:
+    """
+    Get the API endpoint of a job.
+    """
+    return f'project/{projectId}/job/{id}/'
+
+
+def get_job_data(api: ApiClientProtocol, projectId: str, id: str) -> dict:
+    """
+    Request the current state of a job as dict of the API, without the
+    response cache.
+
+    :param api: API client
+    :type api: ApiClientProtocol
+    :param projectId: project id
+    :type projectId: str
+    :param id: job id
+    :type id: str
+    :return: job data
+    :rtype: dict
+    """
+    response = api.request('GET', job_endpoint(projectId, id), cache=False)
+    return response_json(validate_response(response, 200, 'get job'))
+
+
+async def aget_job_data(aapi: AsyncApiClientProtocol, projectId: str, id: str) -> dict:
+    """
+    Request the current state of a job asynchronously, see `get_job_data`.
+    """
+    response = await aapi.request('GET', job_endpoint(projectId, id), cache=False)
+    return response_json(validate_response(response, 200, 'get job'))
+
+
+def task_jobs(api: ApiClientProtocol, projectId: str, taskId: str) -> Paginator[dict]:
+    """
+    Create a paginator over the jobs of a task, newest first, without the
+    response cache.
+    """
+    return Paginator(
+        api=api,
+        endpoint=f'project/{projectId}/jobs/',
+        parse=lambda data: data,
+        params={'taskId': taskId, 'orderBy': 'createdAt', 'sort': 'desc'},
+        limit=PAGE_SIZE,
+        action='get jobs',
+        cache=False,
+    )
+
+
+def atask_jobs(
+    aapi: AsyncApiClientProtocol, projectId: str, taskId: str
+) -> AsyncPaginator[dict]:
+    """
+    Create an asynchronous paginator over the jobs of a task, see
+    `task_jobs`.
+    """
+    return AsyncPaginator(
+        api=aapi,
+        endpoint=f'project/{projectId}/jobs/',
+        parse=lambda data: data,
+        params={'taskId': taskId, 'orderBy': 'createdAt', 'sort': 'desc'},
+        limit=PAGE_SIZE,
+        action='get jobs',
+        cache=False,
+    )
+
+
+def refresh_group(group: dict[str, Job]) -> bool:
+    """
+    Refresh the jobs of one task with the job list of the task. The pages
+    are requested until all jobs were found. Jobs, which are not in the
+    list, are requested one by one.
+
+    :param group: jobs of the same task by id
+    :type group: dict[str, Job]
+    :return: True, if the state of a job changed
+    :rtype: bool
+    """
+    job = next(iter(group.values()))
+    missing = dict(group)
+    changed = False
+    for data in task_jobs(job._api, job.projectId, job.taskId):
+        found = missing.pop(data['_id'], None)
+        if found is not None:
+            state = found._state()
+            changed |= found._update(data)._state() != state
+            if not missing:
+                break
+    for found in missing.values():
+        state = found._state()
+        changed |= found.refresh()._state() != state
+    return changed
+
+
+async def arefresh_group(group: dict[str, Job]) -> bool:
+    """
+    Refresh the jobs of one task asynchronously, see `refresh_group`.
+    """
+    job = next(iter(group.values()))
+    missing = dict(group)
+    changed = False
+    async for data in atask_jobs(job._aapi, job.projectId, job.taskId):
+        found = missing.pop(data['_id'], None)
+        if found is not None:
+            state = found._state()
+            changed |= found._update(data)._state() != state
+            if not missing:
+                break
+    for found in missing.values():
+        state = found._state()
+        changed |= (await found.arefresh())._state() != state
+    return changed
+
+
+def wait_jobs(
+    jobs: Iterable[Job],
+    timeout: Optional[float] = None,
+    abort: bool = False,
+    interval: float = POLL_INTERVAL,
+    max_interval: float = MAX_POLL_INTERVAL,
+) -> list[Job]:
+    """
+    Wait until all jobs are done. A single job is refreshed with its own
+    endpoint, several jobs of the same task with one request of the job list
+    of the task (`jobs?taskId=<id>`), instead of one request per job.
+
+    Example:
+        ```
+        jobs = wait_jobs(project.get_jobs(filters={'taskId': <task id>}))
+        failed = [job for job in jobs if not job.succeeded]
+        ```
+
+    :param jobs: jobs to wait for
+    :type jobs: Iterable[Job]
+    :param timeout: seconds until a `TimeoutError` is raised, None to wait
+        without limit
+    :type timeout: Optional[float]
+    :param abort: abort the unfinished jobs, if the timeout expires or the
+        waiting is interrupted
+    :type abort: bool
+    :param interval: first interval between status requests in seconds
+    :type interval: float
+    :param max_interval: longest interval between status requests
+    :type max_interval: float
+    :return: the jobs in their final states
+    :rtype: list[Job]
+    """
+    jobs = list(jobs)
+    pending = [job for job in jobs if not job.done]
+    backoff = Backoff(interval, max_interval, timeout)
+    changed = False
+    try:
+        while pending:
+            if backoff.expired:
+                raise TimeoutError(
+                    f'{len(pending)} job(s) not done after {timeout} seconds'
+                )
+            time.sleep(backoff.delay(changed))
+            if len(pending) == 1:
+                state = pending[0]._state()
+                changed = pending[0].refresh()._state() != state
+            else:
+                changed = False
+                for group in job_groups(pending).values():
+                    changed |= refresh_group(group)
+            pending = [job for job in pending if not job.done]
+    except (TimeoutError, KeyboardInterrupt):
+        if abort:
+            for job in pending:
+                job.abort()
+        raise
+    return jobs
+
+
+async def await_jobs(
+    jobs: Iterable[Job],
+    timeout: Optional[float] = None,
+    abort: bool = False,
+    interval: float = POLL_INTERVAL,
+    max_interval: float = MAX_POLL_INTERVAL,
+) -> list[Job]:
+    """
+    Wait asynchronously until all jobs are done. The job lists of different
+    tasks are requested concurrently. If `abort` is True, the unfinished
+    jobs are also aborted, when the waiting task is cancelled.
+    See `wait_jobs` for the parameters.
+    """
+    jobs = list(jobs)
+    pending = [job for job in jobs if not job.done]
+    backoff = Backoff(interval, max_interval, timeout)
+    changed = False
+    try:
+        while pending:
+            if backoff.expired:
+                raise TimeoutError(
+                    f'{len(pending)} job(s) not done after {timeout} seconds'
+                )
+            await asyncio.sleep(backoff.delay(changed))
+            if len(pending) == 1:
+                state = pending[0]._state()
+                changed = (await pending[0].arefresh())._state() != state
+            else:
+                changed = any(
+                    await asyncio.gather(
+                        *(
+                            arefresh_group(group)
+                            for group in job_groups(pending).values()
+                        )
+                    )
+                )
+            pending = [job for job in pending if not job.done]
+    except (TimeoutError, asyncio.CancelledError):
+        if abort:
+            await asyncio.gather(*(job.aabort() for job in pending))
+        raise
+    return jobs
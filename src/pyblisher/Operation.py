@@ -0,0 +1,553 @@
+import asyncio
+import os
+import time
+import zlib
+from dataclasses import dataclass, field, fields
+from datetime import datetime
+from typing import AsyncIterator, BinaryIO, Iterator, Optional
+
+from httpx import Response, TransportError
+
+from .client import aclient, client
+from .decode import decode, response_json
+from .download import content_range
+from .helpers import validate_response
+from .polling import (
+    FINAL_STATUSES,
+    MAX_POLL_INTERVAL,
+    POLL_INTERVAL,
+    Backoff,
+    JobStatus,
+)
+from .tracing import annotate, traced
+from .types import ApiClientProtocol, AsyncApiClientProtocol
+
+# size of the blocks, in which logs are read
+LOG_CHUNK_SIZE: int = 64 * 1024
+# default number of logs, which are read at the same time
+LOG_WORKERS: int = 8
+
+GZIP_MAGIC = b'\x1f\x8b'
+
+
+@dataclass
+class LogReport:
+    """
+    Result of the download of the logs of many operations.
+
+    :attr paths: files of the downloaded logs by operation id
+    :atype paths: dict[str, str]
+    :attr failed: ids of the operations, whose log could not be downloaded,
+        with the error message
+    :atype failed: dict[str, str]
+    """
+
+    paths: dict[str, str] = field(default_factory=dict)
+    failed: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """
+        True, if no download failed.
+        """
+        return not self.failed
+
+
+class LogStream:
+    """
+    Reader of an operation log, which is received in blocks. It splits the
+    log into lines and remembers how much of it was read, so a broken or
+    growing log is continued with a range request instead of being read
+    again. Only the last, incomplete line is kept in memory.
+
+    The API sends the log gzipped. If the body is still a gzip file after
+    the content encoding of the response was removed, it is decompressed
+    here, and as the ranges would refer to the compressed file, the log is
+    read from the start again and the known part is skipped.
+    """
+
+    def __init__(self) -> None:
+        # bytes of the log, which were read
+        self.offset = 0
+        # incomplete last line
+        self.buffer = b''
+        self.gzip = False
+        self._skip = 0
+        self._first = False
+        self._decompressor: Optional['zlib._Decompress'] = None
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """
+        Request headers, which ask for the part of the log, which was not
+        read yet.
+        """
+        if not self.offset or self.gzip:
+            return {}
+        return {'Range': f'bytes={self.offset}-', 'Accept-Encoding': 'identity'}
+
+    def begin(self, response: Response) -> None:
+        """
+        Prepare for the body of a response, which starts at the requested
+        offset or at the start of the log.
+
+        :param response: successful, streamed response
+        :type response: Response
+        """
+        start = 0
+        if response.status_code == 206:
+            served = content_range(response)
+            if served is None or served[0] > self.offset:
+                raise Exception(
+                    'Failed to continue log. Unexpected range: '
+                    f'{response.headers.get("content-range")}'
+                )
+            start = served[0]
+        self._skip = self.offset - start
+        self._first = start == 0
+        self._decompressor = None
+
+    def decode(self, chunk: bytes) -> bytes:
+        """
+        Get the new part of the log from a block of the response body.
+        """
+        if self._first:
+            self._first = False
+            if chunk.startswith(GZIP_MAGIC):
+                self.gzip = True
+                self._decompressor = zlib.decompressobj(wbits=31)
+        if self._decompressor is not None:
+            chunk = self._decompressor.decompress(chunk)
+        return self._take(chunk)
+
+    def flush(self) -> bytes:
+        """
+        Get the rest of a compressed log at the end of a response.
+        """
+        if self._decompressor is None:
+            return b''
+        return self._take(self._decompressor.flush())
+
+    def lines(self, data: bytes) -> list[str]:
+        """
+        Split a part of the log into the lines, which it completes.
+        """
+        lines = (self.buffer + data).split(b'\n')
+        self.buffer = lines.pop()
+        return [decode_line(line) for line in lines]
+
+    def rest(self) -> list[str]:
+        """
+        Get the last line of a complete log, if it does not end with a line
+        break.
+        """
+        rest, self.buffer = self.buffer, b''
+        return [decode_line(rest)] if rest else []
+
+    def _take(self, data: bytes) -> bytes:
+        """
+        Drop the part of the data, which was read before, and count the rest.
+        """
+        if self._skip:
+            skipped = min(self._skip, len(data))
+            data = data[skipped:]
+            self._skip -= skipped
+        self.offset += len(data)
+        return data
+
+
+def decode_line(line: bytes) -> str:
+    """
+    Decode a line of a log without its line break.
+    """
+    return line.rstrip(b'\r').decode('utf-8', errors='replace')
+
+
+@dataclass
+class Operation:
+    """
+    This class implements the structure of Operations of the VC Publisher
+    API. A job runs its stages as operations, e.g. one per tile of a
+    tiling job, and each of them has its own log and outputs.
+
+    :attribute _id: operation id
+    :atype _id: str
+    :attribute projectId: project id, which is not sent by the API, but set
+        by the job
+    :atype projectId: str
+    :attribute operationType: operation type
+    :atype operationType: str
+    :attribute operationSetId: id of the operation set
+    :atype operationSetId: str
+    :attribute operationSetStage: stage of the operation set
+    :atype operationSetStage: str
+    :attribute jobId: job id
+    :atype jobId: str
+    :attribute status: operation status, see `JobStatus`
+    :atype status: int
+    :attribute outputs: outputs of a finished operation
+    :atype outputs: dict
+    :attribute errorMessage: error of a failed operation
+    :atype errorMessage: str
+    """
+
+    # Internal attributes
+    _api: ApiClientProtocol = field(default=client, init=False, repr=False)
+    _aapi: AsyncApiClientProtocol = field(
+        default=aclient, init=False, repr=False
+    )
+    _endpoint: str = field(init=False, repr=False)
+    projectId: str = field(default='', init=False, repr=False)
+
+    # Required attributes
+    _id: str
+    createdAt: datetime
+    updatedAt: datetime
+    createdBy: str
+    updatedBy: str
+    operationType: str
+    operationVersion: str
+    operationSetStage: str
+    operationSetId: str
+    jobId: str
+    parameters: dict
+    startTime: datetime
+
+    # Optional attributes
+    status: Optional[int] = None
+    labels: Optional[list[str]] = None
+    tags: Optional[dict] = None
+    debugLevel: Optional[int] = None
+    errorMessage: Optional[str] = None
+    outputs: Optional[dict] = None
+    endTime: Optional[datetime] = None
+
+    @property
+    def done(self) -> bool:
+        """
+        True, if the operation finished, failed, was cancelled or timed out.
+        """
+        return self.status in FINAL_STATUSES
+
+    ############## Status ##############
+    @traced('Operation.refresh')
+    def refresh(self) -> 'Operation':
+        """
+        Request the current state of the operation and update the
+        attributes. The response cache of the client is not used.
+
+        :return: the operation itself
+        :rtype: Operation
+        """
+        response = self._api.request('GET', self._endpoint, cache=False)
+        return self._update(validate_response(response, 200, 'get operation'))
+
+    @traced('Operation.arefresh')
+    async def arefresh(self) -> 'Operation':
+        """
+        Request the current state of the operation asynchronously and update
+        the attributes.
+
+        :return: the operation itself
+        :rtype: Operation
+        """
+        response = await self._aapi.request('GET', self._endpoint, cache=False)
+        return self._update(validate_response(response, 200, 'get operation'))
+
+    ############## Outputs ##############
+    @traced('Operation.get_outputs')
+    def get_outputs(self) -> dict:
+        """
+        Request the outputs of the operation.
+
+        :return: outputs
+        :rtype: dict
+        """
+        response = self._api.request('GET', self._endpoint + 'outputs', cache=False)
+        return response_json(validate_response(response, 200, 'get outputs'))
+
+    @traced('Operation.aget_outputs')
+    async def aget_outputs(self) -> dict:
+        """
+        Request the outputs of the operation asynchronously.
+
+        :return: outputs
+        :rtype: dict
+        """
+        response = await self._aapi.request(
+            'GET', self._endpoint + 'outputs', cache=False
+        )
+        return response_json(validate_response(response, 200, 'get outputs'))
+
+    ############## Logs ##############
+    def iter_log(self) -> Iterator[str]:
+        """
+        Iterate over the lines of the log. The log is streamed, so it is
+        never held in memory, and a broken connection is continued where it
+        stopped according to the retry policy.
+
+        Example:
+            ```
+            for line in operation.iter_log():
+                if 'ERROR' in line:
+                    print(line)
+            ```
+
+        :return: iterator over the lines without line breaks
+        :rtype: Iterator[str]
+        """
+        stream = LogStream()
+        for data in self._read_log(stream):
+            yield from stream.lines(data)
+        yield from stream.rest()
+
+    async def aiter_log(self) -> AsyncIterator[str]:
+        """
+        Iterate asynchronously over the lines of the log. See `iter_log`.
+
+        :return: iterator over the lines without line breaks
+        :rtype: AsyncIterator[str]
+        """
+        stream = LogStream()
+        async for data in self._aread_log(stream):
+            for line in stream.lines(data):
+                yield line
+        for line in stream.rest():
+            yield line
+
+    def follow_log(
+        self,
+        timeout: Optional[float] = None,
+        interval: float = POLL_INTERVAL,
+        max_interval: float = MAX_POLL_INTERVAL,
+    ) -> Iterator[str]:
+        """
+        Iterate over the lines of the log of a running operation, while they
+        are written, like `tail -f`. Each request asks only for the new part
+        of the log with a range request. The iterator ends, when the
+        operation is done and its log is read completely.
+
+        :param timeout: seconds until a `TimeoutError` is raised, None to
+            follow without limit
+        :type timeout: Optional[float]
+        :param interval: first interval between requests in seconds
+        :type interval: float
+        :param max_interval: longest interval between requests in seconds
+        :type max_interval: float
+        :return: iterator over the lines without line breaks
+        :rtype: Iterator[str]
+        """
+        stream = LogStream()
+        backoff = Backoff(interval, max_interval, timeout)
+        while True:
+            # the status is requested first, so the log of a done operation
+            # is complete, when it is read
+            done = self.refresh().done
+            offset = stream.offset
+            if self.status != JobStatus.PENDING:
+                for data in self._read_log(stream):
+                    yield from stream.lines(data)
+            if done:
+                yield from stream.rest()
+                return
+            if backoff.expired:
+                raise TimeoutError(
+                    f'Operation {self._id} not done after {timeout} seconds'
+                )
+            time.sleep(backoff.delay(stream.offset != offset))
+
+    async def afollow_log(
+        self,
+        timeout: Optional[float] = None,
+        interval: float = POLL_INTERVAL,
+        max_interval: float = MAX_POLL_INTERVAL,
+    ) -> AsyncIterator[str]:
+        """
+        Iterate asynchronously over the lines of the log of a running
+        operation, while they are written. See `follow_log`.
+        """
+        stream = LogStream()
+        backoff = Backoff(interval, max_interval, timeout)
+        while True:
+            done = (await self.arefresh()).done
+            offset = stream.offset
+            if self.status != JobStatus.PENDING:
+                async for data in self._aread_log(stream):
+                    for line in stream.lines(data):
+                        yield line
+            if done:
+                for line in stream.rest():
+                    yield line
+                return
+            if backoff.expired:
+                raise TimeoutError(
+                    f'Operation {self._id} not done after {timeout} seconds'
+                )
+            await asyncio.sleep(backoff.delay(stream.offset != offset))
+
+    @traced('Operation.download_log')
+    def download_log(self, target: str | os.PathLike | BinaryIO) -> int:
+        """
+        Write the log of the operation to a file. The log is streamed in
+        blocks and decompressed, if necessary.
+
+        :param target: local path or writable binary file object
+        :type target: str | os.PathLike | BinaryIO
+        :return: size of the log in bytes
+        :rtype: int
+        """
+        stream = LogStream()
+        if isinstance(target, (str, os.PathLike)):
+            with open(target, 'wb') as file:
+                for data in self._read_log(stream):
+                    file.write(data)
+        else:
+            for data in self._read_log(stream):
+                target.write(data)
+        annotate({'pyblisher.download.size': stream.offset})
+        return stream.offset
+
+    @traced('Operation.adownload_log')
+    async def adownload_log(self, target: str | os.PathLike | BinaryIO) -> int:
+        """
+        Write the log of the operation to a file asynchronously. The blocks
+        are written in a worker thread. See `download_log`.
+
+        :return: size of the log in bytes
+        :rtype: int
+        """
+        stream = LogStream()
+        file: BinaryIO
+        if isinstance(target, (str, os.PathLike)):
+            file = await asyncio.to_thread(open, target, 'wb')
+        else:
+            file = target
+        try:
+            async for data in self._aread_log(stream):
+                await asyncio.to_thread(file.write, data)
+        finally:
+            if file is not target:
+                await asyncio.to_thread(file.close)
+        annotate({'pyblisher.download.size': stream.offset})
+        return stream.offset
+
+    def _read_log(self, stream: LogStream) -> Iterator[bytes]:
+        """
+        Stream the log from the offset of the stream. Broken connections are
+        continued according to the retry policy.
+        """
+        attempt = 1
+        while True:
+            try:
+                with self._api.stream(
+                    'GET', self._endpoint + 'log', headers=stream.headers
+                ) as response:
+                    if response.status_code == 416 and stream.offset:
+                        # no new part of the log
+                        return
+                    if response.status_code not in (200, 206):
+                        response.read()
+                        validate_response(response, (200, 206), 'get log')
+                    stream.begin(response)
+                    for chunk in response.iter_bytes(LOG_CHUNK_SIZE):
+                        if data := stream.decode(chunk):
+                            yield data
+                    if data := stream.flush():
+                        yield data
+                    return
+            except TransportError as error:
+                if not self._api.retry.should_retry('GET', attempt, error=error):
+                    raise
+                time.sleep(self._api.retry.delay(attempt))
+                attempt += 1
+
+    async def _aread_log(self, stream: LogStream) -> AsyncIterator[bytes]:
+        """
+        Stream the log asynchronously from the offset of the stream. See
+        `_read_log`.
+        """
+        attempt = 1
+        while True:
+            try:
+                async with self._aapi.stream(
+                    'GET', self._endpoint + 'log', headers=stream.headers
+                ) as response:
+                    if response.status_code == 416 and stream.offset:
+                        return
+                    if response.status_code not in (200, 206):
+                        await response.aread()
+                        validate_response(response, (200, 206), 'get log')
+                    stream.begin(response)
+                    async for chunk in response.aiter_bytes(LOG_CHUNK_SIZE):
+                        if data := stream.decode(chunk):
+                            yield data
+                    if data := stream.flush():
+                        yield data
+                    return
+            except TransportError as error:
+                if not self._aapi.retry.should_retry('GET', attempt, error=error):
+                    raise
+                await asyncio.sleep(self._aapi.retry.delay(attempt))
+                attempt += 1
+
+    ############## Response Data ##############
+    def _update(self, response: Response) -> 'Operation':
+        """
+        Take the attributes of a response.
+        """
+        operation = decode(Operation, response_json(response))
+        for attribute in fields(Operation):
+            if attribute.init:
+                setattr(self, attribute.name, getattr(operation, attribute.name))
+        return self
+
+    ############## Dunder Methods ##############
+    def __str__(self) -> str:
+        return self._id
+
+
+@dataclass
+class OperationSet:
+    """
+    This class implements the structure of Operation Sets of the VC
+    Publisher API. An operation set groups the operations of a job stage,
+    which run on the same runner.
+
+    :attribute _id: operation set id
+    :atype _id: str
+    :attribute jobId: job id
+    :atype jobId: str
+    :attribute jobStage: stage of the job
+    :atype jobStage: str
+    :attribute operations: operation types and their version ranges
+    :atype operations: dict
+    :attribute operationSetStages: stages of the operation set
+    :atype operationSetStages: list[str]
+    :attribute status: status, see `JobStatus`
+    :atype status: int
+    :attribute currentOperationSetStage: stage, which is running
+    :atype currentOperationSetStage: str
+    :attribute lastPing: last sign of life of the runner
+    :atype lastPing: datetime
+    """
+
+    # Required attributes
+    _id: str
+    createdAt: datetime
+    updatedAt: datetime
+    createdBy: str
+    updatedBy: str
+    jobId: str
+    jobCreatedAt: datetime
+    priority: int
+    operations: dict
+    jobStage: str
+    operationSetStages: list[str]
+
+    # Optional attributes
+    status: Optional[int] = None
+    labels: Optional[list[str]] = None
+    tags: Optional[dict] = None
+    debugLevel: Optional[int] = None
+    currentOperationSetStage: Optional[str] = None
+    lastPing: Optional[datetime] = None
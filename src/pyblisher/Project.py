@@ -1,23 +1,32 @@
+import asyncio
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import partial
 from typing import Any, Literal, Optional
 
-from dacite import from_dict
 from httpx import Response
 
 from .Bucket import Bucket
-from .client import client
-from .exceptions import (
-    AuthenticationError,
-    InternalServerError,
-    MatchFailed,
-    ObjectNotFound,
-    PermissionError,
-)
-from .Settings import settings
+from .client import aclient, client
+from .decode import decode, decode_lazy, response_json
+from .helpers import validate_response
+from .Job import Job, aget_job_data, atask_jobs, get_job_data, task_jobs
+from .pagination import CONCURRENCY, PAGE_SIZE, AsyncPaginator, Paginator
+from .polling import Backoff
 from .Source import Source
-from .Task import Task
-from .types import ApiClientProtocol
+from .Task import Task, TaskResult
+from .tracing import annotate, traced
+from .types import ApiClientProtocol, AsyncApiClientProtocol
+
+# attributes, which are always sent on creation of a datasource or task
+SOURCE_REQUIRED = ('name', 'sourceProperties', 'type', 'typeProperties')
+TASK_REQUIRED = ('name', 'parameters', 'jobType', 'schedule')
+SYNC_TASK_REQUIRED = ('name', 'parameters', 'jobType')
+# default seconds, which a synchronous task may take, before it is run as job
+SYNC_TIMEOUT: float = 30.0
+# status codes, with which a server without synchronous tasks answers
+SYNC_UNSUPPORTED = (405, 501)
 
 
 @dataclass
@@ -25,6 +34,11 @@ class Project:
     """
     This class implements the structure of Projects of the VC Publisher API.
 
+    Buckets, datasources and tasks of a project use the same API clients as
+    the project. Every request method has an awaitable counterpart prefixed with `a`
+    (e.g. `get_bucket` and `aget_bucket`), which runs on the asynchronous
+    API client.
+
     :attribute _id: project id
     :atype _id: str
     :attribute name: project name
@@ -49,7 +63,12 @@ class Project:
 
     # Internal attributes
     _api: ApiClientProtocol = field(default=client, init=False, repr=False)
+    _aapi: AsyncApiClientProtocol = field(
+        default=aclient, init=False, repr=False
+    )
     _endpoint: str = field(init=False, repr=False)
+    # False, after the API rejected a synchronous task
+    _sync_tasks: bool = field(default=True, init=False, repr=False)
 
     # required api attributes
     _id: str
@@ -66,6 +85,7 @@ class Project:
     properties: Optional[dict]
 
     ############## Data-Buckets ##############
+    @traced('Project.create_bucket', {'pyblisher.bucket.name': 'name'})
     def create_bucket(
         self,
         name: str,
@@ -84,46 +104,40 @@ class Project:
         :return: new bucket
         :rtype: Bucket
         """
-        # prepare post request data
-        data: dict = {'name': name}
-        if description:
-            data['description'] = description
-        if properties:
-            data['properties'] = properties
-
-        # send post request
         response = self._api.post(
-            endpoint=self._endpoint + 'data-bucket/', json=data
-        )
-        # validate response
-        match response.status_code:
-            case 201:  # Created
-                return from_dict(
-                    data_class=Bucket,
-                    data=response.json(),
-                    config=settings.dacite_config,
-                )
-            case 400:  # Match failed
-                raise MatchFailed(
-                    f'{response.status_code} - {response.json()["reason"]}'
-                )
-            case 401:  # Authentication failed
-                raise AuthenticationError(
-                    f'{response.status_code} - {response.json()["reason"]}'
-                )
-            case 403:  # Permission denied
-                raise PermissionError(
-                    f'{response.status_code} - {response.json()["reason"]}'
-                )
-            case 500:  # Internal server error
-                raise InternalServerError(
-                    f'{response.status_code} - {response.json()["reason"]}'
-                )
-            case _:  # All other cases
-                raise Exception(
-                    f'Failed to create bucket. Response: {response.__dict__}'
-                )
+            endpoint=self._endpoint + 'data-bucket/',
+            json=self._request_data(
+                ('name',),
+                name=name,
+                description=description,
+                properties=properties,
+            ),
+        )
+        return self._bucket(validate_response(response, 201, 'create bucket'))
 
+    @traced('Project.acreate_bucket', {'pyblisher.bucket.name': 'name'})
+    async def acreate_bucket(
+        self,
+        name: str,
+        description: Optional[str] = None,
+        properties: Optional[dict] = None,
+    ) -> Bucket:
+        """
+        Create a bucket for this project asynchronously.
+        See `create_bucket` for the parameters.
+        """
+        response = await self._aapi.post(
+            endpoint=self._endpoint + 'data-bucket/',
+            json=self._request_data(
+                ('name',),
+                name=name,
+                description=description,
+                properties=properties,
+            ),
+        )
+        return self._bucket(validate_response(response, 201, 'create bucket'))
+
+    @traced('Project.get_bucket', {'pyblisher.bucket.id': 'id'})
     def get_bucket(self, id: str) -> Bucket:
         """
         Get a bucket for this project.
@@ -134,34 +148,24 @@ class Project:
         :rtype: Bucket
         """
         response = self._api.get(endpoint=self._endpoint + f'data-bucket/{id}/')
-        match response.status_code:
-            case 200:  # OK
-                return from_dict(
-                    data_class=Bucket,
-                    data=response.json(),
-                    config=settings.dacite_config,
-                )
-            case 400:  # Match failed
-                raise MatchFailed(
-                    f'{response.status_code} - {response.json()["reason"]}'
-                )
-            case 401:  # Authentication failed
-                raise AuthenticationError(
-                    f'{response.status_code} - {response.json()["reason"]}'
-                )
-            case 403:  # Permission denied
-                raise PermissionError(
-                    f'{response.status_code} - {response.json()["reason"]}'
-                )
-            case 404:  # Not found
-                raise ObjectNotFound(
-                    f'{response.status_code} - {response.json()["reason"]}'
-                )
-            case _:  # All other cases
-                raise Exception(
-                    f'Failed to get bucket. Response: {response.__dict__}'
-                )
+        return self._bucket(validate_response(response, 200, 'get bucket'))
+
+    @traced('Project.aget_bucket', {'pyblisher.bucket.id': 'id'})
+    async def aget_bucket(self, id: str) -> Bucket:
+        """
+        Get a bucket for this project asynchronously.
+
+        :param id: bucket id
+        :type id: str
+        :return: bucket
+        :rtype: Bucket
+        """
+        response = await self._aapi.get(
+            endpoint=self._endpoint + f'data-bucket/{id}/'
+        )
+        return self._bucket(validate_response(response, 200, 'get bucket'))
 
+    @traced('Project.update_bucket', {'pyblisher.bucket.id': 'id'})
     def update_bucket(
         self,
         id: str,
@@ -169,7 +173,7 @@ class Project:
         description: Optional[str] = None,
         properties: Optional[dict] = None,
     ) -> Bucket:
-        """]
+        """
         Update a bucket for this project.
 
         :param id: bucket id
@@ -183,85 +187,119 @@ class Project:
         return: updated bucket
         :rtype: Bucket
         """
-        # prepare put request data
-        data: dict[str, Any] = {}
-        if name:
-            data['name'] = name
-        if description:
-            data['description'] = description
-        if properties:
-            data['properties'] = properties
-
-        # send put request
         response = self._api.put(
-            endpoint=self._endpoint + f'data-bucket/{id}/', json=data
-        )
-        # validate response
-        match response.status_code:
-            case 200:  # OK
-                return from_dict(
-                    data_class=Bucket,
-                    data=response.json(),
-                    config=settings.dacite_config,
-                )
-            case 400:  # Match failed
-                raise MatchFailed(
-                    f'{response.status_code} - {response.json()["reason"]}'
-                )
-            case 401:  # Authentication failed
-                raise AuthenticationError(
-                    f'{response.status_code} - {response.json()["reason"]}'
-                )
-            case 403:  # Permission denied
-                raise PermissionError(
-                    f'{response.status_code} - {response.json()["reason"]}'
-                )
-            case 500:  # Internal server error
-                raise InternalServerError(
-                    f'{response.status_code} - {response.json()["reason"]}'
-                )
-            case _:  # All other cases
-                raise Exception(
-                    f'Failed to update bucket. Response: {response.__dict__}'
-                )
+            endpoint=self._endpoint + f'data-bucket/{id}/',
+            json=self._request_data(
+                ('name',),
+                name=name,
+                description=description,
+                properties=properties,
+            ),
+        )
+        return self._bucket(validate_response(response, 200, 'update bucket'))
 
-    def get_buckets(self) -> list[Bucket]:
+    @traced('Project.aupdate_bucket', {'pyblisher.bucket.id': 'id'})
+    async def aupdate_bucket(
+        self,
+        id: str,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        properties: Optional[dict] = None,
+    ) -> Bucket:
+        """
+        Update a bucket for this project asynchronously.
+        See `update_bucket` for the parameters.
         """
-        Get all buckets for this project.
+        response = await self._aapi.put(
+            endpoint=self._endpoint + f'data-bucket/{id}/',
+            json=self._request_data(
+                ('name',),
+                name=name,
+                description=description,
+                properties=properties,
+            ),
+        )
+        return self._bucket(validate_response(response, 200, 'update bucket'))
 
+    @traced('Project.get_buckets')
+    def get_buckets(
+        self,
+        limit: int = PAGE_SIZE,
+        concurrency: int = CONCURRENCY,
+        lazy: bool = False,
+    ) -> list[Bucket]:
+        """
+        Get all buckets for this project. The pages after the first one are
+        requested concurrently.
+
+        :param limit: page size (1 - 1000)
+        :type limit: int
+        :param concurrency: maximum number of concurrent page requests
+        :type concurrency: int
+        :param lazy: create lazy objects, which decode their fields on the
+            first access, see `pyblisher.decode.decode_lazy`
+        :type lazy: bool
         :return: list of buckets
         :rtype: list
         """
-        response = self._api.get(endpoint=self._endpoint + 'data-buckets/')
-        match response.status_code:
-            case 200:  # OK
-                content = response.json()
-                return [
-                    from_dict(
-                        data_class=Bucket,
-                        data=bucket,
-                        config=settings.dacite_config,
-                    )
-                    for bucket in content['items']
-                ]
-            case 401:  # Authentication failed
-                raise AuthenticationError(
-                    f'{response.status_code} - {response.json()["reason"]}'
-                )
-            case 403:  # Permission denied
-                raise PermissionError(
-                    f'{response.status_code} - {response.json()["reason"]}'
-                )
-            case 404:  # Not found
-                raise ObjectNotFound(
-                    f'{response.status_code} - {response.json()["reason"]}'
-                )
-            case _:  # All other cases
-                raise Exception(
-                    f'Failed to get buckets. Response: {response.__dict__}'
-                )
+        return self.iter_buckets(limit=limit, lazy=lazy).all(concurrency)
+
+    @traced('Project.aget_buckets')
+    async def aget_buckets(
+        self,
+        limit: int = PAGE_SIZE,
+        concurrency: int = CONCURRENCY,
+        lazy: bool = False,
+    ) -> list[Bucket]:
+        """
+        Get all buckets for this project asynchronously.
+        See `get_buckets` for the parameters.
+        """
+        return await self.aiter_buckets(limit=limit, lazy=lazy).all(concurrency)
+
+    def iter_buckets(
+        self, limit: int = PAGE_SIZE, prefetch: bool = False, lazy: bool = False
+    ) -> Paginator[Bucket]:
+        """
+        Iterate lazily over the buckets of this project, page by page.
+
+        :param limit: page size (1 - 1000)
+        :type limit: int
+        :param prefetch: request the following page in the background
+        :type prefetch: bool
+        :param lazy: create lazy objects, which decode their fields on the
+            first access, see `pyblisher.decode.decode_lazy`
+        :type lazy: bool
+        :return: iterator over buckets
+        :rtype: Paginator[Bucket]
+        """
+        return Paginator(
+            api=self._api,
+            endpoint=self._endpoint + 'data-buckets/',
+            parse=partial(self._bucket, lazy=lazy),
+            limit=limit,
+            prefetch=prefetch,
+            action='get buckets',
+        )
+
+    def aiter_buckets(
+        self, limit: int = PAGE_SIZE, prefetch: bool = False, lazy: bool = False
+    ) -> AsyncPaginator[Bucket]:
+        """
+        Iterate lazily and asynchronously over the buckets of this project.
+        See `iter_buckets` for the parameters.
+        """
+        return AsyncPaginator(
+            api=self._aapi,
+            endpoint=self._endpoint + 'data-buckets/',
+            parse=partial(self._bucket, lazy=lazy),
+            limit=limit,
+            prefetch=prefetch,
+            action='get buckets',
+        )
 
     ############## Datasources ##############
+    @traced('Project.create_source', {'pyblisher.datasource.name': 'name'})
     def create_source(
         self,
         name: str,
@@ -279,7 +317,7 @@ class Project:
             'vectortiles',
             'generic',
         ],
-        typeProperties: dict = {},
+        typeProperties: Optional[dict] = None,
         description: Optional[str] = None,
         bbox: Optional[list] = None,
         properties: Optional[dict] = None,
@@ -293,8 +331,8 @@ class Project:
         :type sourceProperties: InternalSource | ExternalSource
         :param type: datasource type (e.g. 'tileset', 'geojson', 'wms', etc.)
         :type type: str
-        :param typeProperties: datasource type properties
-        :type typeProperties: dict
+        :param typeProperties: datasource type properties, empty by default
+        :type typeProperties: Optional[dict]
         :param description: optional datasource description
         :type description: str
         :param bbox: optional bounding box
@@ -304,46 +342,56 @@ class Project:
         :return: new datasource
         :rtype: Source
         """
-        # prepare post request data
-        data = {
-            'name': name,
-            'sourceProperties': sourceProperties,
-            'type': type,
-            'typeProperties': typeProperties,
-        }
-        # add optional parameters
-        if description:
-            data['description'] = description
-        if bbox:
-            data['bbox'] = bbox
-        if properties:
-            data['properties'] = properties
-
-        # send post request
         response: Response = self._api.post(
-            endpoint=self._endpoint + 'datasource/', json=data
-        )
-        # validate response
-        match response.status_code:
-            case 201:
-                return from_dict(
-                    data_class=Source,
-                    data=response.json(),
-                    config=settings.dacite_config,
-                )
-            case 401:
-                raise AuthenticationError(
-                    f'{response.status_code} - {response.json()["reason"]}'
-                )
-            case 403:
-                raise PermissionError(
-                    f'{response.status_code} - {response.json()["reason"]}'
-                )
-            case _:
-                raise Exception(
-                    f'Failed to create datasource. Response: {response.__dict__}'
-                )
+            endpoint=self._endpoint + 'datasource/',
+            json=self._request_data(
+                SOURCE_REQUIRED,
+                name=name,
+                sourceProperties=sourceProperties,
+                type=type,
+                typeProperties=typeProperties or {},
+                description=description,
+                bbox=bbox,
+                properties=properties,
+            ),
+        )
+        return self._source(
+            validate_response(response, 201, 'create datasource')
+        )
 
+    @traced('Project.acreate_source', {'pyblisher.datasource.name': 'name'})
+    async def acreate_source(
+        self,
+        name: str,
+        sourceProperties: dict,
+        type: str,
+        typeProperties: Optional[dict] = None,
+        description: Optional[str] = None,
+        bbox: Optional[list] = None,
+        properties: Optional[dict] = None,
+    ):
+        """
+        Create a datasource for this project asynchronously.
+        See `create_source` for the parameters.
+        """
+        response: Response = await self._aapi.post(
+            endpoint=self._endpoint + 'datasource/',
+            json=self._request_data(
+                SOURCE_REQUIRED,
+                name=name,
+                sourceProperties=sourceProperties,
+                type=type,
+                typeProperties=typeProperties or {},
+                description=description,
+                bbox=bbox,
+                properties=properties,
+            ),
+        )
+        return self._source(
+            validate_response(response, 201, 'create datasource')
+        )
+
+    @traced('Project.get_source', {'pyblisher.datasource.id': 'id'})
     def get_source(self, id: str):
         """
         Get a datasource for this project.
@@ -351,30 +399,19 @@ class Project:
         response: Response = self._api.get(
             endpoint=self._endpoint + f'datasource/{id}/'
         )
-        match response.status_code:
-            case 200:
-                return from_dict(
-                    data_class=Source,
-                    data=response.json(),
-                    config=settings.dacite_config,
-                )
-            case 401:
-                raise AuthenticationError(
-                    f'{response.status_code} - {response.json()["reason"]}'
-                )
-            case 403:  # Permission denied
-                raise PermissionError(
-                    f'{response.status_code} - {response.json()["reason"]}'
-                )
-            case 404:
-                raise ObjectNotFound(
-                    f'{response.status_code} - {response.json()["reason"]}'
-                )
-            case _:
-                raise Exception(
-                    f'Failed to get datasource. Response: {response.__dict__}'
-                )
+        return self._source(validate_response(response, 200, 'get datasource'))
+
+    @traced('Project.aget_source', {'pyblisher.datasource.id': 'id'})
+    async def aget_source(self, id: str):
+        """
+        Get a datasource for this project asynchronously.
+        """
+        response: Response = await self._aapi.get(
+            endpoint=self._endpoint + f'datasource/{id}/'
+        )
+        return self._source(validate_response(response, 200, 'get datasource'))
 
+    @traced('Project.update_source', {'pyblisher.datasource.id': 'id'})
     def update_source(
         self,
         id: str,
@@ -389,75 +426,130 @@ class Project:
         """
         Update a datasource attributes.
         """
-        # prepare put request data
-        data: dict[str, Any] = {}
-        if name:
-            data['name'] = name
-        if description:
-            data['description'] = description
-        if bbox:
-            data['bbox'] = bbox
-        if properties:
-            data['properties'] = properties
-        if typeProperties:
-            data['typeProperties'] = typeProperties
-        if sourceProperties:
-            data['sourceProperties'] = sourceProperties
-
         response: Response = self._api.put(
             endpoint=self._endpoint + 'datasource/' + id,
-            json=data,
-        )
-        match response.status_code:
-            case 200:  # OK
-                return from_dict(
-                    data_class=Source,
-                    data=response.json(),
-                    config=settings.dacite_config,
-                )
-            case 400:  # Match failed
-                raise MatchFailed(
-                    f'{response.status_code} - {response.json()["reason"]}'
-                )
-            case 401:  # Authentication failed
-                raise AuthenticationError(
-                    f'{response.status_code} - {response.json()["reason"]}'
-                )
-            case 403:  # Permission denied
-                raise PermissionError(
-                    f'{response.status_code} - {response.json()["reason"]}'
-                )
-            case 404:  # Object not Found
-                raise ObjectNotFound(
-                    f'{response.status_code} - {response.json()["reason"]}'
-                )
-            case 500:  # Internal server error
-                raise InternalServerError(
-                    f'{response.status_code} - {response.json()["reason"]}'
-                )
-            case _:
-                raise Exception(
-                    f'Unexpected status code - {response.status_code}: {response.__dict__}'
-                )
+            json=self._request_data(
+                SOURCE_REQUIRED,
+                name=name,
+                sourceProperties=sourceProperties,
+                typeProperties=typeProperties,
+                description=description,
+                bbox=bbox,
+                properties=properties,
+            ),
+        )
+        return self._source(
+            validate_response(response, 200, 'update datasource')
+        )
 
-    def get_sources(self):
+    @traced('Project.aupdate_source', {'pyblisher.datasource.id': 'id'})
+    async def aupdate_source(
+        self,
+        id: str,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        bbox: Optional[list] = None,
+        properties: Optional[dict] = None,
+        typeProperties: Optional[dict] = None,
+        sourceProperties: Optional[dict] = None,
+        overwriteParameters: Optional[bool] = False,
+    ):
         """
-        Get all datasources for this project.
+        Update a datasource attributes asynchronously.
         """
-        response: Response = self._api.get(
-            endpoint=self._endpoint + 'datasources/'
+        response: Response = await self._aapi.put(
+            endpoint=self._endpoint + 'datasource/' + id,
+            json=self._request_data(
+                SOURCE_REQUIRED,
+                name=name,
+                sourceProperties=sourceProperties,
+                typeProperties=typeProperties,
+                description=description,
+                bbox=bbox,
+                properties=properties,
+            ),
+        )
+        return self._source(
+            validate_response(response, 200, 'update datasource')
+        )
+
+    @traced('Project.get_sources')
+    def get_sources(
+        self,
+        limit: int = PAGE_SIZE,
+        concurrency: int = CONCURRENCY,
+        lazy: bool = False,
+    ):
+        """
+        Get all datasources for this project. The pages after the first one
+        are requested concurrently.
+
+        :param limit: page size (1 - 1000)
+        :type limit: int
+        :param concurrency: maximum number of concurrent page requests
+        :type concurrency: int
+        :param lazy: create lazy objects, which decode their fields on the
+            first access, see `pyblisher.decode.decode_lazy`
+        :type lazy: bool
+        """
+        return self.iter_sources(limit=limit, lazy=lazy).all(concurrency)
+
+    @traced('Project.aget_sources')
+    async def aget_sources(
+        self,
+        limit: int = PAGE_SIZE,
+        concurrency: int = CONCURRENCY,
+        lazy: bool = False,
+    ):
+        """
+        Get all datasources for this project asynchronously.
+        See `get_sources` for the parameters.
+        """
+        return await self.aiter_sources(limit=limit, lazy=lazy).all(concurrency)
+
+    def iter_sources(
+        self, limit: int = PAGE_SIZE, prefetch: bool = False, lazy: bool = False
+    ) -> Paginator[Source]:
+        """
+        Iterate lazily over the datasources of this project, page by page.
+
+        :param limit: page size (1 - 1000)
+        :type limit: int
+        :param prefetch: request the following page in the background
+        :type prefetch: bool
+        :param lazy: create lazy objects, which decode their fields on the
+            first access, see `pyblisher.decode.decode_lazy`
+        :type lazy: bool
+        :return: iterator over datasources
+        :rtype: Paginator[Source]
+        """
+        return Paginator(
+            api=self._api,
+            endpoint=self._endpoint + 'datasources/',
+            parse=partial(self._source, lazy=lazy),
+            limit=limit,
+            prefetch=prefetch,
+            action='get datasources',
+        )
+
+    def aiter_sources(
+        self, limit: int = PAGE_SIZE, prefetch: bool = False, lazy: bool = False
+    ) -> AsyncPaginator[Source]:
+        """
+        Iterate lazily and asynchronously over the datasources of this
+        project. See `iter_sources` for the parameters.
+        """
+        return AsyncPaginator(
+            api=self._aapi,
+            endpoint=self._endpoint + 'datasources/',
+            parse=partial(self._source, lazy=lazy),
+            limit=limit,
+            prefetch=prefetch,
+            action='get datasources',
         )
-        datasources = [
-            from_dict(
-                data_class=Source,
-                data=datasource,
-                config=settings.dacite_config,
-            )
-            for datasource in response.json()['items']
-        ]
-        return datasources
 
     ############## Tasks ##############
+    @traced('Project.create_task', {'pyblisher.task.name': 'name'})
     def create_task(
         self,
         name: str,
@@ -475,66 +567,244 @@ class Project:
         """
         Create a task for this project.
         """
-        # prepare post request data
-        data: dict[str, Any] = {
+        response = self._api.post(
+            endpoint=self._endpoint + 'task/',
+            json=self._request_data(
+                TASK_REQUIRED,
+                name=name,
+                parameters=parameters,
+                jobType=jobType,
+                schedule=schedule,
+                labels=labels,
+                tags=tags,
+                debugLevel=debugLevel,
+                priority=priority,
+                description=description,
+                properties=properties,
+                jobVersion=jobVersion,
+            ),
+        )
+        return self._task(validate_response(response, (200, 201), 'create task'))
+
+    @traced('Project.acreate_task', {'pyblisher.task.name': 'name'})
+    async def acreate_task(
+        self,
+        name: str,
+        parameters: dict,
+        jobType: str,
+        schedule: dict,
+        labels: Optional[list[str]] = None,
+        tags: Optional[dict] = None,
+        debugLevel: Optional[int] = None,  # 0-2
+        priority: Optional[float] = None,
+        description: Optional[str] = None,
+        properties: Optional[dict] = None,
+        jobVersion: Optional[str] = None,
+    ):
+        """
+        Create a task for this project asynchronously.
+        """
+        response = await self._aapi.post(
+            endpoint=self._endpoint + 'task/',
+            json=self._request_data(
+                TASK_REQUIRED,
+                name=name,
+                parameters=parameters,
+                jobType=jobType,
+                schedule=schedule,
+                labels=labels,
+                tags=tags,
+                debugLevel=debugLevel,
+                priority=priority,
+                description=description,
+                properties=properties,
+                jobVersion=jobVersion,
+            ),
+        )
+        return self._task(validate_response(response, (200, 201), 'create task'))
+
+    @traced('Project.run_task', {'pyblisher.task.name': 'name'})
+    def run_task(
+        self,
+        name: str,
+        parameters: dict,
+        jobType: str,
+        labels: Optional[list[str]] = None,
+        tags: Optional[dict] = None,
+        debugLevel: Optional[int] = None,  # 0-2
+        priority: Optional[float] = None,
+        description: Optional[str] = None,
+        properties: Optional[dict] = None,
+        jobVersion: Optional[str] = None,
+        timeout: float = SYNC_TIMEOUT,
+        fallback: bool = True,
+        wait_timeout: Optional[float] = None,
+    ) -> TaskResult:
+        """
+        Run a short task and get its result in one request with the
+        synchronous task endpoint (`task/sync`), instead of creating a task
+        and polling its job.
+
+        If the API does not offer synchronous tasks, the task is created
+        with an immediate schedule like `create_task`, and its job is
+        awaited. The created task stays in the project. If the request takes
+        longer than `timeout`, an `httpx.TimeoutException` is raised and the
+        task is not run again, since its job may still run on the server.
+
+        Example:
+            ```
+            result = project.run_task('convert', {...}, jobType='convert')
+            if result.succeeded:
+                print(result.output)
+            ```
+
+        See `create_task` for the attributes of the task.
+
+        :param timeout: seconds, which the synchronous request may take
+        :type timeout: float
+        :param fallback: run the task as job, if the API does not offer
+            synchronous tasks, otherwise raise the error
+        :type fallback: bool
+        :param wait_timeout: seconds until a `TimeoutError` is raised, while
+            the job of the fallback is awaited, None to wait without limit
+        :type wait_timeout: Optional[float]
+        :return: status, output and error of the job
+        :rtype: TaskResult
+        """
+        attributes = {
             'name': name,
             'parameters': parameters,
             'jobType': jobType,
-            'schedule': schedule,
+            'labels': labels,
+            'tags': tags,
+            'debugLevel': debugLevel,
+            'priority': priority,
+            'description': description,
+            'properties': properties,
+            'jobVersion': jobVersion,
         }
-        # add optional parameters
-        if labels:
-            data['labels'] = labels
-        if tags:
-            data['tags'] = tags
-        if debugLevel:
-            data['debugLevel'] = debugLevel
-        if priority:
-            data['priority'] = priority
-        if description:
-            data['description'] = description
-        if properties:
-            data['properties'] = properties
-        if jobVersion:
-            data['jobVersion'] = jobVersion
-
-        # send post request
-        response = self._api.post(endpoint=self._endpoint + 'task/', json=data)
-        # validate response
-        match response.status_code:
-            case 200:  # OK
-                return from_dict(
-                    data_class=Task,
-                    data=response.json(),
-                    config=settings.dacite_config,
-                )
-            case 201:  # Created
-                return from_dict(
-                    data_class=Task,
-                    data=response.json(),
-                    config=settings.dacite_config,
-                )
-            case 400:  # Match failed
-                raise MatchFailed(
-                    f'{response.status_code} - {response.json()["reason"]}'
-                )
-            case 401:  # Authentication failed
-                raise AuthenticationError(
-                    f'{response.status_code} - {response.json()["reason"]}'
-                )
-            case 403:
-                raise PermissionError(
-                    f'{response.status_code} - {response.json()["reason"]}'
-                )
-            case 500:  # Internal server error
-                raise InternalServerError(
-                    f'{response.status_code} - {response.json()["reason"]}'
+        if self._sync_tasks or not fallback:
+            response = self._api.request(
+                'POST',
+                self._endpoint + 'task/sync',
+                json=self._request_data(SYNC_TASK_REQUIRED, **attributes),
+                timeout=timeout,
+            )
+            result = self._sync_result(response, fallback)
+            if result is not None:
+                return result
+        annotate({'pyblisher.task.sync': False})
+        task = self.create_task(
+            name=name,
+            parameters=parameters,
+            jobType=jobType,
+            schedule={'type': 'immediate'},
+            labels=labels,
+            tags=tags,
+            debugLevel=debugLevel,
+            priority=priority,
+            description=description,
+            properties=properties,
+            jobVersion=jobVersion,
+        )
+        backoff = Backoff(timeout=wait_timeout)
+        while True:
+            data = next(iter(task_jobs(self._api, self._id, task._id)), None)
+            if data is not None:
+                break
+            if backoff.expired:
+                raise TimeoutError(
+                    f'Task {task._id} started no job within {wait_timeout} seconds'
                 )
-            case _:
-                raise Exception(
-                    f'Failed to create task. Response: {response.__dict__}'
+            time.sleep(backoff.delay(False))
+        return TaskResult.from_job(self._job(data).wait(backoff.remaining))
+
+    @traced('Project.arun_task', {'pyblisher.task.name': 'name'})
+    async def arun_task(
+        self,
+        name: str,
+        parameters: dict,
+        jobType: str,
+        labels: Optional[list[str]] = None,
+        tags: Optional[dict] = None,
+        debugLevel: Optional[int] = None,  # 0-2
+        priority: Optional[float] = None,
+        description: Optional[str] = None,
+        properties: Optional[dict] = None,
+        jobVersion: Optional[str] = None,
+        timeout: float = SYNC_TIMEOUT,
+        fallback: bool = True,
+        wait_timeout: Optional[float] = None,
+    ) -> TaskResult:
+        """
+        Run a short task asynchronously and get its result. See `run_task`.
+
+        :return: status, output and error of the job
+        :rtype: TaskResult
+        """
+        attributes = {
+            'name': name,
+            'parameters': parameters,
+            'jobType': jobType,
+            'labels': labels,
+            'tags': tags,
+            'debugLevel': debugLevel,
+            'priority': priority,
+            'description': description,
+            'properties': properties,
+            'jobVersion': jobVersion,
+        }
+        if self._sync_tasks or not fallback:
+            response = await self._aapi.request(
+                'POST',
+                self._endpoint + 'task/sync',
+                json=self._request_data(SYNC_TASK_REQUIRED, **attributes),
+                timeout=timeout,
+            )
+            result = self._sync_result(response, fallback)
+            if result is not None:
+                return result
+        annotate({'pyblisher.task.sync': False})
+        task = await self.acreate_task(
+            name=name,
+            parameters=parameters,
+            jobType=jobType,
+            schedule={'type': 'immediate'},
+            labels=labels,
+            tags=tags,
+            debugLevel=debugLevel,
+            priority=priority,
+            description=description,
+            properties=properties,
+            jobVersion=jobVersion,
+        )
+        backoff = Backoff(timeout=wait_timeout)
+        while True:
+            async for data in atask_jobs(self._aapi, self._id, task._id):
+                job = await self._job(data).await_(backoff.remaining)
+                return TaskResult.from_job(job)
+            if backoff.expired:
+                raise TimeoutError(
+                    f'Task {task._id} started no job within {wait_timeout} seconds'
                 )
+            await asyncio.sleep(backoff.delay(False))
+
+    def _sync_result(self, response: Response, fallback: bool) -> Optional[TaskResult]:
+        """
+        Read the response of a synchronous task. If the API does not offer
+        synchronous tasks, they are not requested again by this project.
+
+        :return: result, or None if the task has to be run as job
+        :rtype: Optional[TaskResult]
+        """
+        if response.status_code in SYNC_UNSUPPORTED and fallback:
+            self._sync_tasks = False
+            return None
+        data = response_json(validate_response(response, 200, 'run task'))
+        annotate({'pyblisher.task.sync': True})
+        return TaskResult(data['status'], data.get('output'), data.get('error'))
 
+    @traced('Project.get_task', {'pyblisher.task.id': 'id'})
     def get_task(self, id: str):
         """
         Get a task for this project.
@@ -542,30 +812,19 @@ class Project:
         response: Response = self._api.get(
             endpoint=self._endpoint + f'task/{id}/'
         )
-        match response.status_code:
-            case 200:
-                return from_dict(
-                    data_class=Task,
-                    data=response.json(),
-                    config=settings.dacite_config,
-                )
-            case 401:
-                raise AuthenticationError(
-                    f'{response.status_code} - {response.json()["reason"]}'
-                )
-            case 403:  # Permission denied
-                raise PermissionError(
-                    f'{response.status_code} - {response.json()["reason"]}'
-                )
-            case 404:
-                raise ObjectNotFound(
-                    f'{response.status_code} - {response.json()["reason"]}'
-                )
-            case _:
-                raise Exception(
-                    f'Failed to get task. Response: {response.__dict__}'
-                )
+        return self._task(validate_response(response, 200, 'get task'))
+
+    @traced('Project.aget_task', {'pyblisher.task.id': 'id'})
+    async def aget_task(self, id: str):
+        """
+        Get a task for this project asynchronously.
+        """
+        response: Response = await self._aapi.get(
+            endpoint=self._endpoint + f'task/{id}/'
+        )
+        return self._task(validate_response(response, 200, 'get task'))
 
+    @traced('Project.update_task', {'pyblisher.task.id': 'id'})
     def update_task(
         self,
         id: str,
@@ -608,80 +867,340 @@ class Project:
         :return: updated task
         :rtype: Task
         """
-        # prepare put request data
-        data: dict[str, Any] = {}
-        if labels:
-            data['labels'] = labels
-        if tags:
-            data['tags'] = tags
-        if debugLevel:
-            data['debugLevel'] = debugLevel
-        if priority:
-            data['priority'] = priority
-        if name:
-            data['name'] = name
-        if description:
-            data['description'] = description
-        if parameters:
-            data['parameters'] = parameters
-        if properties:
-            data['properties'] = properties
-        if schedule:
-            data['schedule'] = schedule
-
-        # send put request
         response: Response = self._api.put(
             endpoint=self._endpoint + f'task/{id}/',
-            json=data,
+            json=self._request_data(
+                TASK_REQUIRED,
+                labels=labels,
+                tags=tags,
+                debugLevel=debugLevel,
+                priority=priority,
+                name=name,
+                description=description,
+                parameters=parameters,
+                properties=properties,
+                schedule=schedule,
+            ),
             params={'overwriteParameters': overwriteParameters},
         )
+        return self._task(validate_response(response, 200, 'update task'))
 
-        # validate response
-        match response.status_code:
-            case 200:  # OK
-                return from_dict(
-                    data_class=Task,
-                    data=response.json(),
-                    config=settings.dacite_config,
-                )
-            case 400:  # Match failed
-                raise MatchFailed(
-                    f'{response.status_code} - {response.json()["reason"]}'
-                )
-            case 401:  # Authentication failed
-                raise AuthenticationError(
-                    f'{response.status_code} - {response.json()["reason"]}'
-                )
-            case 403:  # Permission denied
-                raise PermissionError(
-                    f'{response.status_code} - {response.json()["reason"]}'
-                )
-            case 500:  # Internal server error
-                raise InternalServerError(
-                    f'{response.status_code} - {response.json()["reason"]}'
-                )
-            case _:  # All other cases
-                raise Exception(
-                    f'Failed to update task. Response: {response.__dict__}'
-                )
+    @traced('Project.aupdate_task', {'pyblisher.task.id': 'id'})
+    async def aupdate_task(
+        self,
+        id: str,
+        labels: Optional[list] = None,
+        tags: Optional[dict] = None,
+        debugLevel: Optional[int] = None,  # 0-2
+        priority: Optional[int] = None,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        parameters: Optional[dict] = None,
+        properties: Optional[dict] = None,
+        schedule: Optional[dict] = None,
+        overwriteParameters: Optional[bool] = False,
+    ):
+        """
+        Update a task of this project asynchronously.
+        See `update_task` for the parameters.
+        """
+        response: Response = await self._aapi.put(
+            endpoint=self._endpoint + f'task/{id}/',
+            json=self._request_data(
+                TASK_REQUIRED,
+                labels=labels,
+                tags=tags,
+                debugLevel=debugLevel,
+                priority=priority,
+                name=name,
+                description=description,
+                parameters=parameters,
+                properties=properties,
+                schedule=schedule,
+            ),
+            params={'overwriteParameters': overwriteParameters},
+        )
+        return self._task(validate_response(response, 200, 'update task'))
 
-    def get_tasks(self, filters: dict | None = None):
+    @traced('Project.get_tasks')
+    def get_tasks(
+        self,
+        filters: dict | None = None,
+        limit: int = PAGE_SIZE,
+        concurrency: int = CONCURRENCY,
+        lazy: bool = False,
+    ):
         """
-        Get all tasks for this project.
+        Get all tasks for this project. The pages after the first one are
+        requested concurrently.
+
+        :param filters: query parameters to filter the tasks
+        :type filters: dict | None
+        :param limit: page size (1 - 1000)
+        :type limit: int
+        :param concurrency: maximum number of concurrent page requests
+        :type concurrency: int
+        :param lazy: create lazy objects, which decode their fields on the
+            first access, see `pyblisher.decode.decode_lazy`
+        :type lazy: bool
         """
-        response: Response = self._api.get(
+        return self.iter_tasks(filters=filters, limit=limit, lazy=lazy).all(
+            concurrency
+        )
+
+    @traced('Project.aget_tasks')
+    async def aget_tasks(
+        self,
+        filters: dict | None = None,
+        limit: int = PAGE_SIZE,
+        concurrency: int = CONCURRENCY,
+        lazy: bool = False,
+    ):
+        """
+        Get all tasks for this project asynchronously.
+        See `get_tasks` for the parameters.
+        """
+        return await self.aiter_tasks(
+            filters=filters, limit=limit, lazy=lazy
+        ).all(concurrency)
+
+    def iter_tasks(
+        self,
+        filters: dict | None = None,
+        limit: int = PAGE_SIZE,
+        prefetch: bool = False,
+        lazy: bool = False,
+    ) -> Paginator[Task]:
+        """
+        Iterate lazily over the tasks of this project, page by page.
+
+        :param filters: query parameters to filter the tasks
+        :type filters: dict | None
+        :param limit: page size (1 - 1000)
+        :type limit: int
+        :param prefetch: request the following page in the background
+        :type prefetch: bool
+        :param lazy: create lazy objects, which decode their fields on the
+            first access, see `pyblisher.decode.decode_lazy`
+        :type lazy: bool
+        :return: iterator over tasks
+        :rtype: Paginator[Task]
+        """
+        return Paginator(
+            api=self._api,
             endpoint=self._endpoint + 'tasks/',
+            parse=partial(self._task, lazy=lazy),
             params=filters,
+            limit=limit,
+            prefetch=prefetch,
+            action='get tasks',
         )
-        tasks = [
-            from_dict(
-                data_class=Task,
-                data=task,
-                config=settings.dacite_config,
-            )
-            for task in response.json()['items']
-        ]
-        return tasks
+
+    def aiter_tasks(
+        self,
+        filters: dict | None = None,
+        limit: int = PAGE_SIZE,
+        prefetch: bool = False,
+        lazy: bool = False,
+    ) -> AsyncPaginator[Task]:
+        """
+        Iterate lazily and asynchronously over the tasks of this project.
+        See `iter_tasks` for the parameters.
+        """
+        return AsyncPaginator(
+            api=self._aapi,
+            endpoint=self._endpoint + 'tasks/',
+            parse=partial(self._task, lazy=lazy),
+            params=filters,
+            limit=limit,
+            prefetch=prefetch,
+            action='get tasks',
+        )
+
+    ############## Jobs ##############
+    @traced('Project.get_job', {'pyblisher.job.id': 'id'})
+    def get_job(self, id: str) -> Job:
+        """
+        Get a job of this project.
+
+        :param id: job id
+        :type id: str
+        :return: job
+        :rtype: Job
+        """
+        return self._job(get_job_data(self._api, self._id, id))
+
+    @traced('Project.aget_job', {'pyblisher.job.id': 'id'})
+    async def aget_job(self, id: str) -> Job:
+        """
+        Get a job of this project asynchronously.
+
+        :param id: job id
+        :type id: str
+        :return: job
+        :rtype: Job
+        """
+        return self._job(await aget_job_data(self._aapi, self._id, id))
+
+    @traced('Project.get_jobs')
+    def get_jobs(
+        self,
+        filters: dict | None = None,
+        limit: int = PAGE_SIZE,
+        concurrency: int = CONCURRENCY,
+        lazy: bool = False,
+    ) -> list[Job]:
+        """
+        Get all jobs of this project. The pages after the first one are
+        requested concurrently.
+
+        :param filters: query parameters to filter the jobs, e.g. `taskId`,
+            `status` or `startTime` with an operator like `gte:<date>`
+        :type filters: dict | None
+        :param limit: page size (1 - 1000)
+        :type limit: int
+        :param concurrency: maximum number of concurrent page requests
+        :type concurrency: int
+        :param lazy: create lazy objects, which decode their fields on the
+            first access, see `pyblisher.decode.decode_lazy`
+        :type lazy: bool
+        :return: list of jobs
+        :rtype: list[Job]
+        """
+        return self.iter_jobs(filters=filters, limit=limit, lazy=lazy).all(
+            concurrency
+        )
+
+    @traced('Project.aget_jobs')
+    async def aget_jobs(
+        self,
+        filters: dict | None = None,
+        limit: int = PAGE_SIZE,
+        concurrency: int = CONCURRENCY,
+        lazy: bool = False,
+    ) -> list[Job]:
+        """
+        Get all jobs of this project asynchronously.
+        See `get_jobs` for the parameters.
+        """
+        return await self.aiter_jobs(
+            filters=filters, limit=limit, lazy=lazy
+        ).all(concurrency)
+
+    def iter_jobs(
+        self,
+        filters: dict | None = None,
+        limit: int = PAGE_SIZE,
+        prefetch: bool = False,
+        lazy: bool = False,
+    ) -> Paginator[Job]:
+        """
+        Iterate lazily over the jobs of this project, page by page. Job
+        lists are not taken from the response cache, as jobs change on the
+        server.
+
+        :param filters: query parameters to filter the jobs
+        :type filters: dict | None
+        :param limit: page size (1 - 1000)
+        :type limit: int
+        :param prefetch: request the following page in the background
+        :type prefetch: bool
+        :param lazy: create lazy objects, which decode their fields on the
+            first access, see `pyblisher.decode.decode_lazy`
+        :type lazy: bool
+        :return: iterator over jobs
+        :rtype: Paginator[Job]
+        """
+        return Paginator(
+            api=self._api,
+            endpoint=self._endpoint + 'jobs/',
+            parse=partial(self._job, lazy=lazy),
+            params=filters,
+            limit=limit,
+            prefetch=prefetch,
+            action='get jobs',
+            cache=False,
+        )
+
+    def aiter_jobs(
+        self,
+        filters: dict | None = None,
+        limit: int = PAGE_SIZE,
+        prefetch: bool = False,
+        lazy: bool = False,
+    ) -> AsyncPaginator[Job]:
+        """
+        Iterate lazily and asynchronously over the jobs of this project.
+        See `iter_jobs` for the parameters.
+        """
+        return AsyncPaginator(
+            api=self._aapi,
+            endpoint=self._endpoint + 'jobs/',
+            parse=partial(self._job, lazy=lazy),
+            params=filters,
+            limit=limit,
+            prefetch=prefetch,
+            action='get jobs',
+            cache=False,
+        )
+
+    ############## Request Data ##############
+    @staticmethod
+    def _request_data(
+        required: tuple[str, ...] = (), **attributes
+    ) -> dict[str, Any]:
+        """
+        Prepare the request body of create and update requests. Required
+        attributes are sent whenever they are given, optional ones only if
+        they are set.
+
+        :param required: names of the required attributes
+        :type required: tuple[str, ...]
+        :return: request body
+        :rtype: dict
+        """
+        return {
+            key: value
+            for key, value in attributes.items()
+            if value or (key in required and value is not None)
+        }
+
+    ############## Response Data ##############
+    def _bucket(self, data: Response | dict, lazy: bool = False) -> Bucket:
+        """
+        Create a Bucket from a response or a list item.
+        """
+        data = response_json(data) if isinstance(data, Response) else data
+        return self._bind(decode_lazy(Bucket, data) if lazy else decode(Bucket, data))
+
+    def _source(self, data: Response | dict, lazy: bool = False) -> Source:
+        """
+        Create a Source from a response or a list item.
+        """
+        data = response_json(data) if isinstance(data, Response) else data
+        return self._bind(decode_lazy(Source, data) if lazy else decode(Source, data))
+
+    def _task(self, data: Response | dict, lazy: bool = False) -> Task:
+        """
+        Create a Task from a response or a list item.
+        """
+        data = response_json(data) if isinstance(data, Response) else data
+        return self._bind(decode_lazy(Task, data) if lazy else decode(Task, data))
+
+    def _job(self, data: Response | dict, lazy: bool = False) -> Job:
+        """
+        Create a Job from a response or a list item.
+        """
+        data = response_json(data) if isinstance(data, Response) else data
+        return self._bind(decode_lazy(Job, data) if lazy else decode(Job, data))
+
+    def _bind(self, resource):
+        """
+        Let a resource of this project use the API clients of the project.
+        """
+        resource._api = self._api
+        resource._aapi = self._aapi
+        return resource
 
     ############## Dunder Methods ##############
     def __post_init__(self):
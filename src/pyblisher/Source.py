@@ -1,9 +1,23 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Literal, Optional
+from typing import Iterable, Literal, Optional
 
-from .client import client
-from .types import ApiClientProtocol, SourceProperty
+from httpx import Response
+
+from .client import aclient, client
+from .decode import decode, response_json
+from .helpers import validate_response
+from .Job import Job, await_jobs, wait_jobs
+from .polling import MAX_POLL_INTERVAL, POLL_INTERVAL, Backoff
+from .Task import Task
+from .tracing import annotate, propagated, traced
+from .types import ApiClientProtocol, AsyncApiClientProtocol, SourceProperty
+
+# default number of datasources, which are published at the same time
+PUBLISH_WORKERS: int = 8
 
 
 @dataclass
@@ -14,6 +28,9 @@ class Source:
 
     # Internal attributes
     _api: ApiClientProtocol = field(default=client, init=False, repr=False)
+    _aapi: AsyncApiClientProtocol = field(
+        default=aclient, init=False, repr=False
+    )
     _endpoint: str = field(init=False, repr=False)
 
     # required api attributes
@@ -46,18 +63,140 @@ class Source:
     description: Optional[str] = ''
     bbox: Optional[list[float]] = None
 
+    ############## Publishing ##############
+    @traced('Source.publish')
     def publish(
         self,
         credentialsId: str,
         destination: str,
-        numThreads: Optional[int],
-        gzip: Optional[bool],
-    ):
+        numThreads: Optional[int] = None,
+        gzip: Optional[bool] = None,
+    ) -> 'Publication':
+        """
+        Publish the datasource with the given parameters. The API creates a
+        publish task, whose job copies the data to the destination.
+
+        Example:
+            ```
+            publication = source.publish(<credentials id>, 's3://bucket/city/')
+            publication.wait(timeout=3600)
+            print(publication.succeeded)
+            ```
+
+        :param credentialsId: id of the credentials of the destination
+        :type credentialsId: str
+        :param destination: destination of the data
+        :type destination: str
+        :param numThreads: number of threads, which copy the data, default
+            is the setting of the server
+        :type numThreads: Optional[int]
+        :param gzip: compress the published files
+        :type gzip: Optional[bool]
+        :return: handle of the publish task and its job
+        :rtype: Publication
+        """
+        response = self._api.put(
+            endpoint=self._endpoint + 'publish',
+            json=publish_body(credentialsId, destination, numThreads, gzip),
+        )
+        validate_response(response, 200, 'publish')
+        return Publication(self, self._task(response))
+
+    @traced('Source.apublish')
+    async def apublish(
+        self,
+        credentialsId: str,
+        destination: str,
+        numThreads: Optional[int] = None,
+        gzip: Optional[bool] = None,
+    ) -> 'Publication':
+        """
+        Publish the datasource asynchronously. See `publish`.
+
+        :return: handle of the publish task and its job
+        :rtype: Publication
+        """
+        response = await self._aapi.put(
+            endpoint=self._endpoint + 'publish',
+            json=publish_body(credentialsId, destination, numThreads, gzip),
+        )
+        validate_response(response, 200, 'publish')
+        return Publication(self, self._task(response))
+
+    @traced('Source.get_publication')
+    def get_publication(self, taskId: Optional[str] = None) -> Optional['Publication']:
+        """
+        Get a publish task of the datasource and its last job.
+
+        :param taskId: id of the publish task, default is the latest one
+        :type taskId: Optional[str]
+        :return: publication, or None if the datasource was never published
+        :rtype: Optional[Publication]
+        """
+        response = self._api.request(
+            'GET',
+            self._endpoint + 'publish',
+            params=publish_params(taskId),
+            cache=False,
+        )
+        data = response_json(validate_response(response, 200, 'get publication'))
+        if not data or not data.get('task'):
+            return None
+        return Publication(self, self._task(data['task']))._update(data)
+
+    @traced('Source.aget_publication')
+    async def aget_publication(
+        self, taskId: Optional[str] = None
+    ) -> Optional['Publication']:
+        """
+        Get a publish task of the datasource and its last job asynchronously.
+        See `get_publication`.
+        """
+        response = await self._aapi.request(
+            'GET',
+            self._endpoint + 'publish',
+            params=publish_params(taskId),
+            cache=False,
+        )
+        data = response_json(validate_response(response, 200, 'get publication'))
+        if not data or not data.get('task'):
+            return None
+        return Publication(self, self._task(data['task']))._update(data)
+
+    @traced('Source.abort_publish')
+    def abort_publish(self) -> None:
+        """
+        Abort the last publish job of the datasource, if it is running.
+        """
+        response = self._api.delete(endpoint=self._endpoint + 'publish')
+        validate_response(response, 204, 'abort publish')
+
+    @traced('Source.aabort_publish')
+    async def aabort_publish(self) -> None:
+        """
+        Abort the last publish job of the datasource asynchronously.
+        """
+        response = await self._aapi.delete(endpoint=self._endpoint + 'publish')
+        validate_response(response, 204, 'abort publish')
+
+    ############## Response Data ##############
+    def _task(self, data: Response | dict) -> Task:
         """
-        Not implemented yet.
-        Publish the datasource with the given parameters.
+        Create a Task, which uses the API clients of the datasource.
         """
-        pass
+        task = decode(Task, response_json(data) if isinstance(data, Response) else data)
+        task._api = self._api
+        task._aapi = self._aapi
+        return task
+
+    def _job(self, data: dict) -> Job:
+        """
+        Create a Job, which uses the API clients of the datasource.
+        """
+        job = decode(Job, data)
+        job._api = self._api
+        job._aapi = self._aapi
+        return job
 
     ############## Dunder Methods ##############
     def __post_init__(self):
@@ -68,3 +207,336 @@ class Source:
 
     def __str__(self) -> str:
         return self._id
+
+
+def publish_body(
+    credentialsId: str,
+    destination: str,
+    numThreads: Optional[int],
+    gzip: Optional[bool],
+) -> dict:
+    """
+    Prepare the body of a publish request.
+    """
+    body: dict = {'credentialsId': credentialsId, 'destination': destination}
+    if numThreads is not None:
+        body['numThreads'] = numThreads
+    if gzip is not None:
+        body['gzip'] = gzip
+    return body
+
+
+def publish_params(taskId: Optional[str]) -> Optional[dict]:
+    """
+    Prepare the query parameters of the publish endpoint.
+    """
+    return {'taskId': taskId} if taskId else None
+
+
+@dataclass
+class Publication:
+    """
+    Handle of a publish task of a datasource. The job of the task is
+    created by the API after the task, so it is None, until it is known.
+    `wait` and `await_` request the publish endpoint until the job exists,
+    and then wait for the job like `wait_jobs`.
+
+    :attr source: published datasource
+    :atype source: Source
+    :attr task: publish task
+    :atype task: Task
+    :attr job: job of the task, None until it was created
+    :atype job: Optional[Job]
+    """
+
+    source: Source
+    task: Task
+    job: Optional[Job] = None
+
+    @property
+    def done(self) -> bool:
+        """
+        True, if the publish job finished, failed, was cancelled or timed out.
+        """
+        return self.job is not None and self.job.done
+
+    @property
+    def succeeded(self) -> bool:
+        """
+        True, if the publish job finished successfully.
+        """
+        return self.job is not None and self.job.succeeded
+
+    @traced('Publication.refresh')
+    def refresh(self) -> 'Publication':
+        """
+        Request the current state of the publish task and its job.
+
+        :return: the publication itself
+        :rtype: Publication
+        """
+        response = self.source._api.request(
+            'GET',
+            self.source._endpoint + 'publish',
+            params=publish_params(self.task._id),
+            cache=False,
+        )
+        validate_response(response, 200, 'get publication')
+        return self._update(response_json(response))
+
+    @traced('Publication.arefresh')
+    async def arefresh(self) -> 'Publication':
+        """
+        Request the current state of the publish task and its job
+        asynchronously.
+
+        :return: the publication itself
+        :rtype: Publication
+        """
+        response = await self.source._aapi.request(
+            'GET',
+            self.source._endpoint + 'publish',
+            params=publish_params(self.task._id),
+            cache=False,
+        )
+        validate_response(response, 200, 'get publication')
+        return self._update(response_json(response))
+
+    def wait(
+        self,
+        timeout: Optional[float] = None,
+        abort: bool = False,
+        interval: float = POLL_INTERVAL,
+        max_interval: float = MAX_POLL_INTERVAL,
+    ) -> 'Publication':
+        """
+        Wait until the publish job is done. See `wait_publications`.
+
+        :return: the publication itself, with its job in the final state
+        :rtype: Publication
+        """
+        return wait_publications([self], timeout, abort, interval, max_interval)[0]
+
+    async def await_(
+        self,
+        timeout: Optional[float] = None,
+        abort: bool = False,
+        interval: float = POLL_INTERVAL,
+        max_interval: float = MAX_POLL_INTERVAL,
+    ) -> 'Publication':
+        """
+        Wait asynchronously until the publish job is done. See
+        `await_publications`.
+
+        :return: the publication itself, with its job in the final state
+        :rtype: Publication
+        """
+        publications = await await_publications(
+            [self], timeout, abort, interval, max_interval
+        )
+        return publications[0]
+
+    def abort(self) -> None:
+        """
+        Abort the publish job. If the job is not known yet, the publication
+        is refreshed first. If the task did not create its job yet, nothing
+        is aborted, because the last publish job of the datasource may
+        belong to another publication.
+        """
+        if self.job is None:
+            self.refresh()
+        if self.job is not None:
+            self.job.abort()
+
+    async def aabort(self) -> None:
+        """
+        Abort the publish job asynchronously. See `abort`.
+        """
+        if self.job is None:
+            await self.arefresh()
+        if self.job is not None:
+            await self.job.aabort()
+
+    def _update(self, data: dict) -> 'Publication':
+        """
+        Take the job of a response of the publish endpoint.
+        """
+        job = (data or {}).get('job')
+        if job is None:
+            return self
+        if self.job is None or self.job._id != job['_id']:
+            self.job = self.source._job(job)
+        else:
+            self.job._update(job)
+        return self
+
+
+############## Publishing many datasources ##############
+def publish_sources(
+    sources: Iterable[Source],
+    credentialsId: str,
+    destination: str,
+    numThreads: Optional[int] = None,
+    gzip: Optional[bool] = None,
+    workers: int = PUBLISH_WORKERS,
+) -> list[Publication]:
+    """
+    Publish many datasources with concurrent requests. See `Source.publish`
+    for the parameters.
+
+    Example:
+        ```
+        publications = publish_sources(
+            project.get_sources(), <credentials id>, 's3://bucket/', gzip=True
+        )
+        wait_publications(publications, timeout=3600)
+        ```
+
+    :param sources: datasources to publish
+    :type sources: Iterable[Source]
+    :param workers: number of concurrent publish requests
+    :type workers: int
+    :return: publications in the order of the datasources
+    :rtype: list[Publication]
+    """
+
+    def publish(source: Source) -> Publication:
+        return source.publish(credentialsId, destination, numThreads, gzip)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        publications = list(executor.map(propagated(publish), sources))
+    annotate({'pyblisher.publications': len(publications)})
+    return publications
+
+
+async def apublish_sources(
+    sources: Iterable[Source],
+    credentialsId: str,
+    destination: str,
+    numThreads: Optional[int] = None,
+    gzip: Optional[bool] = None,
+    workers: int = PUBLISH_WORKERS,
+) -> list[Publication]:
+    """
+    Publish many datasources asynchronously. See `publish_sources`.
+
+    :return: publications in the order of the datasources
+    :rtype: list[Publication]
+    """
+    semaphore = asyncio.Semaphore(max(1, workers))
+
+    async def publish(source: Source) -> Publication:
+        async with semaphore:
+            return await source.apublish(credentialsId, destination, numThreads, gzip)
+
+    return list(await asyncio.gather(*(publish(source) for source in sources)))
+
+
+def wait_publications(
+    publications: Iterable[Publication],
+    timeout: Optional[float] = None,
+    abort: bool = False,
+    interval: float = POLL_INTERVAL,
+    max_interval: float = MAX_POLL_INTERVAL,
+) -> list[Publication]:
+    """
+    Wait until the jobs of all publications are done. The publish endpoints
+    are requested only until the jobs are created, after that the jobs are
+    refreshed like in `wait_jobs`.
+
+    :param publications: publications to wait for
+    :type publications: Iterable[Publication]
+    :param timeout: seconds until a `TimeoutError` is raised, None to wait
+        without limit
+    :type timeout: Optional[float]
+    :param abort: abort the unfinished jobs, if the timeout expires or the
+        waiting is interrupted
+    :type abort: bool
+    :param interval: first interval between status requests in seconds
+    :type interval: float
+    :param max_interval: longest interval between status requests
+    :type max_interval: float
+    :return: the publications with their jobs in the final states
+    :rtype: list[Publication]
+    """
+    publications = list(publications)
+    backoff = Backoff(interval, max_interval, timeout)
+    waiting = [
+        publication for publication in publications if publication.job is None
+    ]
+    try:
+        while waiting:
+            if backoff.expired:
+                raise TimeoutError(
+                    f'{len(waiting)} publish job(s) not created after {timeout} seconds'
+                )
+            time.sleep(backoff.delay(False))
+            for publication in waiting:
+                publication.refresh()
+            waiting = [
+                publication for publication in waiting if publication.job is None
+            ]
+    except (TimeoutError, KeyboardInterrupt):
+        if abort:
+            for publication in publications:
+                if not publication.done:
+                    publication.abort()
+        raise
+    wait_jobs(
+        [publication.job for publication in publications],  # type: ignore[misc]
+        backoff.remaining,
+        abort,
+        interval,
+        max_interval,
+    )
+    return publications
+
+
+async def await_publications(
+    publications: Iterable[Publication],
+    timeout: Optional[float] = None,
+    abort: bool = False,
+    interval: float = POLL_INTERVAL,
+    max_interval: float = MAX_POLL_INTERVAL,
+) -> list[Publication]:
+    """
+    Wait asynchronously until the jobs of all publications are done. The
+    publish endpoints are requested concurrently. If `abort` is True, the
+    unfinished jobs are also aborted, when the waiting task is cancelled.
+    See `wait_publications` for the parameters.
+    """
+    publications = list(publications)
+    backoff = Backoff(interval, max_interval, timeout)
+    waiting = [
+        publication for publication in publications if publication.job is None
+    ]
+    try:
+        while waiting:
+            if backoff.expired:
+                raise TimeoutError(
+                    f'{len(waiting)} publish job(s) not created after {timeout} seconds'
+                )
+            await asyncio.sleep(backoff.delay(False))
+            await asyncio.gather(*(publication.arefresh() for publication in waiting))
+            waiting = [
+                publication for publication in waiting if publication.job is None
+            ]
+    except (TimeoutError, asyncio.CancelledError):
+        if abort:
+            await asyncio.gather(
+                *(
+                    publication.aabort()
+                    for publication in publications
+                    if not publication.done
+                )
+            )
+        raise
+    await await_jobs(
+        [publication.job for publication in publications],  # type: ignore[misc]
+        backoff.remaining,
+        abort,
+        interval,
+        max_interval,
+    )
+    return publications
+
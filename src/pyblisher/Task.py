@@ -2,8 +2,11 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
-from .client import ApiClient, client
-from .types import Schedule
+from .client import aclient, client
+from .decode import decode
+from .Job import Job, aget_job_data, get_job_data
+from .polling import JobStatus
+from .types import ApiClientProtocol, AsyncApiClientProtocol, Schedule
 
 
 @dataclass
@@ -16,7 +19,9 @@ class Task:
     for the object to work. They might not be initialized.
 
     :attribute _api: The API client
-    :atype _api: ApiClient
+    :atype _api: ApiClientProtocol
+    :attribute _aapi: The asynchronous API client
+    :atype _aapi: AsyncApiClientProtocol
     :attribute _endpoint: The API endpoint
     :atype _endpoint: str
 
@@ -64,7 +69,10 @@ class Task:
     """
 
     # Internal attributes
-    _api: ApiClient = field(default=client, init=False, repr=False)
+    _api: ApiClientProtocol = field(default=client, init=False, repr=False)
+    _aapi: AsyncApiClientProtocol = field(
+        default=aclient, init=False, repr=False
+    )
     _endpoint: str = field(init=False, repr=False)
 
     # Required attributes
@@ -90,6 +98,40 @@ class Task:
     lastJobId: Optional[str]
     lastJob: Optional[dict]
 
+    ############## Jobs ##############
+    def get_last_job(self) -> Optional[Job]:
+        """
+        Get the last job of the task with its current state.
+
+        :return: job, or None if the task did not run yet
+        :rtype: Optional[Job]
+        """
+        if not self.lastJobId:
+            return None
+        return self._job(get_job_data(self._api, self.projectId, self.lastJobId))
+
+    async def aget_last_job(self) -> Optional[Job]:
+        """
+        Get the last job of the task asynchronously.
+
+        :return: job, or None if the task did not run yet
+        :rtype: Optional[Job]
+        """
+        if not self.lastJobId:
+            return None
+        return self._job(
+            await aget_job_data(self._aapi, self.projectId, self.lastJobId)
+        )
+
+    def _job(self, data: dict) -> Job:
+        """
+        Create a Job, which uses the API clients of the task.
+        """
+        job = decode(Job, data)
+        job._api = self._api
+        job._aapi = self._aapi
+        return job
+
     ############## Dunder Methods ##############
     def __post_init__(self):
         """
@@ -102,3 +144,39 @@ class Task:
         String representation of the Task object as its id.
         """
         return self._id
+
+
+@dataclass
+class TaskResult:
+    """
+    Result of a task, which was run with `Project.run_task`.
+
+    :attr status: status of the job, see `JobStatus`
+    :atype status: int
+    :attr output: outputs of the job
+    :atype output: Optional[dict]
+    :attr error: error message of a failed job
+    :atype error: Optional[str]
+    :attr job: job of the task, if it ran on the asynchronous path, None if
+        it ran synchronously
+    :atype job: Optional[Job]
+    """
+
+    status: int
+    output: Optional[dict] = None
+    error: Optional[str] = None
+    job: Optional[Job] = None
+
+    @property
+    def succeeded(self) -> bool:
+        """
+        True, if the job finished successfully.
+        """
+        return self.status == JobStatus.FINISHED
+
+    @classmethod
+    def from_job(cls, job: Job) -> 'TaskResult':
+        """
+        Create the result of a job, which is done.
+        """
+        return cls(int(job.status or 0), job.outputs, job.errorMessage, job)
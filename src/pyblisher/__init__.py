@@ -1,6 +1,25 @@
 from .Bucket import Bucket as Bucket
+from .client import ApiClient as ApiClient
+from .client import AsyncApiClient as AsyncApiClient
+from .core import aget_project as aget_project
 from .core import get_project as get_project
+from .hooks import Hooks as Hooks
+from .hooks import logging_hooks as logging_hooks
+from .Job import Job as Job
+from .Job import await_jobs as await_jobs
+from .Job import wait_jobs as wait_jobs
+from .metrics import Metrics as Metrics
+from .Operation import Operation as Operation
+from .polling import JobStatus as JobStatus
 from .Project import Project as Project
 from .Settings import settings as settings
+from .Source import Publication as Publication
 from .Source import Source as Source
+from .Source import apublish_sources as apublish_sources
+from .Source import await_publications as await_publications
+from .Source import publish_sources as publish_sources
+from .Source import wait_publications as wait_publications
 from .Task import Task as Task
+from .Task import TaskResult as TaskResult
+from .watch import JobChange as JobChange
+from .watch import JobWatcher as JobWatcher
@@ -1,23 +1,119 @@
-from httpx import Auth, Request
+import asyncio
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import AsyncGenerator, Awaitable, Callable, Generator, Optional
+
+from httpx import Auth, Request, Response
+
+# a login returns the bearer token and its expiry date, if known
+Login = Callable[[], tuple[str, Optional[datetime]]]
+AsyncLogin = Callable[[], Awaitable[tuple[str, Optional[datetime]]]]
 
 
 class BearerAuth(Auth):
     """
     Extends the httpx library with the option to authenticate with a
     bearer token at a Rest API.
+
+    If a login function is given, the token is renewed shortly before it
+    expires and whenever the API answers with 401. The renewal is
+    serialized: requests, which fail at the same time with the same token,
+    trigger a single login and are then sent again with the new token.
+    The same instance can be shared by a `Client` and an `AsyncClient`.
+    Without an async login function, the async flow runs the sync login in
+    a worker thread.
     """
 
     token: str  # Bearer token
     scheme: str = 'Bearer'
+    # renew the token this long before it expires
+    expiry_margin: timedelta = timedelta(seconds=30)
 
-    def __init__(self, token: str):
+    def __init__(
+        self,
+        token: str,
+        expires: Optional[datetime] = None,
+        login: Optional[Login] = None,
+        alogin: Optional[AsyncLogin] = None,
+    ):
         self.token: str = token
+        self.expires: Optional[datetime] = expires
+        self.login: Optional[Login] = login
+        self.alogin: Optional[AsyncLogin] = alogin
+        self._lock = threading.Lock()
+        self._alock: Optional[asyncio.Lock] = None
 
     def auth_flow(self, request: Request):
         # Add the bearer token to the request header
         request.headers['authorization'] = f'{self.scheme} {self.token}'
         yield request
 
+    def expired(self) -> bool:
+        """
+        Check if the token is known to be expired or about to expire.
+        """
+        if self.expires is None:
+            return False
+        return datetime.now(timezone.utc) >= self.expires - self.expiry_margin
+
+    def refresh(self, token: str) -> None:
+        """
+        Renew the token by logging in again, unless another request has
+        already renewed the given token.
+
+        :param token: the token, which was rejected or expired
+        :type token: str
+        """
+        with self._lock:
+            if self.token == token and self.login is not None:
+                self.token, self.expires = self.login()
+
+    async def arefresh(self, token: str) -> None:
+        """
+        Renew the token asynchronously, see `refresh`.
+
+        :param token: the token, which was rejected or expired
+        :type token: str
+        """
+        if self._alock is None:
+            self._alock = asyncio.Lock()
+        async with self._alock:
+            if self.token != token:
+                return
+            if self.alogin is not None:
+                self.token, self.expires = await self.alogin()
+            elif self.login is not None:
+                await asyncio.to_thread(self.refresh, token)
+
+    def sync_auth_flow(
+        self, request: Request
+    ) -> Generator[Request, Response, None]:
+        token = self.token
+        if self.login is not None and self.expired():
+            self.refresh(token)
+            token = self.token
+        request.headers['authorization'] = f'{self.scheme} {token}'
+        response = yield request
+        if response.status_code == 401 and self.login is not None:
+            self.refresh(token)
+            request.headers['authorization'] = f'{self.scheme} {self.token}'
+            yield request
+
+    async def async_auth_flow(
+        self, request: Request
+    ) -> AsyncGenerator[Request, Response]:
+        renewable = self.login is not None or self.alogin is not None
+        token = self.token
+        if renewable and self.expired():
+            await self.arefresh(token)
+            token = self.token
+        request.headers['authorization'] = f'{self.scheme} {token}'
+        response = yield request
+        if response.status_code == 401 and renewable:
+            await self.arefresh(token)
+            request.headers['authorization'] = f'{self.scheme} {self.token}'
+            yield request
+
 
 class UserPassAuth(Auth):
     """
@@ -0,0 +1,367 @@
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from httpx import Request, Response
+
+from .metrics import RESOURCES
+
+# default seconds, for which a cached response is used without asking the API
+CACHE_TTL: float = 60.0
+# default maximum number of cached responses
+CACHE_ENTRIES: int = 1024
+
+
+@dataclass
+class CacheEntry:
+    """
+    Cached response of a GET request.
+
+    :attr content: body of the response
+    :atype content: bytes
+    :attr headers: headers of the response
+    :atype headers: dict[str, str]
+    :attr stored: time of the request or the last revalidation from
+        `time.time()`
+    :atype stored: float
+    """
+
+    content: bytes
+    headers: dict[str, str]
+    stored: float
+
+    @property
+    def validators(self) -> dict[str, str]:
+        """
+        Headers of a conditional request, which the server answers with
+        `304 Not Modified`, if the resource did not change.
+        """
+        headers = {}
+        if 'etag' in self.headers:
+            headers['If-None-Match'] = self.headers['etag']
+        if 'last-modified' in self.headers:
+            headers['If-Modified-Since'] = self.headers['last-modified']
+        return headers
+
+    def response(self, url: str, source: str) -> Response:
+        """
+        Create a response from the entry.
+
+        :param url: URL of the request
+        :type url: str
+        :param source: `hit` or `revalidated`, stored in the extension
+            `pyblisher.cache` of the response
+        :type source: str
+        :return: response
+        :rtype: Response
+        """
+        return Response(
+            200,
+            headers=self.headers,
+            content=self.content,
+            request=Request('GET', url),
+            extensions={'pyblisher.cache': source},
+        )
+
+    @classmethod
+    def from_response(cls, response: Response) -> 'CacheEntry':
+        """
+        Create an entry from a successful response.
+        """
+        headers = {
+            key: value
+            for key, value in response.headers.items()
+            if key not in ('content-encoding', 'content-length', 'transfer-encoding')
+        }
+        return cls(response.content, headers, time.time())
+
+
+def cacheable(response: Response) -> bool:
+    """
+    Check if a response may be stored.
+    """
+    return response.status_code == 200 and 'no-store' not in response.headers.get(
+        'cache-control', ''
+    )
+
+
+def cache_key(url: str, params: Optional[dict], user: str = '') -> str:
+    """
+    Create the key of a GET request from its URL, query parameters and user.
+    The user follows the URL, so clients of different users, which share a
+    cache, don't get the responses of each other, but a change through any
+    of them invalidates the responses of all users by the URL prefix.
+
+    :param url: URL of the request
+    :type url: str
+    :param params: query parameters
+    :type params: Optional[dict]
+    :param user: user of the client
+    :type user: str
+    :return: cache key
+    :rtype: str
+    """
+    key = url
+    if params:
+        key += '?' + '&'.join(
+            f'{name}={params[name]}' for name in sorted(params) if params[name] is not None
+        )
+    return f'{key} user={user}'
+
+
+def affected_prefix(url: str) -> str:
+    """
+    Get the prefix of the cache keys, which a changing request to an URL
+    invalidates. It ends with the last resource type of the URL, so
+    `project/<id>/data-bucket/<id>/upload/` invalidates all buckets of the
+    project, their objects and the bucket list `data-buckets/`.
+
+    :param url: URL of a POST, PUT or DELETE request
+    :type url: str
+    :return: prefix of the affected cache keys
+    :rtype: str
+    """
+    segments = url.split('?')[0].rstrip('/').split('/')
+    for index in range(len(segments) - 1, -1, -1):
+        if segments[index] in RESOURCES:
+            return '/'.join(segments[: index + 1])
+    return ''
+
+
+class ResponseCache:
+    """
+    Client-side cache of GET responses of the VC Publisher API in memory,
+    which drops the least recently used responses first.
+
+    A response is used without request for `ttl` seconds. After that, the
+    cache asks the server with `If-None-Match` and `If-Modified-Since`
+    headers, if the response has an `ETag` or `Last-Modified` header, and
+    the server can answer with `304 Not Modified` instead of the content.
+    POST, PUT and DELETE requests of the client remove the cached responses
+    of the resources they change.
+
+    Example:
+        ```
+        api = ApiClient(cache=ResponseCache(ttl=300))
+        project = get_project(id=<project id>, api=api)
+        ```
+
+    :param ttl: seconds, for which a response is used without request
+    :type ttl: float
+    :param max_entries: maximum number of cached responses
+    :type max_entries: int
+    """
+
+    def __init__(self, ttl: float = CACHE_TTL, max_entries: int = CACHE_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def fresh(self, entry: CacheEntry) -> bool:
+        """
+        Check if an entry can be used without request.
+        """
+        return time.time() - entry.stored < self.ttl
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """
+        Get a cached response.
+
+        :param key: cache key of the request
+        :type key: str
+        :return: entry or None
+        :rtype: Optional[CacheEntry]
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """
+        Store a response.
+
+        :param key: cache key of the request
+        :type key: str
+        :param entry: response
+        :type entry: CacheEntry
+        """
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, prefix: str) -> None:
+        """
+        Remove all responses, whose key starts with the prefix.
+
+        :param prefix: prefix of the cache keys
+        :type prefix: str
+        """
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """
+        Remove all responses.
+        """
+        self.invalidate('')
+
+    def store(
+        self,
+        key: str,
+        url: str,
+        entry: Optional[CacheEntry],
+        response: Response,
+    ) -> Response:
+        """
+        Handle the response of a GET request, which was not answered from
+        the cache: renew the entry after `304 Not Modified` or store a new
+        response.
+
+        :param key: cache key of the request
+        :type key: str
+        :param url: URL of the request
+        :type url: str
+        :param entry: expired entry, whose validators were sent
+        :type entry: Optional[CacheEntry]
+        :param response: response of the server
+        :type response: Response
+        :return: response for the caller
+        :rtype: Response
+        """
+        if entry is not None and response.status_code == 304:
+            response.close()
+            entry.stored = time.time()
+            self.set(key, entry)
+            return entry.response(url, 'revalidated')
+        if cacheable(response):
+            self.set(key, CacheEntry.from_response(response))
+        return response
+
+
+class DiskCache(ResponseCache):
+    """
+    Cache of GET responses, which is stored in a directory, so it is shared
+    by processes and survives restarts. Each response is a JSON file, whose
+    name is the hash of the cache key, so responses stored by other
+    processes are found, too. See `ResponseCache` for the behaviour.
+
+    :param directory: cache directory, which is created if necessary
+    :type directory: str
+    :param ttl: seconds, for which a response is used without request
+    :type ttl: float
+    :param max_entries: maximum number of cached responses
+    :type max_entries: int
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        ttl: float = CACHE_TTL,
+        max_entries: int = CACHE_ENTRIES,
+    ):
+        super().__init__(ttl, max_entries)
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        # cache keys of the files in the directory, least recently used first
+        self._index: OrderedDict[str, str] = OrderedDict()
+        self._scan()
+
+    def _scan(self) -> None:
+        """
+        Add the files to the index, which are not in it yet, e.g. because
+        another process stored them, least recently used first.
+        """
+        with self._lock:
+            known = set(self._index.values())
+        files = sorted(
+            (
+                entry
+                for entry in os.scandir(self.directory)
+                if entry.name.endswith('.json') and entry.path not in known
+            ),
+            key=lambda entry: entry.stat().st_mtime,
+        )
+        for file in files:
+            try:
+                with open(file.path, 'r') as handle:
+                    key = json.load(handle)['key']
+            except (OSError, ValueError, KeyError):
+                continue
+            with self._lock:
+                self._index.setdefault(key, file.path)
+
+    def _path(self, key: str) -> str:
+        name = hashlib.sha256(key.encode()).hexdigest()
+        return os.path.join(self.directory, f'{name}.json')
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        path = self._path(key)
+        try:
+            with open(path, 'r') as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            # the file was removed, maybe by another process
+            with self._lock:
+                self._index.pop(key, None)
+            return None
+        if data.get('key') != key:
+            return None
+        with self._lock:
+            self._index[key] = path
+            self._index.move_to_end(key)
+        return CacheEntry(
+            content=base64.b64decode(data['content']),
+            headers=data['headers'],
+            stored=data['stored'],
+        )
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        path = self._path(key)
+        temporary = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(temporary, 'w') as file:
+            json.dump(
+                {
+                    'key': key,
+                    'content': base64.b64encode(entry.content).decode(),
+                    'headers': entry.headers,
+                    'stored': entry.stored,
+                },
+                file,
+            )
+        os.replace(temporary, path)
+        with self._lock:
+            self._index[key] = path
+            self._index.move_to_end(key)
+            removed = []
+            while len(self._index) > self.max_entries:
+                removed.append(self._index.popitem(last=False)[1])
+        for path in removed:
+            self._remove(path)
+
+    def invalidate(self, prefix: str) -> None:
+        # responses of other processes are removed, too
+        self._scan()
+        with self._lock:
+            removed = [key for key in self._index if key.startswith(prefix)]
+            paths = [self._index.pop(key) for key in removed]
+        for path in paths:
+            self._remove(path)
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
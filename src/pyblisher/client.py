@@ -1,59 +1,327 @@
-from typing import Any, Optional
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Iterator, Optional
 
-from httpx import AsyncClient, Client, Response, post
+from httpx import AsyncClient, Client, Request, Response
 
 from .auth import BearerAuth
+from .cache import DiskCache, ResponseCache, affected_prefix, cache_key
+from .connection import ConnectionSettings
+from .helpers import parse_datetime
+from .hooks import Hooks, RequestEvent
+from .metrics import Metrics
+from .retry import RetryPolicy
 from .Settings import settings
-from .types import ApiClientProtocol
+from .tracing import TRACING
+from .tracing import attach as attach_tracing
+from .types import ApiClientProtocol, AsyncApiClientProtocol
 
 
-def log(event_name, info):
+def retry_policy() -> RetryPolicy:
     """
-    Logging function for httpx client trace extension.
+    Create the retry policy of the API clients from the optional `retry`
+    section of the settings, e.g. `{"max_attempts": 5}`.
     """
-    print(event_name, info)
+    return RetryPolicy(**getattr(settings, 'retry', {}))
 
 
-class ApiClient(ApiClientProtocol):
-    _instance = None
-    _connected = False
-    _url: str = ''
+def connection_settings() -> ConnectionSettings:
+    """
+    Create the connection settings of the API clients from the optional
+    `connection` section of the settings, e.g. `{"max_connections": 50}`.
+    """
+    return ConnectionSettings(**getattr(settings, 'connection', {}))
+
+
+def response_cache() -> Optional[ResponseCache]:
+    """
+    Create the response cache of the API clients from the optional `cache`
+    section of the settings, e.g. `{"ttl": 300, "directory": ".cache"}`.
+    Without the section, responses are not cached.
+    """
+    options = dict(getattr(settings, 'cache', None) or {})
+    if not options:
+        return None
+    directory = options.pop('directory', None)
+    if directory:
+        return DiskCache(directory, **options)
+    return ResponseCache(**options)
+
+
+def setting_user() -> str:
+    """
+    Get the user name of the settings, which is configured as `user` or
+    `username`.
+    """
+    return getattr(settings, 'user', None) or getattr(settings, 'username', None) or ''
+
+
+def read_token(response: Response) -> tuple[str, Optional[datetime]]:
+    """
+    Read the bearer token and its expiry date from a login response.
+
+    :param response: response of the login request
+    :type response: Response
+    :return: bearer token and expiry date, if the API sends one
+    :rtype: tuple[str, Optional[datetime]]
+    """
+    if response.status_code != 200:
+        raise Exception(f'Login failed: {response.__dict__}')
+    content = response.json()
+    expires = content.get('tokenExpires')
+    return content['token'], parse_datetime(expires) if expires else None
 
-    def __new__(cls):
+
+class BaseApiClient:
+    """
+    Settings, response cache, hooks and retry decisions, which `ApiClient`
+    and `AsyncApiClient` share. The subclasses only send the requests. See
+    `ApiClient` for the arguments.
+    """
+
+    # passed to the request hooks
+    _asynchronous: bool = False
+
+    def __init__(
+        self,
+        host: Optional[str] = None,
+        user: Optional[str] = None,
+        password: Optional[str] = None,
+        api_version: Optional[str] = None,
+        retry: Optional[RetryPolicy] = None,
+        connection: Optional[ConnectionSettings] = None,
+        hooks: Optional[Hooks] = None,
+        metrics: Optional[Metrics] = None,
+        tracing: Optional[bool] = None,
+        cache: Optional[ResponseCache] = None,
+    ):
+        self.host: str = host or getattr(settings, 'host', None) or ''
+        self.user: str = user or setting_user()
+        self.password: str = password or getattr(settings, 'password', None) or ''
+        self.api_version: str = (
+            api_version or getattr(settings, 'api_version', None) or 'v1'
+        )
+        self.retry: RetryPolicy = retry or retry_policy()
+        self.connection: ConnectionSettings = (
+            connection or connection_settings()
+        )
+        self.hooks: Hooks = hooks if hooks is not None else Hooks()
+        self.metrics: Optional[Metrics] = metrics
+        self.cache: Optional[ResponseCache] = (
+            cache if cache is not None else response_cache()
+        )
+        if metrics is not None:
+            metrics.attach(self.hooks)
+        use_tracing = TRACING if tracing is None else tracing
+        if use_tracing:
+            attach_tracing(self.hooks)
+        self._url: str = f'{self.host}/api/{self.api_version}/'
+        self._connected: bool = False
+        self._lock = threading.Lock()
+
+    def _paired_settings(self) -> dict[str, Any]:
         """
-        Singleton Pattern
+        Arguments of the counterpart client with the same credentials and
+        settings. The shared hooks collect the metrics and create the spans
+        already.
         """
-        if cls._instance is None:
-            cls._instance = super(ApiClient, cls).__new__(cls)
-        return cls._instance
+        return {
+            'host': self.host,
+            'user': self.user,
+            'password': self.password,
+            'api_version': self.api_version,
+            'retry': self.retry,
+            'connection': self.connection,
+            'hooks': self.hooks,
+            'tracing': False,
+            'cache': self.cache,
+        }
+
+    def _from_cache(
+        self, cache: ResponseCache, method: str, endpoint: str, kwargs: dict
+    ) -> tuple[Optional[Response], Callable[[Response], Response]]:
+        """
+        Answer GET requests from the cache and remove the responses, which a
+        changing request affects. Validators of an expired response are
+        added to the headers in `kwargs`.
+
+        :param cache: response cache of the client
+        :type cache: ResponseCache
+        :param method: HTTP method like `GET`
+        :type method: str
+        :param endpoint: api endpoint like `projects/`
+        :type endpoint: str
+        :param kwargs: arguments of the request
+        :type kwargs: dict
+        :return: cached response or None, and the function, which handles the
+            response of the server
+        :rtype: tuple[Optional[Response], Callable[[Response], Response]]
+        """
+        url = self._url + endpoint
+        if method.upper() != 'GET':
+
+            def invalidate(response: Response) -> Response:
+                cache.invalidate(affected_prefix(url))
+                return response
+
+            return None, invalidate
+        key = cache_key(url, kwargs.get('params'), self.user)
+        entry = cache.get(key)
+        if entry is not None:
+            if cache.fresh(entry):
+                return entry.response(url, 'hit'), lambda response: response
+            kwargs['headers'] = {**entry.validators, **(kwargs.get('headers') or {})}
+        return None, lambda response: cache.store(key, url, entry, response)
+
+    def _emit_request(
+        self, method: str, endpoint: str, request: Request, attempt: int
+    ) -> Optional[RequestEvent]:
+        """
+        Call the request hooks for an attempt.
+        """
+        if not self.hooks:
+            return None
+        return self.hooks.emit_request(
+            method, endpoint, request, attempt, asynchronous=self._asynchronous
+        )
+
+    def _retry_error(
+        self,
+        retry: RetryPolicy,
+        method: str,
+        attempt: int,
+        event: Optional[RequestEvent],
+        error: Exception,
+    ) -> Optional[float]:
+        """
+        Handle a failed attempt.
+
+        :return: seconds until the next attempt, or None to raise the error
+        :rtype: Optional[float]
+        """
+        if event is not None:
+            self.hooks.emit_error(event, error)
+        if not retry.should_retry(method, attempt, error=error):
+            return None
+        return retry.delay(attempt)
+
+    def _retry_response(
+        self,
+        retry: RetryPolicy,
+        method: str,
+        attempt: int,
+        event: Optional[RequestEvent],
+        response: Response,
+    ) -> Optional[float]:
+        """
+        Handle the response of an attempt.
+
+        :return: seconds until the next attempt, or None to return the
+            response
+        :rtype: Optional[float]
+        """
+        if event is not None:
+            self.hooks.emit_response(event, response)
+        if not retry.should_retry(method, attempt, response):
+            return None
+        return retry.delay(attempt, response)
+
+
+class ApiClient(BaseApiClient, ApiClientProtocol):
+    """
+    Client for the VC Publisher API. Every instance has its own credentials,
+    connection pool and token, so several hosts or users can be used from one
+    process. An instance can be shared by many threads.
+
+    Arguments, which are not given, are taken from the settings.
+
+    Example:
+        ```
+        other = ApiClient(host='https://other-publisher.tld', user='sync')
+        project = get_project(id=<project id>, api=other)
+        ```
+
+    :param host: URL of the VC Publisher (not the API)
+    :type host: Optional[str]
+    :param user: user name for the login
+    :type user: Optional[str]
+    :param password: password for the login
+    :type password: Optional[str]
+    :param api_version: version of the API, e.g. `v1`
+    :type api_version: Optional[str]
+    :param retry: retry policy of failed requests
+    :type retry: Optional[RetryPolicy]
+    :param connection: connection pool and timeouts
+    :type connection: Optional[ConnectionSettings]
+    :param hooks: callbacks for requests and responses, e.g. for logging
+    :type hooks: Optional[Hooks]
+    :param metrics: registry, which collects the timing of the requests
+    :type metrics: Optional[Metrics]
+    :param tracing: create OpenTelemetry spans for the requests, default is
+        True, if OpenTelemetry is installed and the `tracing` setting is not
+        false
+    :type tracing: Optional[bool]
+    :param cache: cache of GET responses, default is the cache of the
+        optional `cache` section of the settings
+    :type cache: Optional[ResponseCache]
+    """
+
+    _aio: Optional['AsyncApiClient'] = None
+
+    @property
+    def aio(self) -> 'AsyncApiClient':
+        """
+        Asynchronous client with the same credentials and settings.
+        """
+        with self._lock:
+            if self._aio is None:
+                self._aio = AsyncApiClient(**self._paired_settings())
+                self._aio.metrics = self.metrics
+                self._aio._sync = self
+        return self._aio
 
     def __login__(self) -> bool:
         """
-        Login to API
-        :return: bearer token
-        """
-        if not self._connected:
-            bearer: str = 'no bearer'
-            self._url: str = f'{settings.host}/api/{settings.api_version}/'
-            if self._url:
-                response = post(
-                    url=self._url + 'login/',
-                    data={
-                        'username': settings.user,
-                        'password': settings.password,
-                    },
+        Login to API. Threads, which call it at the same time, wait for the
+        first login instead of logging in themselves.
+
+        :return: connection state
+        """
+        with self._lock:
+            if not self._connected:
+                bearer, expires = self._fetch_token()
+                # the token is renewed by the auth, when it expires
+                auth = BearerAuth(bearer, expires, login=self._fetch_token)
+                self._client = Client(
+                    base_url=f'{self._url}/',
+                    auth=auth,
+                    **self.connection.client_kwargs(),
                 )
-                if response.status_code == 200:
-                    bearer = response.json()['token']
-                    self._client = Client(base_url=f'{self._url}/')
-                    self._aclient = AsyncClient(base_url=f'{self._url}/')
-                    self._client.auth = BearerAuth(bearer)
-                    self._aclient.auth = BearerAuth(bearer)
-                    self._connected = True
-                else:
-                    raise Exception(f'Login failed: {response.__dict__}')
+                self._connected = True
         return self._connected
 
+    def _fetch_token(self) -> tuple[str, Optional[datetime]]:
+        """
+        Request a new bearer token.
+
+        :return: bearer token and expiry date
+        :rtype: tuple[str, Optional[datetime]]
+        """
+        # the login runs on its own client, so it neither carries the expired
+        # token nor waits for the auth of the api client
+        with Client(**self.connection.client_kwargs()) as client:
+            response = client.post(
+                url=self._url + 'login/',
+                data={
+                    'username': self.user,
+                    'password': self.password,
+                },
+            )
+        return read_token(response)
+
     def __logout__(self) -> None:
         """
         logout from API
@@ -68,6 +336,78 @@ class ApiClient(ApiClientProtocol):
                 # self.logger.warning(f"Logout failed: {response.json()}")
                 print(f'Logout failed: {response.__dict__}')
 
+    def request(
+        self,
+        method: str,
+        endpoint: str,
+        retry: Optional[RetryPolicy] = None,
+        stream: bool = False,
+        cache: bool = True,
+        **kwargs,
+    ) -> Response:
+        """
+        Make a request to the VC Publisher API, after logging in if necessary.
+        Failed attempts are repeated according to the retry policy.
+
+        :param method: HTTP method like `GET`
+        :type method: str
+        :param endpoint: api endpoint like `projects/`
+        :type endpoint: str
+        :param retry: retry policy of this request, default is the policy of
+            the client
+        :type retry: Optional[RetryPolicy]
+        :param stream: return before the body is read. The response has to be
+            closed by the caller, better use `stream()`.
+        :type stream: bool
+        :param cache: use the response cache of the client. Requests for
+            states, which change on the server, like the status of a running
+            job, pass False.
+        :type cache: bool
+        :return: Response
+        :rtype: Response
+        """
+        if self.cache is None or not cache or stream:
+            return self._send(method, endpoint, retry, stream, **kwargs)
+        cached, handle = self._from_cache(self.cache, method, endpoint, kwargs)
+        if cached is not None:
+            return cached
+        return handle(self._send(method, endpoint, retry, False, **kwargs))
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        retry: Optional[RetryPolicy],
+        stream: bool,
+        **kwargs,
+    ) -> Response:
+        """
+        Send a request with retries, see `request`.
+        """
+        if not (self._connected or self.__login__()):
+            return Response(status_code=502)
+        retry = retry or self.retry
+        attempt = 1
+        while True:
+            request = self._client.build_request(
+                method=method, url=self._url + endpoint, **kwargs
+            )
+            event = self._emit_request(method, endpoint, request, attempt)
+            try:
+                response = self._client.send(request, stream=stream)
+            except Exception as error:
+                delay = self._retry_error(retry, method, attempt, event, error)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+            else:
+                delay = self._retry_response(retry, method, attempt, event, response)
+                if delay is None:
+                    return response
+                response.close()
+                time.sleep(delay)
+            attempt += 1
+
     def get(
         self, endpoint: str, params: Optional[dict] = None, *args, **kwargs
     ) -> Response:
@@ -79,27 +419,7 @@ class ApiClient(ApiClientProtocol):
         :param stream: just for file downloads, default False
         :return: Response
         """
-
-        def get_it():
-            """
-            Get Request
-            """
-            url = self._url + endpoint
-            response: Response = self._client.get(
-                url=url,
-                params=params,
-                extensions={},
-            )
-            return response
-
-        if self._connected:
-            return get_it()
-        else:
-            if self.__login__():
-                return get_it()
-            else:
-                response = Response(status_code=502)
-                return response
+        return self.request('GET', endpoint, params=params)
 
     def post(
         self,
@@ -121,30 +441,9 @@ class ApiClient(ApiClientProtocol):
         :param files:
         :return:
         """
-
-        def post_it():
-            """
-            Post Request
-            """
-            url: str = self._url + endpoint
-            response = self._client.post(
-                url=url,
-                data=data,
-                json=json,
-                params=params,
-                files=files,
-                extensions={},
-            )
-            return response
-
-        if self._connected:
-            return post_it()
-        else:
-            if self.__login__():
-                return post_it()
-            else:
-                response = Response(status_code=502)
-                return response
+        return self.request(
+            'POST', endpoint, data=data, json=json, params=params, files=files
+        )
 
     def delete(
         self,
@@ -164,28 +463,12 @@ class ApiClient(ApiClientProtocol):
         :return: Response as dict
         :rtype: Response
         """
-
-        def delete_it():
-            """
-            Delete Request
-            """
-            url: str = self._url + endpoint
-            response = self._client.delete(
-                url=url,
-                headers=headers,
-                params=params,
-                extensions={'trace': log},
-            )
-            return response
-
-        if self._connected:
-            return delete_it()
-        else:
-            if self.__login__():
-                return delete_it()
-            else:
-                response = Response(status_code=502)
-                return response
+        return self.request(
+            'DELETE',
+            endpoint,
+            headers=headers,
+            params=params,
+        )
 
     def put(
         self,
@@ -210,62 +493,322 @@ class ApiClient(ApiClientProtocol):
         :type files: Optional[Any]
         :return: The response from the API.
         """
+        return self.request(
+            'PUT',
+            endpoint,
+            data=data,
+            json=json,
+            params=params,
+            files=files,
+        )
 
-        def put_it():
-            """
-            Put Request
-            """
-            url = self._url + endpoint
-            response = self._client.put(
-                url=url,
-                data=data,
-                json=json,
-                params=params,
-                files=files,
-                extensions={'trace': log},
+    @contextmanager
+    def stream(
+        self,
+        method: str,
+        endpoint: str,
+        retry: Optional[RetryPolicy] = None,
+        **kwargs,
+    ) -> Iterator[Response]:
+        """
+        Make a streaming request to the VC Publisher API. The body of the
+        response is not loaded into memory, but read while iterating over it,
+        and the connection is released when the block is left.
+
+        Example:
+            ```
+            with client.stream('GET', endpoint) as response:
+                for chunk in response.iter_bytes():
+                    ...
+            ```
+
+        :param method: HTTP method like `GET`
+        :type method: str
+        :param endpoint: api endpoint like `projects/`
+        :type endpoint: str
+        :param retry: retry policy of this request, default is the policy of
+            the client
+        :type retry: Optional[RetryPolicy]
+        :return: streamed response
+        :rtype: Iterator[Response]
+        """
+        response = self.request(
+            method, endpoint, retry=retry, stream=True, **kwargs
+        )
+        try:
+            yield response
+        finally:
+            response.close()
+
+
+class AsyncApiClient(BaseApiClient, AsyncApiClientProtocol):
+    """
+    Asynchronous counterpart of the ApiClient. All requests run on the
+    `httpx.AsyncClient`, so many of them can be awaited concurrently on one
+    event loop. See `ApiClient` for the arguments.
+    """
+
+    _asynchronous = True
+    _login_lock: Optional[asyncio.Lock] = None
+    _sync: Optional['ApiClient'] = None
+
+    @property
+    def sync(self) -> ApiClient:
+        """
+        Synchronous client with the same credentials and settings.
+        """
+        if self._sync is None:
+            self._sync = ApiClient(**self._paired_settings())
+            self._sync.metrics = self.metrics
+            self._sync._aio = self
+        return self._sync
+
+    async def __login__(self) -> bool:
+        """
+        Login to API. Concurrent calls wait for the first login instead of
+        logging in themselves.
+
+        :return: connection state
+        """
+        if self._login_lock is None:
+            self._login_lock = asyncio.Lock()
+        async with self._login_lock:
+            if not self._connected:
+                bearer, expires = await self._fetch_token()
+                # the token is renewed by the auth, when it expires
+                self._aclient = AsyncClient(
+                    base_url=f'{self._url}/',
+                    auth=BearerAuth(bearer, expires, alogin=self._fetch_token),
+                    **self.connection.client_kwargs(),
+                )
+                self._connected = True
+        return self._connected
+
+    async def _fetch_token(self) -> tuple[str, Optional[datetime]]:
+        """
+        Request a new bearer token.
+
+        :return: bearer token and expiry date
+        :rtype: tuple[str, Optional[datetime]]
+        """
+        # the login runs on its own client, see ApiClient._fetch_token
+        async with AsyncClient(**self.connection.client_kwargs()) as client:
+            response = await client.post(
+                url=self._url + 'login/',
+                data={
+                    'username': self.user,
+                    'password': self.password,
+                },
             )
-            return response
+        return read_token(response)
 
+    async def __logout__(self) -> None:
+        """
+        logout from API
+        """
         if self._connected:
-            return put_it()
-        else:
-            if self.__login__():
-                return put_it()
+            response = await self._aclient.get(url=self._url + 'logout/')
+            # should return 201 Logout Successful
+            if response.status_code == 201:
+                print('Logout.')
             else:
-                response = Response(status_code=502)
-                return response
+                print(f'Logout failed: {response.__dict__}')
 
-    async def stream(
+    async def request(
         self,
+        method: str,
         endpoint: str,
-        params: Optional[dict] = None,
-    ) -> Any:
-        """
-        Führt einen Streaming-Request aus und gibt einen Generator zurück,
-        der über die Bytes des Response iteriert. Der HTTP-Stream wird hier
-        innerhalb eines with-Blocks geöffnet und automatisch geschlossen,
-        wenn der Generator erschöpft ist.
-        """
-
-        async def stream_it():
-            """
-            Stream Request
-            """
-            url = self._url + endpoint
-            return self._aclient.stream(
-                method='GET',
-                url=url,
-                params=params,
-            )
+        retry: Optional[RetryPolicy] = None,
+        stream: bool = False,
+        cache: bool = True,
+        **kwargs,
+    ) -> Response:
+        """
+        Make a request to the VC Publisher API, after logging in if necessary.
+        Failed attempts are repeated according to the retry policy.
 
-        if self._connected:
-            return stream_it()
-        else:
-            if self.__login__():
-                return stream_it()
+        :param method: HTTP method like `GET`
+        :type method: str
+        :param endpoint: api endpoint like `projects/`
+        :type endpoint: str
+        :param retry: retry policy of this request, default is the policy of
+            the client
+        :type retry: Optional[RetryPolicy]
+        :param stream: return before the body is read. The response has to be
+            closed by the caller, better use `stream()`.
+        :type stream: bool
+        :param cache: use the response cache of the client. Requests for
+            states, which change on the server, like the status of a running
+            job, pass False.
+        :type cache: bool
+        :return: Response
+        :rtype: Response
+        """
+        if self.cache is None or not cache or stream:
+            return await self._send(method, endpoint, retry, stream, **kwargs)
+        cached, handle = self._from_cache(self.cache, method, endpoint, kwargs)
+        if cached is not None:
+            return cached
+        return handle(await self._send(method, endpoint, retry, False, **kwargs))
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        retry: Optional[RetryPolicy],
+        stream: bool,
+        **kwargs,
+    ) -> Response:
+        """
+        Send a request with retries, see `request`.
+        """
+        if not (self._connected or await self.__login__()):
+            return Response(status_code=502)
+        retry = retry or self.retry
+        attempt = 1
+        while True:
+            request = self._aclient.build_request(
+                method=method, url=self._url + endpoint, **kwargs
+            )
+            event = self._emit_request(method, endpoint, request, attempt)
+            try:
+                response = await self._aclient.send(request, stream=stream)
+            except Exception as error:
+                delay = self._retry_error(retry, method, attempt, event, error)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
             else:
-                response = Response(status_code=502)
-                return response
+                delay = self._retry_response(retry, method, attempt, event, response)
+                if delay is None:
+                    return response
+                await response.aclose()
+                await asyncio.sleep(delay)
+            attempt += 1
+
+    async def get(
+        self, endpoint: str, params: Optional[dict] = None, *args, **kwargs
+    ) -> Response:
+        """
+        Make an asynchronous GET Request to the VC Publisher API.
+
+        :param endpoint: api endpoint like `projects/`
+        :param params: Optional dict for query parameters
+        :return: Response
+        """
+        return await self.request('GET', endpoint, params=params)
+
+    async def post(
+        self,
+        endpoint: str,
+        data: Optional[dict] = None,
+        json: Optional[dict] = None,
+        params: Optional[dict] = None,
+        files: Optional[Any] = None,
+        *args,
+        **kwargs,
+    ) -> Response:
+        """
+        Make an asynchronous POST Request to the VC Publisher API.
+
+        :param endpoint: api endpoint like `project/`
+        :param data: dictionary delivered in request body
+        :param json:
+        :param params:
+        :param files:
+        :return: Response
+        """
+        return await self.request(
+            'POST', endpoint, data=data, json=json, params=params, files=files
+        )
+
+    async def delete(
+        self,
+        endpoint: str,
+        headers: Optional[dict] = None,
+        params: Optional[dict] = None,
+    ) -> Response:
+        """
+        Make an asynchronous DELETE Request to the VC Publisher API.
+
+        :param endpoint: api endpoint like `project/<project_id>/`
+        :type endpoint: str
+        :param headers: Optional dict for headers
+        :type headers: Optional[dict]
+        :param params: Optional dict for query parameters
+        :type params: Optional[dict]
+        :return: Response
+        :rtype: Response
+        """
+        return await self.request(
+            'DELETE', endpoint, headers=headers, params=params
+        )
+
+    async def put(
+        self,
+        endpoint: str,
+        data: Optional[dict] = None,
+        json: Optional[dict] = None,
+        params: Optional[dict] = None,
+        files: Optional[Any] = None,
+    ) -> Response:
+        """
+        Make an asynchronous PUT Request to the VC Publisher API.
+
+        :param endpoint: The endpoint to PUT to.
+        :type endpoint: str
+        :param data: The data to PUT.
+        :type data: Optional[dict]
+        :param json: The JSON data to PUT.
+        :type json: Optional[dict]
+        :param params: The parameters to PUT.
+        :type params: Optional[dict]
+        :param files: The files to PUT.
+        :type files: Optional[Any]
+        :return: The response from the API.
+        """
+        return await self.request(
+            'PUT', endpoint, data=data, json=json, params=params, files=files
+        )
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        method: str,
+        endpoint: str,
+        retry: Optional[RetryPolicy] = None,
+        **kwargs,
+    ) -> AsyncIterator[Response]:
+        """
+        Make an asynchronous streaming request to the VC Publisher API. See
+        `ApiClient.stream`.
+
+        Example:
+            ```
+            async with aclient.stream('GET', endpoint) as response:
+                async for chunk in response.aiter_bytes():
+                    ...
+            ```
+
+        :param method: HTTP method like `GET`
+        :type method: str
+        :param endpoint: api endpoint like `projects/`
+        :type endpoint: str
+        :param retry: retry policy of this request, default is the policy of
+            the client
+        :type retry: Optional[RetryPolicy]
+        :return: streamed response
+        :rtype: AsyncIterator[Response]
+        """
+        response = await self.request(
+            method, endpoint, retry=retry, stream=True, **kwargs
+        )
+        try:
+            yield response
+        finally:
+            await response.aclose()
 
 
+# default clients, which use the credentials of the settings
 client = ApiClient()
+aclient = client.aio
@@ -0,0 +1,74 @@
+from dataclasses import dataclass
+from importlib.util import find_spec
+from typing import Any, Optional
+
+from httpx import Limits, Timeout
+
+
+@dataclass
+class ConnectionSettings:
+    """
+    This class describes the connection pool and timeouts of the httpx
+    clients, which are shared by all requests of an API client.
+
+    :attr max_connections: maximum number of open connections per client
+    :atype max_connections: Optional[int]
+    :attr max_keepalive_connections: maximum number of idle connections,
+        which are kept open for reuse
+    :atype max_keepalive_connections: Optional[int]
+    :attr keepalive_expiry: seconds an idle connection is kept open
+    :atype keepalive_expiry: Optional[float]
+    :attr connect_timeout: seconds to establish a connection
+    :atype connect_timeout: Optional[float]
+    :attr read_timeout: seconds to wait for data of the server
+    :atype read_timeout: Optional[float]
+    :attr write_timeout: seconds to wait while sending data
+    :atype write_timeout: Optional[float]
+    :attr pool_timeout: seconds to wait for a free connection of the pool
+    :atype pool_timeout: Optional[float]
+    :attr http2: use HTTP/2, which multiplexes concurrent requests over one
+        connection. Requires the `h2` package (`pip install pyblisher[http2]`).
+    :atype http2: bool
+    """
+
+    max_connections: Optional[int] = 100
+    max_keepalive_connections: Optional[int] = 20
+    keepalive_expiry: Optional[float] = 30.0
+    connect_timeout: Optional[float] = 10.0
+    read_timeout: Optional[float] = 60.0
+    write_timeout: Optional[float] = 60.0
+    pool_timeout: Optional[float] = 30.0
+    http2: bool = False
+
+    def __post_init__(self):
+        """
+        Fall back to HTTP/1.1, if HTTP/2 is requested but not installed.
+        """
+        if self.http2 and find_spec('h2') is None:
+            print(
+                'Warning: HTTP/2 needs the h2 package '
+                '(pip install pyblisher[http2]), using HTTP/1.1.'
+            )
+            self.http2 = False
+
+    def client_kwargs(self) -> dict[str, Any]:
+        """
+        Get the keyword arguments for `httpx.Client` and `httpx.AsyncClient`.
+
+        :return: limits, timeout and http2 arguments
+        :rtype: dict
+        """
+        return {
+            'limits': Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+            'timeout': Timeout(
+                connect=self.connect_timeout,
+                read=self.read_timeout,
+                write=self.write_timeout,
+                pool=self.pool_timeout,
+            ),
+            'http2': self.http2,
+        }
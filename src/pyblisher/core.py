@@ -1,83 +1,103 @@
-from dacite import from_dict
+from typing import Optional
+
 from httpx import Response
 
-from .client import client
-from .exceptions import (
-    AuthenticationError,
-    InternalServerError,
-    MatchFailed,
-    ObjectNotFound,
-    PermissionError,
-)
+from .client import ApiClient, AsyncApiClient, aclient, client
+from .decode import decode, response_json
+from .helpers import validate_response
 from .Project import Project
-from .Settings import settings
-from .types import ApiClientProtocol
+from .tracing import traced
+from .types import ApiClientProtocol, AsyncApiClientProtocol
 from .User import User
 
 
-def get_project(id: str) -> Project:
+@traced('core.get_project', {'pyblisher.project.id': 'id'})
+def get_project(id: str, api: Optional[ApiClient] = None) -> Project:
     """
     Get project by id
 
     :param project_id: project id
     :type project_id: str
+    :param api: API client, default is the client of the settings
+    :type api: Optional[ApiClient]
     :return: project
     :rtype: Project
     """
-    api: ApiClientProtocol = client
+    api = api or client
     response: Response = api.get(
         endpoint=f'project/{id}/',
     )
-    match response.status_code:
-        case 200:
-            return from_dict(
-                data_class=Project,
-                data=response.json(),
-                config=settings.dacite_config,
-            )
-        case 400:
-            raise MatchFailed(
-                f'{response.status_code} - {response.json()["reason"]}'
-            )
-        case 401:
-            raise AuthenticationError(
-                f'{response.status_code} - {response.json()["reason"]}'
-            )
-        case 403:
-            raise PermissionError(
-                f'{response.status_code} - {response.json()["reason"]}'
-            )
-        case 404:
-            raise ObjectNotFound(
-                f'{response.status_code} - {response.json()["reason"]}'
-            )
-        case 500:
-            raise InternalServerError(
-                f'{response.status_code} - {response.json()["reason"]}'
-            )
-        case _:
-            raise Exception(f'Failed to get project. Response: {response}')
+    validate_response(response, 200, 'get project')
+    project = decode(Project, response_json(response))
+    project._api = api
+    project._aapi = api.aio
+    return project
+
+
+@traced('core.aget_project', {'pyblisher.project.id': 'id'})
+async def aget_project(
+    id: str, api: Optional[AsyncApiClient] = None
+) -> Project:
+    """
+    Get project by id asynchronously
+
+    :param project_id: project id
+    :type project_id: str
+    :param api: asynchronous API client, default is the client of the
+        settings
+    :type api: Optional[AsyncApiClient]
+    :return: project
+    :rtype: Project
+    """
+    api = api or aclient
+    response: Response = await api.get(
+        endpoint=f'project/{id}/',
+    )
+    validate_response(response, 200, 'get project')
+    project = decode(Project, response_json(response))
+    project._api = api.sync
+    project._aapi = api
+    return project
 
 
-def get_user(user_id: str) -> User:
+@traced('core.get_user', {'pyblisher.user.id': 'user_id'})
+def get_user(user_id: str, api: Optional[ApiClientProtocol] = None) -> User:
     """
     Get user by id
 
     :param user_id: user id
     :type user_id: str
+    :param api: API client, default is the client of the settings
+    :type api: Optional[ApiClientProtocol]
     :return: user
     :rtype: User
     """
-    api: ApiClientProtocol = client
+    api = api or client
     response: Response = api.get(
         endpoint=f'user/{user_id}/',
     )
-    match response.status_code:
-        case 200:
-            return from_dict(
-                data_class=User,
-                data=response.json(),
-                config=settings.dacite_config,
-            )
-        case _:
-            raise Exception(f'Failed to get user. Response: {response}')
+    validate_response(response, 200, 'get user')
+    return decode(User, response_json(response))
+
+
+@traced('core.aget_user', {'pyblisher.user.id': 'user_id'})
+async def aget_user(
+    user_id: str, api: Optional[AsyncApiClientProtocol] = None
+) -> User:
+    """
+    Get user by id asynchronously
+
+    :param user_id: user id
+    :type user_id: str
+    :param api: asynchronous API client, default is the client of the
+        settings
+    :type api: Optional[AsyncApiClientProtocol]
+    :return: user
+    :rtype: User
+    """
+    api = api or aclient
+    response: Response = await api.get(
+        endpoint=f'user/{user_id}/',
+    )
+    validate_response(response, 200, 'get user')
+    return decode(User, response_json(response))
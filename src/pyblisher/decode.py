@@ -0,0 +1,353 @@
+import dataclasses
+import functools
+import json
+import types
+import typing
+from importlib.util import find_spec
+from typing import Any, Callable, Literal, TypeVar, Union
+
+from dacite import from_dict
+from dacite.exceptions import DaciteFieldError, MissingValueError, WrongTypeError
+from httpx import Response
+
+from .Settings import settings
+
+# response bodies are parsed with orjson, if it is installed
+ORJSON: bool = find_spec('orjson') is not None
+if ORJSON:
+    import orjson  # type: ignore[import-not-found]
+
+T = TypeVar('T')
+
+# types, which are checked with isinstance and passed unchanged
+PLAIN_TYPES = (str, int, float, bool, dict, list)
+
+
+class Unsupported(Exception):
+    """
+    A field type, which the decoder does not know. Dataclasses with such a
+    field are created by dacite.
+    """
+
+
+def loads(content: bytes) -> Any:
+    """
+    Parse a JSON document, with orjson if it is installed.
+
+    :param content: JSON document
+    :type content: bytes
+    :return: parsed document
+    :rtype: Any
+    """
+    return orjson.loads(content) if ORJSON else json.loads(content)
+
+
+def response_json(response: Response) -> Any:
+    """
+    Parse the JSON body of a response. Like `Response.json()`, but faster
+    with orjson.
+    """
+    return loads(response.content)
+
+
+def decode(data_class: type[T], data: dict) -> T:
+    """
+    Create a dataclass from a dict of the API. Does the same as
+    `dacite.from_dict` with `settings.dacite_config`, but with a decoder,
+    which is generated once per dataclass.
+
+    :param data_class: dataclass like `Task`
+    :type data_class: type[T]
+    :param data: dict of the API
+    :type data: dict
+    :return: instance of the dataclass
+    :rtype: T
+    """
+    # mypy does not see, that type[T] is hashable, which functools.cache needs
+    cls: type = data_class
+    return decoder(cls)(data)
+
+
+@functools.cache
+def decoder(data_class: type) -> Callable[[dict], Any]:
+    """
+    Get the decoder of a dataclass. The decoder is a function, which is
+    generated from the fields of the dataclass. It reads the fields one by
+    one, converts them with the type hooks of `settings.dacite_config` and
+    checks their types like dacite does, but lists and dicts are checked as
+    a whole, not item by item.
+
+    Dataclasses with field types, which the decoder does not know, e.g.
+    unions of several types, are created with `dacite.from_dict`.
+
+    :param data_class: dataclass
+    :type data_class: type
+    :return: function, which creates the dataclass from a dict
+    :rtype: Callable[[dict], Any]
+    """
+    try:
+        return compile_decoder(data_class)
+    except Unsupported:
+
+        def fallback(data: dict) -> Any:
+            return from_dict(
+                data_class=data_class, data=data, config=settings.dacite_config
+            )
+
+        return fallback
+
+
+def decode_lazy(data_class: type[T], data: dict) -> T:
+    """
+    Create a lazy object of a dataclass from a dict of the API. It keeps the
+    dict and decodes a field, when it is read for the first time, e.g. the
+    dates of a task are not parsed, if only `_id` and `name` are used. The
+    object is an instance of a subclass of the dataclass, so its methods
+    work as usual. Missing or invalid fields raise their dacite errors when
+    they are read, not when the object is created, except for the ids,
+    which `__post_init__` reads.
+
+    :param data_class: dataclass like `Task`
+    :type data_class: type[T]
+    :param data: dict of the API
+    :type data: dict
+    :return: instance of a subclass of the dataclass
+    :rtype: T
+    """
+    cls: type = data_class
+    return lazy_decoder(cls)(data)
+
+
+class LazyField:
+    """
+    Descriptor of a field of a lazy object, which decodes the field from the
+    dict of the API on the first access. The value is stored in the
+    instance, which hides the descriptor, so later reads cost nothing.
+
+    :param name: name of the field
+    :type name: str
+    :param decode_field: decoder of the field
+    :type decode_field: Callable[[dict], Any]
+    """
+
+    def __init__(self, name: str, decode_field: Callable[[dict], Any]):
+        self.name = name
+        self.decode_field = decode_field
+
+    def __get__(self, instance: Any, owner: type) -> Any:
+        if instance is None:
+            return self
+        value = instance.__dict__[self.name] = self.decode_field(instance._raw)
+        return value
+
+
+@functools.cache
+def lazy_decoder(data_class: type) -> Callable[[dict], Any]:
+    """
+    Get the function, which creates lazy objects of a dataclass. They are
+    instances of a subclass, which has a `LazyField` for each field of the
+    API. Dataclasses with field types, which the decoder does not know, are
+    decoded completely.
+
+    :param data_class: dataclass
+    :type data_class: type
+    :return: function, which creates a lazy object from a dict
+    :rtype: Callable[[dict], Any]
+    """
+    try:
+        fields = compile_fields(data_class)
+    except Unsupported:
+        return decoder(data_class)
+    name = f'Lazy{data_class.__name__}'
+    attributes: dict[str, Any] = {
+        field: LazyField(field, decode_field) for field, decode_field in fields.items()
+    }
+    attributes.update(__module__=data_class.__module__, __qualname__=name)
+    lazy_class = type(name, (data_class,), attributes)
+    # internal fields, which the __init__ of the dataclass would create
+    factories = [
+        (field.name, field.default_factory)
+        for field in dataclasses.fields(data_class)
+        if not field.init and field.default_factory is not dataclasses.MISSING
+    ]
+    post_init = getattr(data_class, '__post_init__', None)
+
+    def create(data: dict) -> Any:
+        instance: Any = object.__new__(lazy_class)
+        instance._raw = data
+        for field, factory in factories:
+            setattr(instance, field, factory())
+        if post_init is not None:
+            post_init(instance)
+        return instance
+
+    return create
+
+
+def compile_decoder(data_class: type) -> Callable[[dict], Any]:
+    """
+    Generate the decoder of a dataclass. See `decoder`.
+    """
+    hints = typing.get_type_hints(data_class)
+    namespace = decoder_namespace(data_class)
+    lines = ['def decode(data):', '    get = data.get']
+    arguments = []
+    for index, field in enumerate(dataclasses.fields(data_class)):
+        if field.init:
+            lines += [
+                f'    {line}' for line in field_lines(field, index, hints, namespace)
+            ]
+            arguments.append(f'{field.name}=v{index}')
+    lines.append(f'    return cls({", ".join(arguments)})')
+    exec('\n'.join(lines), namespace)
+    return namespace['decode']
+
+
+def compile_fields(data_class: type) -> dict[str, Callable[[dict], Any]]:
+    """
+    Generate a decoder for each field of a dataclass, which reads the field
+    from a dict of the API. They are used by lazy objects.
+
+    :param data_class: dataclass
+    :type data_class: type
+    :return: decoders by field name
+    :rtype: dict[str, Callable[[dict], Any]]
+    """
+    hints = typing.get_type_hints(data_class)
+    namespace = decoder_namespace(data_class)
+    names = {}
+    for index, field in enumerate(dataclasses.fields(data_class)):
+        if field.init:
+            lines = [f'def f{index}(data):', '    get = data.get']
+            lines += [
+                f'    {line}' for line in field_lines(field, index, hints, namespace)
+            ]
+            lines.append(f'    return v{index}')
+            exec('\n'.join(lines), namespace)
+            names[field.name] = f'f{index}'
+    return {name: namespace[function] for name, function in names.items()}
+
+
+def decoder_namespace(data_class: type) -> dict[str, Any]:
+    """
+    Create the namespace, in which the code of decoders is executed.
+    """
+    return {
+        'cls': data_class,
+        'DaciteFieldError': DaciteFieldError,
+        'MISSING': dataclasses.MISSING,
+        'MissingValueError': MissingValueError,
+        'WrongTypeError': WrongTypeError,
+    }
+
+
+def field_lines(
+    field: dataclasses.Field,
+    index: int,
+    hints: dict[str, Any],
+    namespace: dict[str, Any],
+) -> list[str]:
+    """
+    Generate the lines, which read a field from the dict `data` with its
+    `get` method into the variable `v<index>`.
+
+    :param field: field of the dataclass
+    :type field: dataclasses.Field
+    :param index: index of the field, for the names in the namespace
+    :type index: int
+    :param hints: resolved type hints of the dataclass
+    :type hints: dict[str, Any]
+    :param namespace: namespace of the decoder
+    :type namespace: dict[str, Any]
+    :return: lines of code
+    :rtype: list[str]
+    """
+    name = field.name
+    variable = f'v{index}'
+    optional, field_type = split_optional(hints[name])
+    lines = [f'{variable} = get({name!r}, MISSING)', f'if {variable} is MISSING:']
+    # missing values get the default of the field, or None if optional
+    if field.default is not dataclasses.MISSING:
+        namespace[f'd{index}'] = field.default
+        lines.append(f'    {variable} = d{index}')
+    elif field.default_factory is not dataclasses.MISSING:
+        namespace[f'd{index}'] = field.default_factory
+        lines.append(f'    {variable} = d{index}()')
+    elif optional:
+        lines.append(f'    {variable} = None')
+    else:
+        lines.append(f'    raise MissingValueError({name!r})')
+    lines.append(f'elif {variable} is not None:' if optional else 'else:')
+    namespace[f't{index}'] = hints[name]
+    lines += [
+        f'    {line}'
+        for line in convert_lines(field_type, variable, index, name, namespace)
+    ]
+    return lines
+
+
+def split_optional(field_type: Any) -> tuple[bool, Any]:
+    """
+    Split `Optional[X]` and `X | None` into True and X.
+    """
+    if typing.get_origin(field_type) in (Union, types.UnionType):
+        members = [
+            member
+            for member in typing.get_args(field_type)
+            if member is not type(None)
+        ]
+        if len(members) != 1:
+            raise Unsupported(field_type)
+        return True, members[0]
+    return False, field_type
+
+
+def convert_lines(
+    field_type: Any,
+    variable: str,
+    index: int,
+    name: str,
+    namespace: dict[str, Any],
+) -> list[str]:
+    """
+    Generate the lines, which convert and check a value, which is not None.
+
+    :param field_type: type of the field without Optional
+    :type field_type: Any
+    :param variable: variable of the value
+    :type variable: str
+    :param index: index of the field, for the names in the namespace
+    :type index: int
+    :param name: name of the field for errors
+    :type name: str
+    :param namespace: namespace of the decoder
+    :type namespace: dict[str, Any]
+    :return: lines of code
+    :rtype: list[str]
+    """
+    error = f'raise WrongTypeError(t{index}, {variable}, {name!r})'
+    hooks = settings.dacite_config.type_hooks
+    if field_type in hooks:
+        namespace[f'h{index}'] = hooks[field_type]
+        return [f'{variable} = h{index}({variable})']
+    if field_type is Any:
+        return ['pass']
+    if isinstance(field_type, type) and dataclasses.is_dataclass(field_type):
+        namespace[f'h{index}'] = decoder(field_type)
+        return [
+            f'if not isinstance({variable}, dict):',
+            f'    {error}',
+            'try:',
+            f'    {variable} = h{index}({variable})',
+            'except DaciteFieldError as error:',
+            f'    error.update_path({name!r})',
+            '    raise',
+        ]
+    origin = typing.get_origin(field_type) or field_type
+    if origin is Literal:
+        namespace[f'l{index}'] = typing.get_args(field_type)
+        return [f'if {variable} not in l{index}:', f'    {error}']
+    if origin in PLAIN_TYPES:
+        namespace[f'p{index}'] = origin
+        return [f'if not isinstance({variable}, p{index}):', f'    {error}']
+    raise Unsupported(field_type)
@@ -0,0 +1,535 @@
+import asyncio
+import json
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import BinaryIO, Optional
+
+from httpx import Response, TransportError
+
+from .helpers import validate_response
+from .tracing import annotate
+from .types import ApiClientProtocol, AsyncApiClientProtocol
+from .upload import Progress
+
+# default size of the blocks, which are written to the file while downloading
+DOWNLOAD_CHUNK_SIZE: int = 1024 * 1024
+# suffix of incomplete downloads, which are resumed by the next download
+PART_SUFFIX: str = '.part'
+# suffix of the file next to a part file, which keeps the validator and size
+# of the downloaded version
+META_SUFFIX: str = '.meta'
+# default size of the byte ranges of a segmented download
+SEGMENT_SIZE: int = 16 * 1024 * 1024
+# smallest byte range, which is worth an extra request
+MIN_SEGMENT_SIZE: int = 1024 * 1024
+
+CONTENT_RANGE = re.compile(r'bytes (\d+)-\d+/(\d+|\*)')
+
+
+@dataclass
+class DownloadReport:
+    """
+    Result of a download.
+
+    :attr size: size of the downloaded file in bytes
+    :atype size: int
+    :attr received: number of bytes received by this download, without the
+        part, which was already on disk
+    :atype received: int
+    :attr resumed: number of bytes of an earlier, interrupted download,
+        which were kept
+    :atype resumed: int
+    :attr seconds: duration of the download
+    :atype seconds: float
+    """
+
+    size: int = 0
+    received: int = 0
+    resumed: int = 0
+    seconds: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """
+        Received bytes per second.
+        """
+        return self.received / self.seconds if self.seconds else 0.0
+
+
+def content_range(response: Response) -> Optional[tuple[int, Optional[int]]]:
+    """
+    Read the `Content-Range` header of a partial response.
+
+    :param response: response to a range request
+    :type response: Response
+    :return: first byte and total size, which is None if the server does not
+        know it, or None if the response has no valid header
+    :rtype: Optional[tuple[int, Optional[int]]]
+    """
+    match = CONTENT_RANGE.match(response.headers.get('content-range', ''))
+    if match is None:
+        return None
+    return int(match[1]), None if match[2] == '*' else int(match[2])
+
+
+def response_validator(response: Response) -> Optional[str]:
+    """
+    Get the validator of a response, which identifies the version of the
+    file in an `If-Range` header: a strong `ETag`, or else the
+    `Last-Modified` date.
+
+    :param response: response of a download
+    :type response: Response
+    :return: validator or None, if the response has none
+    :rtype: Optional[str]
+    """
+    etag = response.headers.get('etag')
+    # weak ETags are not allowed in If-Range
+    if etag and not etag.startswith('W/'):
+        return etag
+    return response.headers.get('last-modified')
+
+
+def plan_segments(
+    size: int, workers: int, segment_size: int = SEGMENT_SIZE
+) -> list[tuple[int, int]]:
+    """
+    Split a file into byte ranges, which are downloaded concurrently. Small
+    files are split into one range per worker, large files into ranges of
+    `segment_size`, so fast workers take over the rest of slow ones.
+
+    :param size: file size in bytes
+    :type size: int
+    :param workers: number of concurrent requests
+    :type workers: int
+    :param segment_size: maximum size of a range
+    :type segment_size: int
+    :return: first and last byte of each range
+    :rtype: list[tuple[int, int]]
+    """
+    length = max(MIN_SEGMENT_SIZE, min(segment_size, -(-size // workers)))
+    return [
+        (start, min(start + length, size) - 1) for start in range(0, size, length)
+    ]
+
+
+class DownloadTarget:
+    """
+    Destination of a download, which is either a local path or a writable
+    binary file object.
+
+    A download to a path is written to `<path>.part` first and renamed, when
+    it is complete. An existing part file of an interrupted download is
+    continued with a HTTP range request. The `ETag` or `Last-Modified`
+    header of the first response is kept in `<path>.part.meta` and sent as
+    `If-Range`, so the server sends the whole file, if it changed since.
+    If the server does not support ranges, the download starts again.
+
+    :param target: local path or binary file object
+    :type target: str | os.PathLike | BinaryIO
+    :param resume: continue an existing part file
+    :type resume: bool
+    :param progress: function, which receives the number of bytes written
+        since its last call. If the download starts again, the bytes written
+        before are reported as negative number first.
+    :type progress: Optional[Progress]
+    """
+
+    def __init__(
+        self,
+        target: str | os.PathLike | BinaryIO,
+        resume: bool = True,
+        progress: Optional[Progress] = None,
+    ):
+        self.progress = progress
+        self.received = 0
+        # validator and total size of the downloaded version of the file
+        self.validator: Optional[str] = None
+        self.size: Optional[int] = None
+        if isinstance(target, (str, os.PathLike)):
+            self.path: Optional[str] = os.fspath(target)
+            part = self.path + PART_SUFFIX
+            # a part file can only be continued, if its version is known
+            exists = resume and os.path.exists(part) and self._read_meta()
+            self.file: BinaryIO = open(part, 'r+b' if exists else 'wb')
+            self.start: Optional[int] = 0
+            self.offset = self.file.seek(0, os.SEEK_END)
+        else:
+            self.path = None
+            self.file = target
+            self.start = target.tell() if target.seekable() else None
+            self.offset = 0
+        self.resumed = self.offset
+
+    def _read_meta(self) -> bool:
+        """
+        Read the validator and size of the part file.
+
+        :return: True, if the part file has a validator
+        :rtype: bool
+        """
+        try:
+            with open(f'{self.path}{PART_SUFFIX}{META_SUFFIX}', 'r') as file:
+                meta = json.load(file)
+        except (OSError, ValueError):
+            return False
+        self.validator = meta.get('validator')
+        self.size = meta.get('size')
+        return self.validator is not None
+
+    def _write_meta(self) -> None:
+        """
+        Keep the validator and size of the part file for a later resume.
+        """
+        if self.path is None:
+            return
+        with open(f'{self.path}{PART_SUFFIX}{META_SUFFIX}', 'w') as file:
+            json.dump({'validator': self.validator, 'size': self.size}, file)
+
+    def _remove_meta(self) -> None:
+        """
+        Remove the file with the validator and size of the part file.
+        """
+        if self.path is not None:
+            try:
+                os.remove(f'{self.path}{PART_SUFFIX}{META_SUFFIX}')
+            except FileNotFoundError:
+                pass
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """
+        Request headers, which ask for the missing part of the file, if it
+        did not change on the server.
+        """
+        if not self.offset:
+            return {}
+        headers = {'Range': f'bytes={self.offset}-'}
+        if self.validator is not None:
+            headers['If-Range'] = self.validator
+        return headers
+
+    def begin(self, response: Response) -> None:
+        """
+        Prepare the file for the body of a response. If the server sends the
+        whole file instead of the requested range, the file is truncated.
+        A range of another version of the file removes the written bytes and
+        raises an error.
+
+        :param response: successful, streamed response
+        :type response: Response
+        """
+        if response.status_code == 206:
+            served = content_range(response)
+            if (
+                served
+                and served[0] == self.offset
+                and (self.size is None or served[1] in (None, self.size))
+            ):
+                return
+            self.restart()
+            raise Exception(
+                'Failed to resume download. Unexpected range: '
+                f'{response.headers.get("content-range")}'
+            )
+        if self.offset:
+            self.restart()
+        self.validator = response_validator(response)
+        length = response.headers.get('content-length')
+        encoded = 'content-encoding' in response.headers
+        self.size = int(length) if length and not encoded else None
+        if self.validator is not None:
+            self._write_meta()
+
+    def restart(self) -> None:
+        """
+        Remove the written bytes, so the download can start again.
+        """
+        if self.start is None:
+            raise Exception(
+                'Failed to resume download, the file object is not seekable.'
+            )
+        self.file.seek(self.start)
+        self.file.truncate()
+        if self.progress:
+            self.progress(-self.offset)
+        self.offset = self.resumed = 0
+        self.validator = self.size = None
+        self._remove_meta()
+
+    def write(self, chunk: bytes) -> None:
+        """
+        Write a block of the response body.
+        """
+        self.file.write(chunk)
+        self.offset += len(chunk)
+        self.received += len(chunk)
+        if self.progress:
+            self.progress(len(chunk))
+
+    def close(self, complete: bool) -> None:
+        """
+        Close the part file and rename it, if the download is complete. An
+        empty part file of a failed download is removed. The file objects of
+        the caller stay open.
+
+        :param complete: True, if the whole file was received
+        :type complete: bool
+        """
+        if self.path is None:
+            self.file.flush()
+            return
+        self.file.close()
+        if complete:
+            os.replace(self.path + PART_SUFFIX, self.path)
+            self._remove_meta()
+        elif not self.offset:
+            os.remove(self.path + PART_SUFFIX)
+            self._remove_meta()
+
+    def report(self, seconds: float) -> DownloadReport:
+        """
+        Create the report of the download.
+        """
+        return DownloadReport(
+            size=self.offset,
+            received=self.received,
+            resumed=self.resumed,
+            seconds=seconds,
+        )
+
+
+class SegmentedTarget:
+    """
+    Destination of a segmented download. The file is allocated with its
+    final size first, and the byte ranges are written to their position by
+    many threads at the same time with `os.pwrite`.
+
+    The download is written to `<path>.part` and renamed, when it is
+    complete. Unlike `DownloadTarget`, a segmented download is not resumed.
+    The validator of the file is sent as `If-Range` with each range, so the
+    ranges can not come from different versions of the file.
+
+    :param path: local path
+    :type path: str | os.PathLike
+    :param size: file size in bytes
+    :type size: int
+    :param progress: function, which receives the number of written bytes.
+        It is called from several threads.
+    :type progress: Optional[Progress]
+    :param validator: `ETag` or `Last-Modified` of the file, see
+        `response_validator`
+    :type validator: Optional[str]
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        size: int,
+        progress: Optional[Progress] = None,
+        validator: Optional[str] = None,
+    ):
+        self.path = os.fspath(path)
+        self.size = size
+        self.validator = validator
+        self.progress = progress
+        self.received = 0
+        self._lock = threading.Lock()
+        self.fd = os.open(
+            self.path + PART_SUFFIX,
+            os.O_RDWR | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0),
+            0o666,
+        )
+        if hasattr(os, 'posix_fallocate') and size:
+            os.posix_fallocate(self.fd, 0, size)
+        else:
+            os.truncate(self.fd, size)
+
+    def headers(self, start: int, end: int) -> dict[str, str]:
+        """
+        Request headers, which ask for a byte range of the file, if it did
+        not change on the server.
+        """
+        headers = {'Range': f'bytes={start}-{end}'}
+        if self.validator is not None:
+            headers['If-Range'] = self.validator
+        return headers
+
+    def check(self, response: Response, start: int) -> None:
+        """
+        Check, that a response contains a range of the file, which starts at
+        `start`, and has the size of the file. A changed file is answered
+        with the whole file instead of the range, because of `If-Range`.
+
+        :param response: response to a range request
+        :type response: Response
+        :param start: first requested byte
+        :type start: int
+        """
+        served = content_range(response)
+        if (
+            response.status_code != 206
+            or served is None
+            or served[0] != start
+            or served[1] not in (None, self.size)
+        ):
+            raise Exception(
+                f'Failed to download range from {start}. Response: '
+                f'{response.status_code} {response.headers.get("content-range")}'
+            )
+
+    def write(self, offset: int, chunk: bytes) -> None:
+        """
+        Write a block of a byte range to its position in the file.
+
+        :param offset: position of the block in the file
+        :type offset: int
+        :param chunk: block of the response body
+        :type chunk: bytes
+        """
+        view = memoryview(chunk)
+        while view:
+            if hasattr(os, 'pwrite'):
+                written = os.pwrite(self.fd, view, offset)
+            else:
+                with self._lock:
+                    os.lseek(self.fd, offset, os.SEEK_SET)
+                    written = os.write(self.fd, view)
+            view = view[written:]
+            offset += written
+        with self._lock:
+            self.received += len(chunk)
+            if self.progress:
+                self.progress(len(chunk))
+
+    def close(self, complete: bool) -> None:
+        """
+        Close the part file and rename it, if the download is complete, or
+        remove it otherwise.
+
+        :param complete: True, if all ranges were received
+        :type complete: bool
+        """
+        os.close(self.fd)
+        if complete:
+            os.replace(self.path + PART_SUFFIX, self.path)
+        else:
+            os.remove(self.path + PART_SUFFIX)
+
+    def report(self, seconds: float) -> DownloadReport:
+        """
+        Create the report of the download.
+        """
+        return DownloadReport(
+            size=self.size, received=self.received, seconds=seconds
+        )
+
+
+def stream_to_target(
+    api: ApiClientProtocol,
+    endpoint: str,
+    target: str | os.PathLike | BinaryIO,
+    resume: bool,
+    chunk_size: int,
+    progress: Optional[Progress],
+    params: Optional[dict] = None,
+) -> DownloadReport:
+    """
+    Stream a download endpoint to the target. Broken connections are
+    resumed with a range request according to the retry policy.
+
+    :param api: API client
+    :type api: ApiClientProtocol
+    :param endpoint: api endpoint of the download
+    :type endpoint: str
+    :param target: local path or writable binary file object
+    :type target: str | os.PathLike | BinaryIO
+    :param resume: continue an interrupted download to the same path
+    :type resume: bool
+    :param chunk_size: size of the blocks written to the target
+    :type chunk_size: int
+    :param progress: function, which receives the number of written bytes
+    :type progress: Optional[Progress]
+    :param params: query parameters
+    :type params: Optional[dict]
+    :return: size and throughput of the download
+    :rtype: DownloadReport
+    """
+    output = DownloadTarget(target, resume, progress)
+    started = time.perf_counter()
+    complete = False
+    attempt = 1
+    try:
+        while not complete:
+            try:
+                with api.stream(
+                    'GET', endpoint, params=params, headers=output.headers
+                ) as response:
+                    if response.status_code == 416 and output.offset:
+                        # the part file is complete or outdated
+                        output.restart()
+                        continue
+                    if response.status_code not in (200, 206):
+                        response.read()
+                        validate_response(response, (200, 206), 'download')
+                    output.begin(response)
+                    for chunk in response.iter_bytes(chunk_size):
+                        output.write(chunk)
+                    complete = True
+            except TransportError as error:
+                if not api.retry.should_retry('GET', attempt, error=error):
+                    raise
+                time.sleep(api.retry.delay(attempt))
+                attempt += 1
+    finally:
+        output.close(complete)
+    annotate({'pyblisher.download.size': output.received})
+    return output.report(time.perf_counter() - started)
+
+
+async def astream_to_target(
+    aapi: AsyncApiClientProtocol,
+    endpoint: str,
+    target: str | os.PathLike | BinaryIO,
+    resume: bool,
+    chunk_size: int,
+    progress: Optional[Progress],
+    params: Optional[dict] = None,
+) -> DownloadReport:
+    """
+    Stream a download endpoint to the target asynchronously. The blocks are
+    written in a worker thread. See `stream_to_target`.
+    """
+    output = await asyncio.to_thread(DownloadTarget, target, resume, progress)
+    started = time.perf_counter()
+    complete = False
+    attempt = 1
+    try:
+        while not complete:
+            try:
+                async with aapi.stream(
+                    'GET', endpoint, params=params, headers=output.headers
+                ) as response:
+                    if response.status_code == 416 and output.offset:
+                        # the part file is complete or outdated
+                        await asyncio.to_thread(output.restart)
+                        continue
+                    if response.status_code not in (200, 206):
+                        await response.aread()
+                        validate_response(response, (200, 206), 'download')
+                    await asyncio.to_thread(output.begin, response)
+                    async for chunk in response.aiter_bytes(chunk_size):
+                        await asyncio.to_thread(output.write, chunk)
+                    complete = True
+            except TransportError as error:
+                if not aapi.retry.should_retry('GET', attempt, error=error):
+                    raise
+                await asyncio.sleep(aapi.retry.delay(attempt))
+                attempt += 1
+    finally:
+        await asyncio.to_thread(output.close, complete)
+    annotate({'pyblisher.download.size': output.received})
+    return output.report(time.perf_counter() - started)
@@ -1,9 +1,18 @@
 import os
 from datetime import datetime
 
+from httpx import Response
 from tqdm import tqdm
 
+from .exceptions import (
+    AuthenticationError,
+    InternalServerError,
+    MatchFailed,
+    ObjectNotFound,
+    PermissionError,
+)
 from .types import ExternalSource, InternalSource, SourceProperty
+from .upload import UPLOAD_CHUNK_SIZE
 
 
 ############## Dacite Type-Hooks ##############
@@ -37,10 +46,60 @@ def parse_source_property(value: dict) -> SourceProperty:
         raise ValueError(f'Unknown SourceProperty type: {value["type"]}')
 
 
+############## Responses ##############
+def validate_response(
+    response: Response, expected: int | tuple[int, ...], action: str
+) -> Response:
+    """
+    Validate the status code of an API response. Sync and async methods of the
+    resource classes share this check, so both raise the same exceptions.
+
+    :param response: response of the VC Publisher API
+    :type response: Response
+    :param expected: status code(s) of a successful request
+    :type expected: int | tuple[int, ...]
+    :param action: description of the request for the error message,
+        e.g. 'get bucket'
+    :type action: str
+    :return: the unchanged response
+    :rtype: Response
+    """
+    if isinstance(expected, int):
+        expected = (expected,)
+    if response.status_code in expected:
+        return response
+    match response.status_code:
+        case 400:  # Match failed
+            raise MatchFailed(
+                f'{response.status_code} - {response.json()["reason"]}'
+            )
+        case 401:  # Authentication failed
+            raise AuthenticationError(
+                f'{response.status_code} - {response.json()["reason"]}'
+            )
+        case 403:  # Permission denied
+            raise PermissionError(
+                f'{response.status_code} - {response.json()["reason"]}'
+            )
+        case 404:  # Not found
+            raise ObjectNotFound(
+                f'{response.status_code} - {response.json()["reason"]}'
+            )
+        case 500:  # Internal server error
+            raise InternalServerError(
+                f'{response.status_code} - {response.json()["reason"]}'
+            )
+        case _:  # All other cases
+            raise Exception(
+                f'Failed to {action}. Response: {response.__dict__}'
+            )
+
+
 ############## other ##############
-def file_upload_generator(filepath: str):
+def file_upload_generator(filepath: str, chunk_size: int = UPLOAD_CHUNK_SIZE):
     """
     Generator to upload a file with progress bar.
+    `Bucket.upload` streams files itself and accepts a progress function.
 
     :yield: file-like object
     :rtype: file-like object
@@ -50,6 +109,6 @@ def file_upload_generator(filepath: str):
         ascii=True, unit_scale=True, unit='B', unit_divisor=1024, total=total
     ) as bar:
         with open(filepath, 'rb') as file:
-            while chunk := file.read(1024):
+            while chunk := file.read(chunk_size):
                 bar.update(len(chunk))
                 yield chunk
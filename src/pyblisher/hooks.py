@@ -0,0 +1,200 @@
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Optional
+
+from httpx import Request, Response
+
+
+@dataclass
+class RequestEvent:
+    """
+    Describes one attempt of a request to the VC Publisher API. The same
+    object is passed to all callbacks of the attempt.
+
+    :attr method: HTTP method like `GET`
+    :atype method: str
+    :attr endpoint: api endpoint like `project/<project_id>/`
+    :atype endpoint: str
+    :attr request: request, which is sent. Callbacks of the `request` hook
+        may add headers.
+    :atype request: Request
+    :attr attempt: number of the attempt, starting with 1
+    :atype attempt: int
+    :attr started: start time of the attempt from `time.perf_counter()`
+    :atype started: float
+    :attr elapsed: seconds until the response headers or the error arrived
+    :atype elapsed: Optional[float]
+    :attr asynchronous: True, if the request is sent by an asynchronous
+        client, whose `trace` extensions must be coroutine functions
+    :atype asynchronous: bool
+    :attr context: state, which callbacks keep between the request and the
+        response of an attempt
+    :atype context: dict[str, Any]
+    """
+
+    method: str
+    endpoint: str
+    request: Request
+    attempt: int = 1
+    started: float = field(default_factory=time.perf_counter)
+    elapsed: Optional[float] = None
+    asynchronous: bool = False
+    context: dict[str, Any] = field(default_factory=dict)
+
+
+RequestHook = Callable[[RequestEvent], None]
+ResponseHook = Callable[[RequestEvent, Response], None]
+ErrorHook = Callable[[RequestEvent, Exception], None]
+
+
+class Hooks:
+    """
+    Callbacks, which an API client calls for every attempt of a request:
+    `request` before it is sent, `response` when the response headers
+    arrived and `error`, if no response arrived. Without callbacks, the
+    client only checks that the lists are empty, so instrumentation costs
+    nothing when it is not used.
+
+    The callbacks run in the thread or event loop of the request and should
+    return quickly.
+
+    Example:
+        ```
+        hooks = Hooks()
+
+        @hooks.on_response
+        def slow(event, response):
+            if event.elapsed > 1:
+                print(event.method, event.endpoint, event.elapsed)
+
+        api = ApiClient(hooks=hooks)
+        ```
+
+    :param request: callbacks before a request is sent
+    :type request: Iterable[RequestHook]
+    :param response: callbacks after a response arrived
+    :type response: Iterable[ResponseHook]
+    :param error: callbacks after a request failed without response
+    :type error: Iterable[ErrorHook]
+    """
+
+    def __init__(
+        self,
+        request: Iterable[RequestHook] = (),
+        response: Iterable[ResponseHook] = (),
+        error: Iterable[ErrorHook] = (),
+    ):
+        self.request: list[RequestHook] = list(request)
+        self.response: list[ResponseHook] = list(response)
+        self.error: list[ErrorHook] = list(error)
+
+    def __bool__(self) -> bool:
+        return bool(self.request or self.response or self.error)
+
+    ############## Registration ##############
+    def on_request(self, callback: RequestHook) -> RequestHook:
+        """
+        Register a callback before requests. Can be used as decorator.
+        """
+        self.request.append(callback)
+        return callback
+
+    def on_response(self, callback: ResponseHook) -> ResponseHook:
+        """
+        Register a callback after responses. Can be used as decorator.
+        """
+        self.response.append(callback)
+        return callback
+
+    def on_error(self, callback: ErrorHook) -> ErrorHook:
+        """
+        Register a callback after failed requests. Can be used as decorator.
+        """
+        self.error.append(callback)
+        return callback
+
+    ############## Dispatch ##############
+    def emit_request(
+        self,
+        method: str,
+        endpoint: str,
+        request: Request,
+        attempt: int,
+        asynchronous: bool = False,
+    ) -> RequestEvent:
+        """
+        Start an attempt and call the `request` callbacks.
+
+        :return: event of the attempt
+        :rtype: RequestEvent
+        """
+        event = RequestEvent(
+            method, endpoint, request, attempt, asynchronous=asynchronous
+        )
+        for callback in self.request:
+            callback(event)
+        return event
+
+    def emit_response(self, event: RequestEvent, response: Response) -> None:
+        """
+        Finish an attempt with a response and call the `response` callbacks.
+        """
+        event.elapsed = time.perf_counter() - event.started
+        for callback in self.response:
+            callback(event, response)
+
+    def emit_error(self, event: RequestEvent, error: Exception) -> None:
+        """
+        Finish an attempt with an error and call the `error` callbacks.
+        """
+        event.elapsed = time.perf_counter() - event.started
+        for callback in self.error:
+            callback(event, error)
+
+
+def logging_hooks(
+    logger: Optional[logging.Logger] = None, level: int = logging.DEBUG
+) -> Hooks:
+    """
+    Create hooks, which log every request with its status and duration.
+
+    Example:
+        ```
+        logging.basicConfig(level=logging.DEBUG)
+        api = ApiClient(hooks=logging_hooks())
+        ```
+
+    :param logger: logger, default is the `pyblisher` logger
+    :type logger: Optional[logging.Logger]
+    :param level: log level of successful requests, errors are logged as
+        warnings
+    :type level: int
+    :return: hooks for an API client
+    :rtype: Hooks
+    """
+    logger = logger or logging.getLogger('pyblisher')
+
+    def response(event: RequestEvent, response: Response) -> None:
+        if logger.isEnabledFor(level):
+            logger.log(
+                level,
+                '%s %s -> %s in %.3fs (attempt %s)',
+                event.method,
+                event.endpoint,
+                response.status_code,
+                event.elapsed,
+                event.attempt,
+            )
+
+    def error(event: RequestEvent, error: Exception) -> None:
+        logger.warning(
+            '%s %s failed after %.3fs (attempt %s): %r',
+            event.method,
+            event.endpoint,
+            event.elapsed,
+            event.attempt,
+            error,
+        )
+
+    return Hooks(response=[response], error=[error])
@@ -0,0 +1,399 @@
+import re
+import threading
+import time
+from bisect import bisect_left
+from dataclasses import dataclass, field
+
+from httpx import Response
+
+from .hooks import Hooks, RequestEvent
+
+# upper bounds of the latency histograms in seconds
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+# upper bounds of the histogram of the time waiting for a pooled connection
+POOL_WAIT_BUCKETS: tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+)
+
+# path segments of the API, which are followed by an id
+RESOURCES = frozenset(
+    {
+        'project',
+        'data-bucket',
+        'datasource',
+        'task',
+        'job',
+        'operation',
+        'user',
+        'group',
+    }
+)
+# path segments after a resource, which are no id
+ACTIONS = frozenset({'sync'})
+ID = re.compile(r'^([0-9a-fA-F]{24}|[0-9a-fA-F-]{36}|\d+)$')
+
+
+def endpoint_template(endpoint: str) -> str:
+    """
+    Replace the ids in an endpoint by `{id}`, so the requests of all objects
+    of a kind are counted together, e.g. `project/{id}/task/{id}/`.
+
+    :param endpoint: api endpoint like `project/<project_id>/`
+    :type endpoint: str
+    :return: endpoint template
+    :rtype: str
+    """
+    segments = endpoint.split('/')
+    for index, segment in enumerate(segments):
+        if segment and segment not in ACTIONS and (
+            (index and segments[index - 1] in RESOURCES) or ID.match(segment)
+        ):
+            segments[index] = '{id}'
+    return '/'.join(segments)
+
+
+class Histogram:
+    """
+    Distribution of measured values in fixed buckets, like a Prometheus
+    histogram.
+
+    :param buckets: ascending upper bounds of the buckets
+    :type buckets: tuple[float, ...]
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        # the last count is the `+Inf` bucket
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """
+        Add a measured value.
+        """
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    @property
+    def mean(self) -> float:
+        """
+        Average of the values.
+        """
+        return self.sum / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile as the upper bound of the bucket it falls into.
+
+        :param q: quantile between 0 and 1, e.g. 0.99
+        :type q: float
+        :return: upper bound, `inf` if it is above the largest bucket
+        :rtype: float
+        """
+        rank = q * self.count
+        total = 0
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            if total >= rank and total:
+                return bound
+        return float('inf')
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        """
+        Cumulative counts per upper bound, as exported by OpenMetrics.
+        """
+        total = 0
+        result = []
+        for bound, count in zip((*self.buckets, float('inf')), self.counts):
+            total += count
+            result.append(('+Inf' if bound == float('inf') else repr(bound), total))
+        return result
+
+
+@dataclass
+class EndpointMetrics:
+    """
+    Metrics of the requests with one method to one endpoint template.
+
+    :attr latency: seconds until the response headers arrived, per attempt
+    :atype latency: Histogram
+    :attr statuses: number of responses per status code
+    :atype statuses: dict[int, int]
+    :attr errors: number of attempts without response per exception type
+    :atype errors: dict[str, int]
+    :attr retries: number of repeated attempts
+    :atype retries: int
+    :attr sent: bytes of the request bodies
+    :atype sent: int
+    :attr received: bytes of the response bodies
+    :atype received: int
+    """
+
+    latency: Histogram = field(default_factory=Histogram)
+    statuses: dict[int, int] = field(default_factory=dict)
+    errors: dict[str, int] = field(default_factory=dict)
+    retries: int = 0
+    sent: int = 0
+    received: int = 0
+
+
+class Metrics:
+    """
+    In-process registry of request metrics of one or more API clients,
+    grouped by method and endpoint template. It collects the metrics with
+    hooks, so nothing is measured for clients without it.
+
+    Example:
+        ```
+        metrics = Metrics()
+        api = ApiClient(metrics=metrics)
+        ...
+        for method, endpoint, stats in metrics.slowest(5):
+            print(method, endpoint, stats.latency.mean)
+        print(metrics.openmetrics())
+        ```
+
+    :param buckets: upper bounds of the latency histograms in seconds
+    :type buckets: tuple[float, ...]
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.endpoints: dict[tuple[str, str], EndpointMetrics] = {}
+        self.pool_wait = Histogram(POOL_WAIT_BUCKETS)
+        self._lock = threading.Lock()
+
+    def attach(self, hooks: Hooks) -> None:
+        """
+        Register the callbacks, which collect the metrics, in the hooks of a
+        client.
+
+        :param hooks: hooks of an API client
+        :type hooks: Hooks
+        """
+        hooks.on_request(self._on_request)
+        hooks.on_response(self._on_response)
+        hooks.on_error(self._on_error)
+
+    ############## Queries ##############
+    def get(self, method: str, endpoint: str) -> EndpointMetrics:
+        """
+        Get the metrics of an endpoint.
+
+        :param method: HTTP method like `GET`
+        :type method: str
+        :param endpoint: endpoint or endpoint template
+        :type endpoint: str
+        :return: metrics, empty if there was no request
+        :rtype: EndpointMetrics
+        """
+        return self.endpoints.get(
+            (method.upper(), endpoint_template(endpoint)), EndpointMetrics()
+        )
+
+    def slowest(self, count: int = 10) -> list[tuple[str, str, EndpointMetrics]]:
+        """
+        Get the endpoints, which took the most time in total.
+
+        :param count: number of endpoints
+        :type count: int
+        :return: method, endpoint template and metrics
+        :rtype: list[tuple[str, str, EndpointMetrics]]
+        """
+        with self._lock:
+            items = sorted(
+                self.endpoints.items(),
+                key=lambda item: item[1].latency.sum,
+                reverse=True,
+            )
+        return [(method, endpoint, stats) for (method, endpoint), stats in items[:count]]
+
+    def reset(self) -> None:
+        """
+        Remove all collected metrics.
+        """
+        with self._lock:
+            self.endpoints = {}
+            self.pool_wait = Histogram(POOL_WAIT_BUCKETS)
+
+    ############## Collection ##############
+    def _endpoint(self, event: RequestEvent) -> EndpointMetrics:
+        """
+        Get the metrics of the endpoint of an event. Call with the lock.
+        """
+        key = (event.method.upper(), endpoint_template(event.endpoint))
+        stats = self.endpoints.get(key)
+        if stats is None:
+            stats = self.endpoints[key] = EndpointMetrics(
+                latency=Histogram(self.buckets)
+            )
+        return stats
+
+    def _on_request(self, event: RequestEvent) -> None:
+        """
+        Trace the connection events of the request to measure the time it
+        waits for a connection of the pool.
+        """
+        started = event.started
+        traced = False
+
+        def first_event() -> None:
+            nonlocal traced
+            if not traced:
+                traced = True
+                wait = time.perf_counter() - started
+                with self._lock:
+                    self.pool_wait.observe(wait)
+
+        if event.asynchronous:
+
+            async def atrace(name: str, info: dict) -> None:
+                first_event()
+
+            event.request.extensions['trace'] = atrace
+        else:
+            event.request.extensions['trace'] = lambda name, info: first_event()
+
+    def _on_response(self, event: RequestEvent, response: Response) -> None:
+        if response.is_closed:
+            received = response.num_bytes_downloaded
+        else:
+            received = int(response.headers.get('content-length') or 0)
+        sent = int(event.request.headers.get('content-length') or 0)
+        with self._lock:
+            stats = self._endpoint(event)
+            stats.latency.observe(event.elapsed or 0.0)
+            status = response.status_code
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+            stats.retries += event.attempt > 1
+            stats.sent += sent
+            stats.received += received
+
+    def _on_error(self, event: RequestEvent, error: Exception) -> None:
+        with self._lock:
+            stats = self._endpoint(event)
+            name = type(error).__name__
+            stats.errors[name] = stats.errors.get(name, 0) + 1
+            stats.retries += event.attempt > 1
+
+    ############## Export ##############
+    def openmetrics(self, prefix: str = 'pyblisher') -> str:
+        """
+        Export the metrics in the OpenMetrics text format, which can be
+        scraped by Prometheus.
+
+        :param prefix: prefix of the metric names
+        :type prefix: str
+        :return: metrics as text
+        :rtype: str
+        """
+        with self._lock:
+            endpoints = sorted(self.endpoints.items())
+            lines = [
+                f'# TYPE {prefix}_request_duration_seconds histogram',
+                f'# UNIT {prefix}_request_duration_seconds seconds',
+                f'# HELP {prefix}_request_duration_seconds '
+                'Time until the response headers arrived.',
+            ]
+            for (method, endpoint), stats in endpoints:
+                labels = f'method="{method}",endpoint="{escape(endpoint)}"'
+                lines += histogram_lines(
+                    f'{prefix}_request_duration_seconds', labels, stats.latency
+                )
+            lines += [
+                f'# TYPE {prefix}_responses counter',
+                f'# HELP {prefix}_responses Responses per status code.',
+            ]
+            for (method, endpoint), stats in endpoints:
+                labels = f'method="{method}",endpoint="{escape(endpoint)}"'
+                for status, count in sorted(stats.statuses.items()):
+                    lines.append(
+                        f'{prefix}_responses_total{{{labels},status="{status}"}} {count}'
+                    )
+            lines += [
+                f'# TYPE {prefix}_request_errors counter',
+                f'# HELP {prefix}_request_errors Attempts without response per error.',
+            ]
+            for (method, endpoint), stats in endpoints:
+                labels = f'method="{method}",endpoint="{escape(endpoint)}"'
+                for error, count in sorted(stats.errors.items()):
+                    lines.append(
+                        f'{prefix}_request_errors_total{{{labels},error="{error}"}} {count}'
+                    )
+            for name, description, attribute in (
+                ('retries', 'Repeated attempts.', 'retries'),
+                ('sent_bytes', 'Bytes of request bodies.', 'sent'),
+                ('received_bytes', 'Bytes of response bodies.', 'received'),
+            ):
+                lines += [
+                    f'# TYPE {prefix}_{name} counter',
+                    f'# HELP {prefix}_{name} {description}',
+                ]
+                for (method, endpoint), stats in endpoints:
+                    labels = f'method="{method}",endpoint="{escape(endpoint)}"'
+                    lines.append(
+                        f'{prefix}_{name}_total{{{labels}}} {getattr(stats, attribute)}'
+                    )
+            lines += [
+                f'# TYPE {prefix}_pool_wait_seconds histogram',
+                f'# UNIT {prefix}_pool_wait_seconds seconds',
+                f'# HELP {prefix}_pool_wait_seconds Time until a pooled connection was used.',
+            ]
+            lines += histogram_lines(f'{prefix}_pool_wait_seconds', '', self.pool_wait)
+        lines.append('# EOF')
+        return '\n'.join(lines) + '\n'
+
+
+def escape(value: str) -> str:
+    """
+    Escape a label value for the OpenMetrics text format.
+    """
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def histogram_lines(name: str, labels: str, histogram: Histogram) -> list[str]:
+    """
+    Format the samples of a histogram for the OpenMetrics text format.
+
+    :param name: metric name
+    :type name: str
+    :param labels: formatted labels without braces, may be empty
+    :type labels: str
+    :param histogram: histogram
+    :type histogram: Histogram
+    :return: lines of the samples
+    :rtype: list[str]
+    """
+    separator = ',' if labels else ''
+    lines = [
+        f'{name}_bucket{{{labels}{separator}le="{bound}"}} {count}'
+        for bound, count in histogram.cumulative()
+    ]
+    suffix = f'{{{labels}}}' if labels else ''
+    lines.append(f'{name}_count{suffix} {histogram.count}')
+    lines.append(f'{name}_sum{suffix} {histogram.sum}')
+    return lines
+
@@ -0,0 +1,285 @@
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Generic, Iterator, Optional, TypeVar
+
+from .decode import response_json
+from .helpers import validate_response
+from .types import ApiClientProtocol, AsyncApiClientProtocol
+
+T = TypeVar('T')
+
+# default number of items per page, the API allows up to 1000
+PAGE_SIZE: int = 100
+# default number of pages, which are requested at the same time by `all()`
+CONCURRENCY: int = 8
+
+
+def is_last_page(content: dict, page: int, limit: int) -> bool:
+    """
+    Check if a page of a paginated list response is the last one.
+
+    :param content: json content of the response
+    :type content: dict
+    :param page: number of the page
+    :type page: int
+    :param limit: requested page size
+    :type limit: int
+    :return: True, if there are no more pages
+    :rtype: bool
+    """
+    if 'totalPages' in content:
+        return page + 1 >= content['totalPages']
+    return len(content['items']) < limit
+
+
+def page_count(content: dict, limit: int) -> int:
+    """
+    Get the total number of pages from the first page of a paginated list
+    response.
+
+    :param content: json content of the first page
+    :type content: dict
+    :param limit: requested page size
+    :type limit: int
+    :return: number of pages
+    :rtype: int
+    """
+    if 'totalPages' in content:
+        return int(content['totalPages'])
+    if 'totalCount' in content:
+        return -(-int(content['totalCount']) // limit)
+    return 1
+
+
+class Paginator(Generic[T]):
+    """
+    Lazy iterator over a paginated list endpoint of the VC Publisher API.
+
+    A page is requested when the consumer reaches it, so only one page (or
+    two, with prefetch) is held in memory at a time. With `prefetch` the
+    following page is requested in a background thread while the current one
+    is processed.
+
+    Example:
+        ```
+        for task in project.iter_tasks(limit=500, prefetch=True):
+            print(task.name)
+        ```
+
+    :param api: API client
+    :type api: ApiClientProtocol
+    :param endpoint: list endpoint like `project/<project_id>/tasks/`
+    :type endpoint: str
+    :param parse: function to create an object from a list item
+    :type parse: Callable[[dict], T]
+    :param params: additional query parameters, e.g. filters
+    :type params: Optional[dict]
+    :param limit: page size (1 - 1000)
+    :type limit: int
+    :param prefetch: request the following page in the background
+    :type prefetch: bool
+    :param action: description of the request for error messages
+    :type action: str
+    :param cache: use the response cache of the client
+    :type cache: bool
+    """
+
+    def __init__(
+        self,
+        api: ApiClientProtocol,
+        endpoint: str,
+        parse: Callable[[dict], T],
+        params: Optional[dict] = None,
+        limit: int = PAGE_SIZE,
+        prefetch: bool = False,
+        action: str = 'get list',
+        cache: bool = True,
+    ):
+        self.api = api
+        self.endpoint = endpoint
+        self.parse = parse
+        self.params = params or {}
+        self.limit = limit
+        self.prefetch = prefetch
+        self.action = action
+        self.cache = cache
+
+    def fetch(self, page: int) -> dict:
+        """
+        Request a single page.
+
+        :param page: number of the page, starting with 0
+        :type page: int
+        :return: json content of the response
+        :rtype: dict
+        """
+        response = self.api.request(
+            'GET',
+            self.endpoint,
+            params={**self.params, 'limit': self.limit, 'page': page},
+            cache=self.cache,
+        )
+        return response_json(validate_response(response, 200, self.action))
+
+    def pages(self) -> Iterator[list[T]]:
+        """
+        Iterate over the pages as lists of objects.
+        """
+        page = 0
+        if not self.prefetch:
+            while True:
+                content = self.fetch(page)
+                yield [self.parse(item) for item in content['items']]
+                if is_last_page(content, page, self.limit):
+                    return
+                page += 1
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            future: Future = executor.submit(self.fetch, page)
+            while True:
+                content = future.result()
+                last = is_last_page(content, page, self.limit)
+                if not last:
+                    future = executor.submit(self.fetch, page + 1)
+                yield [self.parse(item) for item in content['items']]
+                if last:
+                    return
+                page += 1
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def all(self, concurrency: int = CONCURRENCY) -> list[T]:
+        """
+        Get all objects of the list. The first page tells the total count,
+        the remaining pages are then requested concurrently and reassembled
+        in order.
+
+        :param concurrency: maximum number of concurrent requests
+        :type concurrency: int
+        :return: all objects
+        :rtype: list[T]
+        """
+        first = self.fetch(0)
+        items = [self.parse(item) for item in first['items']]
+        pages = range(1, page_count(first, self.limit))
+        if pages:
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(concurrency, len(pages)))
+            ) as executor:
+                for content in executor.map(self.fetch, pages):
+                    items.extend(self.parse(item) for item in content['items'])
+        return items
+
+    def __iter__(self) -> Iterator[T]:
+        for page in self.pages():
+            yield from page
+
+
+class AsyncPaginator(Generic[T]):
+    """
+    Lazy asynchronous iterator over a paginated list endpoint of the VC
+    Publisher API. With `prefetch` the following page is requested in a
+    background task while the current one is processed.
+
+    Example:
+        ```
+        async for task in project.aiter_tasks(limit=500, prefetch=True):
+            print(task.name)
+        ```
+
+    See `Paginator` for the parameters.
+    """
+
+    def __init__(
+        self,
+        api: AsyncApiClientProtocol,
+        endpoint: str,
+        parse: Callable[[dict], T],
+        params: Optional[dict] = None,
+        limit: int = PAGE_SIZE,
+        prefetch: bool = False,
+        action: str = 'get list',
+        cache: bool = True,
+    ):
+        self.api = api
+        self.endpoint = endpoint
+        self.parse = parse
+        self.params = params or {}
+        self.limit = limit
+        self.prefetch = prefetch
+        self.action = action
+        self.cache = cache
+
+    async def fetch(self, page: int) -> dict:
+        """
+        Request a single page.
+
+        :param page: number of the page, starting with 0
+        :type page: int
+        :return: json content of the response
+        :rtype: dict
+        """
+        response = await self.api.request(
+            'GET',
+            self.endpoint,
+            params={**self.params, 'limit': self.limit, 'page': page},
+            cache=self.cache,
+        )
+        return response_json(validate_response(response, 200, self.action))
+
+    async def pages(self) -> AsyncIterator[list[T]]:
+        """
+        Iterate over the pages as lists of objects.
+        """
+        page = 0
+        next_page: Optional[asyncio.Task] = None
+        try:
+            content = await self.fetch(page)
+            while True:
+                last = is_last_page(content, page, self.limit)
+                if self.prefetch and not last:
+                    next_page = asyncio.create_task(self.fetch(page + 1))
+                yield [self.parse(item) for item in content['items']]
+                if last:
+                    return
+                page += 1
+                if next_page is not None:
+                    content = await next_page
+                    next_page = None
+                else:
+                    content = await self.fetch(page)
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+    async def all(self, concurrency: int = CONCURRENCY) -> list[T]:
+        """
+        Get all objects of the list. The first page tells the total count,
+        the remaining pages are then requested concurrently and reassembled
+        in order.
+
+        :param concurrency: maximum number of concurrent requests
+        :type concurrency: int
+        :return: all objects
+        :rtype: list[T]
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def fetch(page: int) -> dict:
+            async with semaphore:
+                return await self.fetch(page)
+
+        first = await self.fetch(0)
+        items = [self.parse(item) for item in first['items']]
+        contents = await asyncio.gather(
+            *(fetch(page) for page in range(1, page_count(first, self.limit)))
+        )
+        for content in contents:
+            items.extend(self.parse(item) for item in content['items'])
+        return items
+
+    async def __aiter__(self) -> AsyncIterator[T]:
+        async for page in self.pages():
+            for item in page:
+                yield item
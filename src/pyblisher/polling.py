@@ -0,0 +1,100 @@
+import time
+from enum import IntEnum
+from typing import Optional
+
+# first interval between two status requests of a waiting job in seconds
+POLL_INTERVAL: float = 0.5
+# longest interval between two status requests in seconds
+MAX_POLL_INTERVAL: float = 15.0
+# factor, by which the interval grows, while the job does not change
+POLL_BACKOFF: float = 1.5
+
+
+class JobStatus(IntEnum):
+    """
+    Status of a job or an operation, as returned in `Job.status` and
+    `Operation.status`.
+    """
+
+    PENDING = 1
+    RUNNING = 2
+    FINISHED = 3
+    FAILED = 4
+    CANCELLED = 5
+    TIMED_OUT = 6
+
+
+# states, in which a job does not change anymore
+FINAL_STATUSES = frozenset(
+    {
+        JobStatus.FINISHED,
+        JobStatus.FAILED,
+        JobStatus.CANCELLED,
+        JobStatus.TIMED_OUT,
+    }
+)
+
+
+class Backoff:
+    """
+    Intervals between the status requests of waiting jobs. The interval
+    grows by `factor` up to `max_interval`, while the jobs do not change,
+    and starts again at `interval`, when they do, so short jobs are noticed
+    quickly and long jobs do not flood the API.
+
+    :param interval: first interval in seconds
+    :type interval: float
+    :param max_interval: longest interval in seconds
+    :type max_interval: float
+    :param timeout: seconds until `expired` is True, None for no timeout
+    :type timeout: Optional[float]
+    :param factor: growth of the interval
+    :type factor: float
+    """
+
+    def __init__(
+        self,
+        interval: float = POLL_INTERVAL,
+        max_interval: float = MAX_POLL_INTERVAL,
+        timeout: Optional[float] = None,
+        factor: float = POLL_BACKOFF,
+    ):
+        self.interval = interval
+        self.max_interval = max_interval
+        self.factor = factor
+        self.deadline = None if timeout is None else time.monotonic() + timeout
+        self.current = interval
+
+    @property
+    def expired(self) -> bool:
+        """
+        True, if the timeout has passed.
+        """
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    @property
+    def remaining(self) -> Optional[float]:
+        """
+        Seconds until the timeout, None if there is no timeout.
+        """
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def delay(self, changed: bool) -> float:
+        """
+        Get the seconds until the next status request. It is never longer
+        than the rest of the timeout.
+
+        :param changed: True, if a job changed since the last request
+        :type changed: bool
+        :return: seconds to wait
+        :rtype: float
+        """
+        if changed:
+            self.current = self.interval
+        delay = self.current
+        self.current = min(self.current * self.factor, self.max_interval)
+        if self.deadline is not None:
+            delay = max(0.0, min(delay, self.deadline - time.monotonic()))
+        return delay
@@ -0,0 +1,133 @@
+import random
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from httpx import Response, TransportError
+
+
+@dataclass
+class RetryPolicy:
+    """
+    This class describes when and how often the API clients repeat a failed
+    request. Between two attempts the client waits an exponentially growing
+    delay with full jitter, or the time the server asks for in its
+    `Retry-After` header.
+
+    :attr max_attempts: maximum number of attempts including the first one,
+        1 disables retries
+    :atype max_attempts: int
+    :attr methods: HTTP methods, which are retried. Only idempotent methods
+        by default, because a repeated POST could create a resource twice.
+    :atype methods: frozenset[str]
+    :attr status_codes: status codes of responses, which are retried
+    :atype status_codes: frozenset[int]
+    :attr backoff_factor: delay in seconds before the second attempt
+    :atype backoff_factor: float
+    :attr max_backoff: upper limit of a single delay in seconds
+    :atype max_backoff: float
+    :attr jitter: randomize the delays, so that many clients do not retry
+        at the same moment
+    :atype jitter: bool
+    """
+
+    max_attempts: int = 3
+    methods: frozenset[str] = field(
+        default_factory=lambda: frozenset(
+            {'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'}
+        )
+    )
+    status_codes: frozenset[int] = field(
+        default_factory=lambda: frozenset({429, 500, 502, 503, 504})
+    )
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    jitter: bool = True
+
+    def __post_init__(self):
+        """
+        Normalize collections from settings files, which are lists.
+        """
+        self.methods = frozenset(method.upper() for method in self.methods)
+        self.status_codes = frozenset(int(code) for code in self.status_codes)
+
+    def including(self, *methods: str) -> 'RetryPolicy':
+        """
+        Get a copy of the policy, which also retries the given methods, e.g.
+        for POST requests which are known to be idempotent.
+
+        :return: extended retry policy
+        :rtype: RetryPolicy
+        """
+        return replace(self, methods=self.methods | set(methods))
+
+    def should_retry(
+        self,
+        method: str,
+        attempt: int,
+        response: Optional[Response] = None,
+        error: Optional[Exception] = None,
+    ) -> bool:
+        """
+        Decide if a request is repeated.
+
+        :param method: HTTP method of the request
+        :type method: str
+        :param attempt: number of the attempt, which failed, starting with 1
+        :type attempt: int
+        :param response: response of the failed attempt
+        :type response: Optional[Response]
+        :param error: exception of the failed attempt
+        :type error: Optional[Exception]
+        :return: True, if the request should be repeated
+        :rtype: bool
+        """
+        if attempt >= self.max_attempts or method.upper() not in self.methods:
+            return False
+        if error is not None:
+            return isinstance(error, TransportError)
+        return response is not None and response.status_code in self.status_codes
+
+    def delay(self, attempt: int, response: Optional[Response] = None) -> float:
+        """
+        Get the time to wait before the next attempt.
+
+        :param attempt: number of the attempt, which failed, starting with 1
+        :type attempt: int
+        :param response: response of the failed attempt
+        :type response: Optional[Response]
+        :return: delay in seconds
+        :rtype: float
+        """
+        retry_after = parse_retry_after(response)
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff)
+        backoff = min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1))
+        if self.jitter:
+            return random.uniform(0, backoff)
+        return backoff
+
+
+def parse_retry_after(response: Optional[Response]) -> Optional[float]:
+    """
+    Read the `Retry-After` header of a response, which is either a number of
+    seconds or a HTTP date.
+
+    :param response: response of the failed attempt
+    :type response: Optional[Response]
+    :return: seconds to wait or None, if the header is missing or invalid
+    :rtype: Optional[float]
+    """
+    if response is None or 'retry-after' not in response.headers:
+        return None
+    value = response.headers['retry-after'].strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
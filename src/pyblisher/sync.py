@@ -0,0 +1,210 @@
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Optional
+
+# size of the blocks, which are read while hashing a file
+HASH_CHUNK_SIZE: int = 1024 * 1024
+# default number of delete requests, which are sent at the same time
+DELETE_WORKERS: int = 16
+
+
+def file_hash(path: str) -> str:
+    """
+    Compute the SHA-256 hash of a file.
+
+    :param path: local file path
+    :type path: str
+    :return: hex digest
+    :rtype: str
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb', buffering=0) as file:
+        while chunk := file.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class Manifest:
+    """
+    Record of the files, which were uploaded to a bucket, with their size,
+    modification time and content hash. It is stored as JSON file on disk.
+
+    The hash of a file is only computed again, if its size or modification
+    time differs from the record, so comparing an unchanged tree only needs
+    a `stat` per file.
+
+    :param path: path of the manifest file
+    :type path: str
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.entries: dict[str, dict] = {}
+        if os.path.exists(path):
+            with open(path, 'r') as file:
+                self.entries = json.load(file)
+
+    def changed(self, key: str, path: str) -> bool:
+        """
+        Check if a local file differs from its record. Records of files,
+        which were touched but have the same content, are updated.
+
+        :param key: object key
+        :type key: str
+        :param path: local file path
+        :type path: str
+        :return: True, if the file has to be uploaded
+        :rtype: bool
+        """
+        stat = os.stat(path)
+        entry = self.entries.get(key)
+        if entry is None:
+            return True
+        if entry['size'] == stat.st_size and entry['mtime'] == stat.st_mtime_ns:
+            return False
+        if entry['size'] != stat.st_size:
+            return True
+        content_hash = file_hash(path)
+        if content_hash != entry['hash']:
+            return True
+        entry['mtime'] = stat.st_mtime_ns
+        return False
+
+    def record(self, key: str, path: str) -> None:
+        """
+        Record an uploaded file.
+
+        :param key: object key
+        :type key: str
+        :param path: local file path
+        :type path: str
+        """
+        stat = os.stat(path)
+        self.entries[key] = {
+            'size': stat.st_size,
+            'mtime': stat.st_mtime_ns,
+            'hash': file_hash(path),
+        }
+
+    def forget(self, key: str) -> None:
+        """
+        Remove the record of a deleted object.
+        """
+        self.entries.pop(key, None)
+
+    def save(self) -> None:
+        """
+        Write the manifest to disk. The file is replaced atomically, so an
+        interrupted sync never leaves a broken manifest.
+        """
+        temporary = f'{self.path}.tmp'
+        with open(temporary, 'w') as file:
+            json.dump(self.entries, file, indent=1, sort_keys=True)
+        os.replace(temporary, self.path)
+
+
+@dataclass
+class SyncReport:
+    """
+    Result of the synchronisation of a local directory with a bucket.
+
+    :attr uploaded: keys of the uploaded objects
+    :atype uploaded: list[str]
+    :attr deleted: keys of the deleted objects
+    :atype deleted: list[str]
+    :attr unchanged: number of files, which were not uploaded
+    :atype unchanged: int
+    :attr failed: keys of the objects, which could not be uploaded or
+        deleted, with the error message
+    :atype failed: dict[str, str]
+    """
+
+    uploaded: list[str] = field(default_factory=list)
+    deleted: list[str] = field(default_factory=list)
+    unchanged: int = 0
+    failed: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """
+        True, if all changes were transferred.
+        """
+        return not self.failed
+
+
+@dataclass
+class DeleteReport:
+    """
+    Result of the deletion of many bucket objects.
+
+    :attr planned: keys of the objects, which were selected for deletion
+    :atype planned: list[str]
+    :attr deleted: keys of the deleted objects, empty for a dry run
+    :atype deleted: list[str]
+    :attr failed: keys of the objects, which could not be deleted, with the
+        error message
+    :atype failed: dict[str, str]
+    """
+
+    planned: list[str] = field(default_factory=list)
+    deleted: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """
+        True, if no deletion failed.
+        """
+        return not self.failed
+
+
+def default_manifest(directory: str, bucket: str, prefix: str = '') -> str:
+    """
+    Get the default path of the manifest of a directory, which lies next to
+    the directory, so it is not uploaded itself. The name contains a hash of
+    the bucket and the prefix, so syncs of the same directory to several
+    targets keep separate manifests.
+
+    :param directory: local directory
+    :type directory: str
+    :param bucket: endpoint or id of the data bucket
+    :type bucket: str
+    :param prefix: key of the target folder in the bucket
+    :type prefix: str
+    :return: path of the manifest file
+    :rtype: str
+    """
+    target = hashlib.sha256(f'{bucket}\n{prefix.strip("/")}'.encode()).hexdigest()
+    return (
+        os.path.abspath(directory).rstrip(os.sep)
+        + f'.{target[:12]}.pyblisher-manifest.json'
+    )
+
+
+def plan_uploads(
+    files: list[tuple[str, str]],
+    manifest: Manifest,
+    remote: Optional[set[str]],
+) -> list[tuple[str, str]]:
+    """
+    Select the local files, which have to be uploaded, because they changed
+    since the last sync or are missing in the bucket.
+
+    :param files: pairs of object key and local file path
+    :type files: list[tuple[str, str]]
+    :param manifest: records of the last sync
+    :type manifest: Manifest
+    :param remote: keys of the files in the bucket, None to trust the
+        manifest
+    :type remote: Optional[set[str]]
+    :return: pairs of object key and local file path
+    :rtype: list[tuple[str, str]]
+    """
+    return [
+        (key, path)
+        for key, path in files
+        if (remote is not None and key not in remote)
+        or manifest.changed(key, path)
+    ]
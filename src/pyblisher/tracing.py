@@ -0,0 +1,193 @@
+import contextvars
+import functools
+import inspect
+from importlib.util import find_spec
+from typing import Any, Callable, Optional, TypeVar
+
+from httpx import Response
+
+from .hooks import Hooks, RequestEvent
+from .metrics import endpoint_template
+from .Settings import settings
+
+# spans are created, if OpenTelemetry is installed and not disabled by the
+# `tracing` setting
+TRACING: bool = find_spec('opentelemetry') is not None and bool(
+    getattr(settings, 'tracing', True)
+)
+if TRACING:
+    from opentelemetry import propagate, trace
+    from opentelemetry.trace import SpanKind, StatusCode
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+# names of the resource classes in span attributes
+RESOURCES: dict[str, str] = {
+    'Project': 'project',
+    'Bucket': 'bucket',
+    'Source': 'datasource',
+    'Task': 'task',
+    'Job': 'job',
+    'Operation': 'operation',
+}
+
+
+def resource_attributes(resource: Any) -> dict[str, str]:
+    """
+    Get the span attributes, which identify a resource, e.g.
+    `pyblisher.bucket.id` and `pyblisher.project.id` of a bucket.
+
+    :param resource: instance of a resource class or any other value
+    :type resource: Any
+    :return: span attributes
+    :rtype: dict[str, str]
+    """
+    kind = RESOURCES.get(type(resource).__name__)
+    if kind is None:
+        return {}
+    attributes = {f'pyblisher.{kind}.id': resource._id}
+    if getattr(resource, 'projectId', None):
+        attributes['pyblisher.project.id'] = resource.projectId
+    return attributes
+
+
+def traced(
+    name: str, arguments: Optional[dict[str, str]] = None
+) -> Callable[[F], F]:
+    """
+    Decorator, which runs a resource operation in an OpenTelemetry span. The
+    requests of the operation become child spans. Without OpenTelemetry the
+    function is returned unchanged, so it costs nothing.
+
+    :param name: span name like `Project.create_task`
+    :type name: str
+    :param arguments: span attributes, which are taken from arguments of
+        the function, mapped to the parameter names
+    :type arguments: Optional[dict[str, str]]
+    :return: decorator
+    :rtype: Callable[[F], F]
+    """
+
+    def decorate(function: F) -> F:
+        if not TRACING:
+            return function
+        signature = inspect.signature(function)
+
+        def attributes(args: tuple, kwargs: dict) -> dict[str, Any]:
+            result: dict[str, Any] = resource_attributes(args[0]) if args else {}
+            if arguments:
+                bound = signature.bind_partial(*args, **kwargs).arguments
+                for attribute, parameter in arguments.items():
+                    value = bound.get(parameter)
+                    if isinstance(value, (str, bool, int, float)):
+                        result[attribute] = value
+            return result
+
+        if inspect.iscoroutinefunction(function):
+
+            @functools.wraps(function)
+            async def awrapper(*args, **kwargs):
+                with tracer().start_as_current_span(
+                    name, attributes=attributes(args, kwargs)
+                ):
+                    return await function(*args, **kwargs)
+
+            return awrapper  # type: ignore[return-value]
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with tracer().start_as_current_span(
+                name, attributes=attributes(args, kwargs)
+            ):
+                return function(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+def annotate(attributes: dict[str, Any]) -> None:
+    """
+    Add attributes to the current span, e.g. the size of an upload. Does
+    nothing without OpenTelemetry.
+
+    :param attributes: span attributes
+    :type attributes: dict[str, Any]
+    """
+    if TRACING:
+        trace.get_current_span().set_attributes(attributes)
+
+
+def propagated(function: F) -> F:
+    """
+    Let a function, which runs in a thread pool, see the current span, so the
+    requests it sends become child spans of the operation.
+
+    :param function: function, which is passed to an executor
+    :type function: F
+    :return: function, which runs in a copy of the current context
+    :rtype: F
+    """
+    if not TRACING:
+        return function
+    context = contextvars.copy_context()
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        return context.copy().run(function, *args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
+
+def tracer():
+    """
+    Get the OpenTelemetry tracer of pyblisher.
+    """
+    return trace.get_tracer('pyblisher')
+
+
+def attach(hooks: Hooks) -> None:
+    """
+    Register callbacks, which wrap every request attempt of a client in a
+    client span and propagate its context in the request headers, so the
+    spans of the VC Publisher continue the trace.
+
+    :param hooks: hooks of an API client
+    :type hooks: Hooks
+    """
+    if not TRACING:
+        return
+
+    def request(event: RequestEvent) -> None:
+        url = event.request.url
+        span = tracer().start_span(
+            f'{event.method} {endpoint_template(event.endpoint)}',
+            kind=SpanKind.CLIENT,
+            attributes={
+                'http.request.method': event.method,
+                'url.full': str(url),
+                'server.address': url.host,
+                'http.request.resend_count': event.attempt - 1,
+            },
+        )
+        propagate.inject(
+            event.request.headers, context=trace.set_span_in_context(span)
+        )
+        event.context['span'] = span
+
+    def response(event: RequestEvent, response: Response) -> None:
+        span = event.context.pop('span')
+        span.set_attribute('http.response.status_code', response.status_code)
+        if response.status_code >= 400:
+            span.set_status(StatusCode.ERROR)
+        span.end()
+
+    def error(event: RequestEvent, error: Exception) -> None:
+        span = event.context.pop('span')
+        span.record_exception(error)
+        span.set_status(StatusCode.ERROR, type(error).__name__)
+        span.end()
+
+    hooks.on_request(request)
+    hooks.on_response(response)
+    hooks.on_error(error)
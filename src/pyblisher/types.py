@@ -1,10 +1,31 @@
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
 from dataclasses import dataclass
 from typing import Any, Literal, Optional, Protocol
 
 from httpx import Response
 
+from .hooks import Hooks
+from .retry import RetryPolicy
+
 
 class ApiClientProtocol(Protocol):
+    retry: RetryPolicy
+    hooks: Hooks
+
+    def request(
+        self,
+        method: str,
+        endpoint: str,
+        retry: Optional[RetryPolicy] = None,
+        stream: bool = False,
+        cache: bool = True,
+        **kwargs,
+    ) -> Response:
+        """
+        Make a request with any method to the VC Publisher API.
+        """
+        ...
+
     def get(
         self,
         endpoint: str,
@@ -60,16 +81,91 @@ class ApiClientProtocol(Protocol):
 
     def stream(
         self,
+        method: str,
         endpoint: str,
-        params: Optional[dict] = None,
-    ) -> Any:
+        retry: Optional[RetryPolicy] = None,
+        **kwargs,
+    ) -> AbstractContextManager[Response]:
         """
         Make a streaming request to the VC Publisher API.
+        """
+        ...
+
+
+class AsyncApiClientProtocol(Protocol):
+    retry: RetryPolicy
+    hooks: Hooks
+
+    async def request(
+        self,
+        method: str,
+        endpoint: str,
+        retry: Optional[RetryPolicy] = None,
+        stream: bool = False,
+        cache: bool = True,
+        **kwargs,
+    ) -> Response:
+        """
+        Make an asynchronous request with any method to the VC Publisher API.
+        """
+        ...
 
-        :param endpoint: API endpoint
-        :type endpoint: str
-        :param params: query parameters
-        :type params: Optional[dict]
+    async def get(
+        self,
+        endpoint: str,
+        params: Optional[dict] = None,
+    ) -> Response:
+        """
+        Make an asynchronous GET Request to the VC Publisher API.
+        """
+        ...
+
+    async def post(
+        self,
+        endpoint: str,
+        data: Optional[dict] = None,
+        json: Optional[dict] = None,
+        params: Optional[dict] = None,
+        files: Optional[Any] = None,
+    ) -> Response:
+        """
+        Make an asynchronous POST Request to the VC Publisher API.
+        """
+        ...
+
+    async def delete(
+        self,
+        endpoint: str,
+        headers: Optional[dict] = None,
+        params: Optional[dict] = None,
+    ) -> Response:
+        """
+        Make an asynchronous DELETE Request to the VC Publisher API.
+        """
+        ...
+
+    async def put(
+        self,
+        endpoint: str,
+        data: Optional[dict] = None,
+        json: Optional[dict] = None,
+        params: Optional[dict] = None,
+        files: Optional[Any] = None,
+    ) -> Response:
+        """
+        Make an asynchronous PUT Request to the VC Publisher API.
+        """
+        ...
+
+    def stream(
+        self,
+        method: str,
+        endpoint: str,
+        retry: Optional[RetryPolicy] = None,
+        **kwargs,
+    ) -> AbstractAsyncContextManager[Response]:
+        """
+        Make an asynchronous streaming request to the VC Publisher API.
         """
         ...
 
@@ -140,3 +236,28 @@ class Schedule:
 
     def to_dict(self) -> dict:
         return self.__dict__
+
+
+@dataclass
+class BucketObject:
+    """
+    BucketObject is a dataclass that represents an entry of the object list
+    of a data bucket, which is either a file or a folder.
+
+    :attr key: key of the object as returned by the API
+    :attr type: Literal['file', 'directory']
+    """
+
+    key: str
+    type: Literal['file', 'directory']
+
+    @property
+    def path(self) -> str:
+        """
+        Key without leading and trailing slashes, e.g. `city/tiles/0.b3dm`.
+        """
+        return self.key.strip('/')
+
+    @property
+    def is_dir(self) -> bool:
+        return self.type == 'directory'
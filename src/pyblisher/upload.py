@@ -0,0 +1,278 @@
+import asyncio
+import os
+import posixpath
+import threading
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable, Iterator, Optional
+from uuid import uuid4
+
+# default size of the blocks, which are read from a file while uploading
+UPLOAD_CHUNK_SIZE: int = 1024 * 1024
+# default limits for bundling small files into one upload request
+BATCH_FILES: int = 64
+BATCH_BYTES: int = 8 * 1024 * 1024
+# default number of upload requests, which are sent at the same time
+UPLOAD_WORKERS: int = 8
+
+# receives the number of bytes sent since the last call
+Progress = Callable[[int], None]
+
+
+def quote(value: str) -> str:
+    """
+    Escape a name or file name for a multipart header.
+    """
+    return value.replace('\\', '\\\\').replace('"', '%22')
+
+
+@dataclass
+class UploadReport:
+    """
+    Result of the upload of many files.
+
+    :attr uploaded: keys of the uploaded objects
+    :atype uploaded: list[str]
+    :attr failed: keys of the objects, which could not be uploaded, with the
+        error message
+    :atype failed: dict[str, str]
+    :attr size: number of uploaded bytes
+    :atype size: int
+    """
+
+    uploaded: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+    size: int = 0
+    # the results of concurrent requests are added from several threads
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    @property
+    def ok(self) -> bool:
+        """
+        True, if all files were uploaded.
+        """
+        return not self.failed
+
+    def add(
+        self, batch: list[tuple[str, str]], error: Optional[str], size: int = 0
+    ) -> None:
+        """
+        Record the result of an upload request. It is safe to call from
+        several threads.
+
+        :param batch: pairs of object key and local file path
+        :type batch: list[tuple[str, str]]
+        :param error: error message, if the request failed
+        :type error: Optional[str]
+        :param size: bytes of the files of the batch, which were measured
+            before the upload
+        :type size: int
+        """
+        with self._lock:
+            for key, _ in batch:
+                if error is None:
+                    self.uploaded.append(key)
+                else:
+                    self.failed[key] = error
+            if error is None:
+                self.size += size
+
+
+def batch_size(batch: list[tuple[str, str]]) -> int:
+    """
+    Get the size of the files of a batch.
+
+    :param batch: pairs of object key and local file path
+    :type batch: list[tuple[str, str]]
+    :return: size in bytes
+    :rtype: int
+    """
+    return sum(os.path.getsize(path) for _, path in batch)
+
+
+def walk_tree(directory: str, prefix: str = '') -> list[tuple[str, str]]:
+    """
+    List the files of a directory tree with their object keys. The key of a
+    file is its path relative to the directory, with `/` as separator,
+    below the prefix.
+
+    :param directory: local directory
+    :type directory: str
+    :param prefix: key of the target folder in the bucket
+    :type prefix: str
+    :return: pairs of object key and local file path
+    :rtype: list[tuple[str, str]]
+    """
+    files = []
+    for root, _, names in os.walk(directory):
+        for name in sorted(names):
+            path = os.path.join(root, name)
+            relative = os.path.relpath(path, directory).replace(os.sep, '/')
+            files.append((posixpath.join(prefix.strip('/'), relative), path))
+    return files
+
+
+def plan_batches(
+    files: list[tuple[str, str]],
+    max_files: int = BATCH_FILES,
+    max_bytes: int = BATCH_BYTES,
+) -> list[list[tuple[str, str]]]:
+    """
+    Bundle small files into batches, which are uploaded with one request
+    each. A file larger than `max_bytes` gets a batch of its own.
+
+    :param files: pairs of object key and local file path
+    :type files: list[tuple[str, str]]
+    :param max_files: maximum number of files per batch
+    :type max_files: int
+    :param max_bytes: maximum size of a batch in bytes
+    :type max_bytes: int
+    :return: batches of pairs of object key and local file path
+    :rtype: list[list[tuple[str, str]]]
+    """
+    batches: list[list[tuple[str, str]]] = []
+    batch: list[tuple[str, str]] = []
+    size = 0
+    for key, path in files:
+        file_size = os.path.getsize(path)
+        if file_size >= max_bytes:
+            batches.append([(key, path)])
+            continue
+        if batch and (len(batch) >= max_files or size + file_size > max_bytes):
+            batches.append(batch)
+            batch, size = [], 0
+        batch.append((key, path))
+        size += file_size
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+class MultipartBody:
+    """
+    Streamed `multipart/form-data` body with one part per file, as expected by
+    the upload endpoint of data buckets. The field name of each part is the
+    object key. Use `SyncMultipartBody` or `AsyncMultipartBody` to send it.
+
+    The files are read in large blocks while the body is sent, so memory
+    usage does not depend on the file size. The body can be iterated again,
+    which lets the client repeat a failed upload or a request rejected
+    because of an expired token.
+
+    :param files: pairs of object key and local file path
+    :type files: list[tuple[str, str]]
+    :param chunk_size: size of the blocks read from the files
+    :type chunk_size: int
+    :param progress: function, which receives the number of bytes sent since
+        its last call. If the upload is repeated, the bytes of the failed
+        attempt are reported as negative number first.
+    :type progress: Optional[Progress]
+    """
+
+    def __init__(
+        self,
+        files: list[tuple[str, str]],
+        chunk_size: int = UPLOAD_CHUNK_SIZE,
+        progress: Optional[Progress] = None,
+    ):
+        self.files = files
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self.boundary = uuid4().hex
+        self.sent = 0
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """
+        Request headers describing the body.
+        """
+        return {
+            'Content-Type': f'multipart/form-data; boundary={self.boundary}',
+            'Content-Length': str(len(self)),
+        }
+
+    def part_header(self, key: str, path: str) -> bytes:
+        """
+        Header of the part of a file.
+        """
+        return (
+            f'--{self.boundary}\r\n'
+            f'Content-Disposition: form-data; name="{quote(key)}"; '
+            f'filename="{quote(os.path.basename(path))}"\r\n'
+            'Content-Type: application/octet-stream\r\n\r\n'
+        ).encode()
+
+    @property
+    def end(self) -> bytes:
+        """
+        Closing boundary of the body.
+        """
+        return f'--{self.boundary}--\r\n'.encode()
+
+    def __len__(self) -> int:
+        return (
+            sum(
+                len(self.part_header(key, path)) + os.path.getsize(path) + 2
+                for key, path in self.files
+            )
+            + len(self.end)
+        )
+
+    def restart(self) -> None:
+        """
+        Reset the progress, when the body is sent again.
+        """
+        if self.sent and self.progress:
+            self.progress(-self.sent)
+        self.sent = 0
+
+    def report(self, size: int) -> None:
+        """
+        Report sent bytes to the progress function.
+        """
+        self.sent += size
+        if self.progress:
+            self.progress(size)
+
+
+class SyncMultipartBody(MultipartBody):
+    """
+    Streamed `multipart/form-data` body for the synchronous client. See
+    `MultipartBody` for the parameters.
+    """
+
+    def __iter__(self) -> Iterator[bytes]:
+        self.restart()
+        for key, path in self.files:
+            yield self.part_header(key, path)
+            with open(path, 'rb', buffering=0) as file:
+                while chunk := file.read(self.chunk_size):
+                    yield chunk
+                    self.report(len(chunk))
+            yield b'\r\n'
+        yield self.end
+
+
+class AsyncMultipartBody(MultipartBody):
+    """
+    Streamed `multipart/form-data` body for the asynchronous client. The
+    blocks of the files are read in a worker thread, so the event loop is not
+    blocked by disk access. See `MultipartBody` for the parameters.
+    """
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        self.restart()
+        for key, path in self.files:
+            yield self.part_header(key, path)
+            file = await asyncio.to_thread(open, path, 'rb', buffering=0)
+            try:
+                while chunk := await asyncio.to_thread(
+                    file.read, self.chunk_size
+                ):
+                    yield chunk
+                    self.report(len(chunk))
+            finally:
+                file.close()
+            yield b'\r\n'
+        yield self.end
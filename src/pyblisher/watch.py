@@ -0,0 +1,321 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Callable, Iterable, Iterator, Optional
+
+from .Job import Job, aget_job_data, get_job_data
+from .pagination import PAGE_SIZE, AsyncPaginator, Paginator
+from .polling import (
+    FINAL_STATUSES,
+    MAX_POLL_INTERVAL,
+    POLL_INTERVAL,
+    Backoff,
+    JobStatus,
+)
+from .Project import Project
+
+# allowed difference between the clocks of the client and the server. Jobs,
+# which ended this long before the last poll, are listed again.
+CLOCK_MARGIN: timedelta = timedelta(seconds=60)
+
+
+@dataclass
+class JobChange:
+    """
+    Change of the status or the stage of a watched job.
+
+    :attr job: job in its new state
+    :atype job: Job
+    :attr previous: status before the change, None if the job was not
+        known before
+    :atype previous: Optional[int]
+    """
+
+    job: Job
+    previous: Optional[int]
+
+    @property
+    def done(self) -> bool:
+        """
+        True, if the job finished, failed, was cancelled or timed out.
+        """
+        return self.job.done
+
+
+ChangeHook = Callable[[JobChange], None]
+
+
+class JobWatcher:
+    """
+    Watches many jobs of a project, e.g. the jobs of hundreds of tasks,
+    which were created at once. Each poll requests the job list of the
+    project twice, once for the pending and running jobs and once for the
+    jobs, which ended since the last poll (`endTime` filter), so it costs a
+    request per page instead of a request per job. Only watched jobs, which
+    are in neither list, are requested one by one.
+
+    Example:
+        ```
+        watcher = JobWatcher(project, [task.lastJobId for task in tasks])
+        for change in watcher:
+            if change.done:
+                print(change.job._id, JobStatus(change.job.status).name)
+        ```
+
+    or asynchronously with `async for change in watcher`, or with callbacks
+    and `watcher.run()`.
+
+    :param project: project of the jobs
+    :type project: Project
+    :param jobs: jobs or job ids to watch
+    :type jobs: Iterable[Job | str]
+    :param filters: additional query parameters of the job lists, e.g.
+        `jobType` or `startTime` with an operator like `gte:<date>`, which
+        make the lists shorter
+    :type filters: Optional[dict]
+    :param interval: first interval between polls in seconds
+    :type interval: float
+    :param max_interval: longest interval between polls in seconds
+    :type max_interval: float
+    :param limit: page size of the job lists (1 - 1000)
+    :type limit: int
+    :param on_change: function, which is called with every change
+    :type on_change: Optional[ChangeHook]
+    :param on_done: function, which is called, when a job is done
+    :type on_done: Optional[ChangeHook]
+    """
+
+    def __init__(
+        self,
+        project: Project,
+        jobs: Iterable[Job | str],
+        filters: Optional[dict] = None,
+        interval: float = POLL_INTERVAL,
+        max_interval: float = MAX_POLL_INTERVAL,
+        limit: int = PAGE_SIZE,
+        on_change: Optional[ChangeHook] = None,
+        on_done: Optional[ChangeHook] = None,
+    ):
+        self.project = project
+        self.filters = filters or {}
+        self.interval = interval
+        self.max_interval = max_interval
+        self.limit = limit
+        self.on_change = on_change
+        self.on_done = on_done
+        # watched jobs by id, None until their first state is known
+        self.jobs: dict[str, Optional[Job]] = {}
+        for job in jobs:
+            self.add(job)
+        self._since = datetime.now(timezone.utc) - CLOCK_MARGIN
+
+    def add(self, job: Job | str) -> None:
+        """
+        Watch another job.
+
+        :param job: job or job id
+        :type job: Job | str
+        """
+        if isinstance(job, Job):
+            self.jobs[job._id] = job
+        else:
+            self.jobs.setdefault(job, None)
+
+    @property
+    def pending(self) -> set[str]:
+        """
+        Ids of the watched jobs, which are not done.
+        """
+        return {id for id, job in self.jobs.items() if job is None or not job.done}
+
+    ############## Polling ##############
+    def poll(self) -> list[JobChange]:
+        """
+        Request the states of the pending jobs once and call the callbacks.
+
+        :return: changes since the last poll
+        :rtype: list[JobChange]
+        """
+        started = datetime.now(timezone.utc)
+        pending = self.pending
+        found: dict[str, dict] = {}
+        for params in self._queries():
+            for data in Paginator(
+                api=self.project._api,
+                endpoint=self.project._endpoint + 'jobs/',
+                parse=lambda data: data,
+                params=params,
+                limit=self.limit,
+                action='get jobs',
+                cache=False,
+            ):
+                if data['_id'] in pending:
+                    found[data['_id']] = data
+                    if len(found) == len(pending):
+                        break
+            if len(found) == len(pending):
+                break
+        for id in pending - found.keys():
+            found[id] = self._get(id)
+        self._since = started - CLOCK_MARGIN
+        return self._apply(found)
+
+    async def apoll(self) -> list[JobChange]:
+        """
+        Request the states of the pending jobs once asynchronously. The job
+        lists are requested concurrently. See `poll`.
+        """
+        started = datetime.now(timezone.utc)
+        pending = self.pending
+
+        async def listing(params: dict) -> list[dict]:
+            paginator = AsyncPaginator(
+                api=self.project._aapi,
+                endpoint=self.project._endpoint + 'jobs/',
+                parse=lambda data: data,
+                params=params,
+                limit=self.limit,
+                action='get jobs',
+                cache=False,
+            )
+            return [data async for data in paginator if data['_id'] in pending]
+
+        found = {
+            data['_id']: data
+            for items in await asyncio.gather(*map(listing, self._queries()))
+            for data in items
+        }
+        missing = pending - found.keys()
+        for data in await asyncio.gather(*map(self._aget, missing)):
+            found[data['_id']] = data
+        self._since = started - CLOCK_MARGIN
+        return self._apply(found)
+
+    def _get(self, id: str) -> dict:
+        """
+        Request a single job, which is in none of the job lists.
+        """
+        return get_job_data(self.project._api, self.project._id, id)
+
+    async def _aget(self, id: str) -> dict:
+        """
+        Request a single job asynchronously, see `_get`.
+        """
+        return await aget_job_data(self.project._aapi, self.project._id, id)
+
+    def _queries(self) -> list[dict]:
+        """
+        Query parameters of the job lists of a poll.
+        """
+        since = self._since.isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+        return [
+            {
+                **self.filters,
+                'status': [int(JobStatus.PENDING), int(JobStatus.RUNNING)],
+            },
+            {
+                **self.filters,
+                'status': sorted(int(status) for status in FINAL_STATUSES),
+                'endTime': f'gte:{since}',
+            },
+        ]
+
+    def _apply(self, found: dict[str, dict]) -> list[JobChange]:
+        """
+        Update the watched jobs and call the callbacks.
+
+        :param found: jobs of the API by id
+        :type found: dict[str, dict]
+        :return: changes
+        :rtype: list[JobChange]
+        """
+        changes = []
+        for id, data in found.items():
+            job = self.jobs.get(id)
+            if job is None:
+                job = self.jobs[id] = self.project._job(data)
+                change = JobChange(job, None)
+            else:
+                previous, state = job.status, job._state()
+                if job._update(data)._state() == state:
+                    continue
+                change = JobChange(job, previous)
+            changes.append(change)
+            if self.on_change:
+                self.on_change(change)
+            if self.on_done and job.done:
+                self.on_done(change)
+        return changes
+
+    ############## Waiting ##############
+    def changes(self, timeout: Optional[float] = None) -> Iterator[JobChange]:
+        """
+        Poll until all jobs are done and yield the changes. The interval
+        between polls grows, while nothing changes.
+
+        :param timeout: seconds until a `TimeoutError` is raised, None to
+            wait without limit
+        :type timeout: Optional[float]
+        :return: iterator over the changes
+        :rtype: Iterator[JobChange]
+        """
+        backoff = Backoff(self.interval, self.max_interval, timeout)
+        while True:
+            changes = self.poll()
+            yield from changes
+            if not self.pending:
+                return
+            if backoff.expired:
+                raise TimeoutError(
+                    f'{len(self.pending)} job(s) not done after {timeout} seconds'
+                )
+            time.sleep(backoff.delay(bool(changes)))
+
+    async def achanges(
+        self, timeout: Optional[float] = None
+    ) -> AsyncIterator[JobChange]:
+        """
+        Poll asynchronously until all jobs are done and yield the changes.
+        See `changes`.
+        """
+        backoff = Backoff(self.interval, self.max_interval, timeout)
+        while True:
+            changes = await self.apoll()
+            for change in changes:
+                yield change
+            if not self.pending:
+                return
+            if backoff.expired:
+                raise TimeoutError(
+                    f'{len(self.pending)} job(s) not done after {timeout} seconds'
+                )
+            await asyncio.sleep(backoff.delay(bool(changes)))
+
+    def run(self, timeout: Optional[float] = None) -> list[Job]:
+        """
+        Poll until all jobs are done, calling the callbacks.
+
+        :param timeout: seconds until a `TimeoutError` is raised
+        :type timeout: Optional[float]
+        :return: the jobs in their final states
+        :rtype: list[Job]
+        """
+        for _ in self.changes(timeout):
+            pass
+        return list(self.jobs.values())  # type: ignore[arg-type]
+
+    async def arun(self, timeout: Optional[float] = None) -> list[Job]:
+        """
+        Poll asynchronously until all jobs are done, calling the callbacks.
+        See `run`.
+        """
+        async for _ in self.achanges(timeout):
+            pass
+        return list(self.jobs.values())  # type: ignore[arg-type]
+
+    def __iter__(self) -> Iterator[JobChange]:
+        return self.changes()
+
+    def __aiter__(self) -> AsyncIterator[JobChange]:
+        return self.achanges()